@@ -0,0 +1,39 @@
+"""Vectorized functions from a single element up to 10^7 elements."""
+
+from netto.batch import calc_netto_batch
+from netto.main import calc_inverse_netto_array, calc_netto_array
+
+from .common import BATCH_SIZES, salaries
+
+
+class NettoArray:
+    params = [BATCH_SIZES]
+    param_names = ["size"]
+    # A single 10^7-element inverse takes about a minute
+    timeout = 900
+    number = 1
+    repeat = (1, 5, 60.0)
+    warmup_time = 0
+
+    def setup(self, size):
+        self.salaries = salaries(size)
+        self.netto = calc_netto_array(self.salaries)
+        calc_inverse_netto_array(self.netto[:1], method="grid")
+        # Mixed configurations for the batch dispatcher
+        self.years = 2018 + self.salaries.astype(int) % 9
+        self.is_married = self.salaries.astype(int) % 2 == 0
+
+    def time_calc_netto_array(self, size):
+        calc_netto_array(self.salaries)
+
+    def time_calc_inverse_netto_array(self, size):
+        calc_inverse_netto_array(self.netto)
+
+    def time_calc_inverse_netto_array_grid(self, size):
+        calc_inverse_netto_array(self.netto, method="grid")
+
+    def time_calc_netto_batch_mixed(self, size):
+        calc_netto_batch(self.salaries, year=self.years, is_married=self.is_married)
+
+    def peakmem_calc_netto_array(self, size):
+        calc_netto_array(self.salaries)
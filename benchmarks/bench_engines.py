@@ -0,0 +1,84 @@
+"""Closed-form engines compared with their numerical integration references."""
+
+from netto.config import TaxConfig
+from netto.social_security import (
+    calc_social_security,
+    calc_social_security_analytic,
+    calc_social_security_by_integration,
+)
+from netto.taxes_income import (
+    calc_income_tax,
+    calc_income_tax_analytic,
+    calc_income_tax_by_integration,
+    get_tax_curve,
+)
+
+from .common import MARRIED, YEARS, require_scipy
+
+
+class IncomeTax:
+    params = [YEARS, MARRIED]
+    param_names = ["year", "is_married"]
+
+    def setup(self, year, is_married):
+        if not get_tax_curve(year).consts[3]:
+            # The published formula constants are missing for this year
+            raise NotImplementedError(f"no tax formula constants for {year}")
+        self.config = TaxConfig(year=year, is_married=is_married)
+        calc_income_tax(40000, self.config)
+
+    def time_calc_income_tax(self, year, is_married):
+        calc_income_tax(40000, self.config)
+
+
+class IncomeTaxAnalytic:
+    params = [YEARS, MARRIED]
+    param_names = ["year", "is_married"]
+
+    def setup(self, year, is_married):
+        self.config = TaxConfig(year=year, is_married=is_married)
+        calc_income_tax_analytic(40000, self.config)
+
+    def time_calc_income_tax_analytic(self, year, is_married):
+        calc_income_tax_analytic(40000, self.config)
+
+
+class IncomeTaxByIntegration:
+    params = [YEARS, MARRIED]
+    param_names = ["year", "is_married"]
+
+    def setup(self, year, is_married):
+        require_scipy()
+        self.config = TaxConfig(year=year, is_married=is_married)
+        calc_income_tax_by_integration(40000, self.config)
+
+    def time_calc_income_tax_by_integration(self, year, is_married):
+        calc_income_tax_by_integration(40000, self.config)
+
+
+class SocialSecurity:
+    params = [YEARS]
+    param_names = ["year"]
+
+    def setup(self, year):
+        self.config = TaxConfig(year=year)
+        calc_social_security(50000, self.config)
+
+    def time_calc_social_security(self, year):
+        calc_social_security(50000, self.config)
+
+    def time_calc_social_security_analytic(self, year):
+        calc_social_security_analytic(50000, self.config)
+
+
+class SocialSecurityByIntegration:
+    params = [YEARS]
+    param_names = ["year"]
+
+    def setup(self, year):
+        require_scipy()
+        self.config = TaxConfig(year=year)
+        calc_social_security_by_integration(50000, self.config)
+
+    def time_calc_social_security_by_integration(self, year):
+        calc_social_security_by_integration(50000, self.config)
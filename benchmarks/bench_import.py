@@ -0,0 +1,36 @@
+"""Cold start: import time and resident memory of a fresh interpreter."""
+
+import subprocess
+import sys
+
+
+def timeraw_import_netto():
+    return "import netto"
+
+
+def timeraw_import_and_first_calc_netto():
+    return "import netto; netto.calc_netto(50000)"
+
+
+__RSS_CODE = """
+import netto
+try:
+    # Peak RSS of this process only; ru_maxrss would include the memory the
+    # parent had when it forked
+    with open("/proc/self/status") as f:
+        status = dict(line.split(":", 1) for line in f)
+    print(int(status["VmHWM"].split()[0]) * 1024)
+except OSError:
+    import resource
+    print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)  # bytes on macOS
+"""
+
+
+def track_import_rss():
+    output = subprocess.run(
+        [sys.executable, "-c", __RSS_CODE], capture_output=True, text=True, check=True
+    ).stdout
+    return int(output) / 2**20
+
+
+track_import_rss.unit = "MB"
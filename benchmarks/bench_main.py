@@ -0,0 +1,32 @@
+"""Benchmarks of the main entry points, per year and marital status."""
+
+from netto.config import TaxConfig
+from netto.main import calc_inverse_netto, calc_netto, calc_netto_detailed
+
+from .common import MARRIED, YEARS
+
+
+class CalcNetto:
+    params = [YEARS, MARRIED]
+    param_names = ["year", "is_married"]
+
+    def setup(self, year, is_married):
+        self.config = TaxConfig(year=year, is_married=is_married)
+        # Parameter tables and grids are built once per process, not per call
+        calc_netto(50000, config=self.config)
+        calc_inverse_netto(35000, config=self.config, method="grid")
+
+    def time_calc_netto(self, year, is_married):
+        calc_netto(50000, config=self.config)
+
+    def time_calc_netto_detailed(self, year, is_married):
+        calc_netto_detailed(50000, config=self.config)
+
+    def time_calc_inverse_netto(self, year, is_married):
+        calc_inverse_netto(35000, config=self.config)
+
+    def time_calc_inverse_netto_analytic(self, year, is_married):
+        calc_inverse_netto(35000, config=self.config, method="analytic")
+
+    def time_calc_inverse_netto_grid(self, year, is_married):
+        calc_inverse_netto(35000, config=self.config, method="grid")
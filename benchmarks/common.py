@@ -0,0 +1,20 @@
+"""Shared parameters of the benchmark suite."""
+
+import numpy as np
+
+YEARS = list(range(2018, 2027))
+MARRIED = [False, True]
+BATCH_SIZES = [1, 100, 10_000, 1_000_000, 10_000_000]
+
+
+def salaries(size: int) -> np.ndarray:
+    """Reproducible yearly gross salaries between 0 and 250,000 euros."""
+    return np.random.default_rng(0).uniform(0, 250_000, size).round(2)
+
+
+def require_scipy() -> None:
+    """Skip the calling benchmark (asv convention) if scipy is missing."""
+    try:
+        import scipy.integrate  # noqa: F401
+    except ImportError as error:
+        raise NotImplementedError("scipy is not installed") from error
@@ -0,0 +1,459 @@
+"""
+Differential accuracy and throughput harness for the calculation engines.
+
+Every quantity that can be computed in more than one way is evaluated by all
+of its engines on a dense grid, for every year and for each combination of
+the config values it depends on (`FIELD_VALUES`). Each engine is compared
+with a reference engine: the closed forms for income tax and social
+security, `calc_netto` for net income and the analytic inverse for the
+inverse. The analytic inverse returns the smallest sufficient gross, while
+the default newton method rounds its root to the nearest euro, so the two
+can differ by a few euros.
+
+The report gives the largest deviation in cents, the input and config where
+it occurs, the number of grid points that differ by a cent or more, the
+points where the engine raised, and the throughput.
+
+Usage::
+
+    python -m benchmarks.differential
+    python -m benchmarks.differential --step 10 --quantity income_tax
+    python -m benchmarks.differential --json differential.json
+
+The integration engines need scipy and are skipped without it.
+"""
+
+import argparse
+import itertools
+import json
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, fields
+
+import numpy as np
+
+from netto.batch import calc_netto_batch
+from netto.calculator import Calculator
+from netto.config import TaxConfig
+from netto.main import (
+    calc_inverse_netto,
+    calc_inverse_netto_array,
+    calc_netto,
+    calc_netto_array,
+    calc_netto_detailed_array,
+)
+from netto.social_security import (
+    calc_social_security,
+    calc_social_security_analytic,
+    calc_social_security_array,
+    calc_social_security_by_integration,
+)
+from netto.taxes_income import (
+    calc_income_tax,
+    calc_income_tax_analytic,
+    calc_income_tax_analytic_array,
+    calc_income_tax_by_integration,
+)
+from netto.year_arrays import calc_income_tax_by_year
+
+from .common import YEARS
+
+# Values of each varied `TaxConfig` field besides the year
+FIELD_VALUES = {
+    "is_married": (False, True),
+    "has_children": (False, True),
+    "church_tax": (0.0, 0.09),
+    "extra_health_insurance": (0.014, 0.025),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Engine:
+    """
+    One way of computing a quantity.
+
+    Attributes
+    ----------
+    name : str
+        Label in the report
+    func : callable
+        ``func(values, config)`` returns the results for a float array
+    needs_scipy : bool
+        Whether the engine integrates with scipy
+    """
+
+    name: str
+    func: Callable[[np.ndarray, TaxConfig], np.ndarray]
+    needs_scipy: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class Quantity:
+    """
+    A quantity, the config fields it depends on and its engines.
+
+    Attributes
+    ----------
+    name : str
+        Label in the report
+    fields : tuple of str
+        `TaxConfig` fields varied over their `FIELD_VALUES`
+    reference : Engine
+        Engine the others are compared with
+    engines : tuple of Engine
+        Engines under test
+    """
+
+    name: str
+    fields: tuple[str, ...]
+    reference: Engine
+    engines: tuple[Engine, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    """
+    Result of one engine against its reference over all configs.
+
+    Attributes
+    ----------
+    quantity : str
+        Quantity name
+    engine : str
+        Engine name
+    reference : str
+        Reference engine name
+    points : int
+        Number of evaluated grid points over all configs
+    max_cents : float
+        Largest absolute deviation from the reference in cents
+    at_value : float or None
+        Input where the largest deviation occurs
+    at_config : dict or None
+        Config where the largest deviation occurs
+    mismatches : int
+        Points that deviate by one cent or more
+    failures : int
+        Points where the engine raised
+    per_second : float
+        Evaluations per second
+    """
+
+    quantity: str
+    engine: str
+    reference: str
+    points: int
+    max_cents: float
+    at_value: float | None
+    at_config: dict | None
+    mismatches: int
+    failures: int
+    per_second: float
+
+
+def _pointwise(func: Callable[[float, TaxConfig], float]) -> Callable:
+    """Lift a scalar function to arrays, with NaN where it raises."""
+
+    def evaluate(values: np.ndarray, config: TaxConfig) -> np.ndarray:
+        results = np.empty(values.size)
+        for index, value in enumerate(values.tolist()):
+            try:
+                results[index] = func(value, config)
+            except (ArithmeticError, LookupError, RuntimeError, ValueError):
+                results[index] = np.nan
+        return results
+
+    return evaluate
+
+
+def _calculator(config: TaxConfig, values: np.ndarray, inverse: bool = False):
+    calculator = Calculator(config)
+    method = calculator.inverse if inverse else calculator.netto
+    return _pointwise(lambda value, _: method(value))(values, config)
+
+
+QUANTITIES = (
+    Quantity(
+        name="income_tax",
+        fields=("is_married",),
+        reference=Engine(
+            "calc_income_tax_analytic", _pointwise(calc_income_tax_analytic)
+        ),
+        engines=(
+            Engine("calc_income_tax", _pointwise(calc_income_tax)),
+            Engine(
+                "calc_income_tax_by_integration",
+                _pointwise(calc_income_tax_by_integration),
+                needs_scipy=True,
+            ),
+            Engine("calc_income_tax_analytic_array", calc_income_tax_analytic_array),
+            Engine(
+                "calc_income_tax_by_year",
+                lambda values, config: calc_income_tax_by_year(
+                    values, config.year, config.is_married
+                ),
+            ),
+        ),
+    ),
+    Quantity(
+        name="social_security",
+        fields=("has_children", "extra_health_insurance"),
+        reference=Engine("calc_social_security", _pointwise(calc_social_security)),
+        engines=(
+            Engine(
+                "calc_social_security_by_integration",
+                _pointwise(calc_social_security_by_integration),
+                needs_scipy=True,
+            ),
+            Engine(
+                "calc_social_security_analytic",
+                _pointwise(calc_social_security_analytic),
+            ),
+            Engine(
+                "calc_social_security_analytic[array]", calc_social_security_analytic
+            ),
+            Engine("calc_social_security_array", calc_social_security_array),
+        ),
+    ),
+    Quantity(
+        name="netto",
+        fields=("is_married", "has_children", "church_tax", "extra_health_insurance"),
+        reference=Engine(
+            "calc_netto",
+            _pointwise(lambda salary, config: calc_netto(salary, config=config)),
+        ),
+        engines=(
+            Engine(
+                "calc_netto_array",
+                lambda values, config: calc_netto_array(values, config=config),
+            ),
+            Engine(
+                "calc_netto_detailed_array",
+                lambda values, config: calc_netto_detailed_array(values, config=config)[
+                    "net"
+                ],
+            ),
+            Engine(
+                "calc_netto_batch",
+                lambda values, config: calc_netto_batch(
+                    values,
+                    year=config.year,
+                    is_married=config.is_married,
+                    has_children=config.has_children,
+                    extra_health_insurance=config.extra_health_insurance,
+                    church_tax=config.church_tax,
+                ),
+            ),
+            Engine(
+                "Calculator.netto", lambda values, config: _calculator(config, values)
+            ),
+        ),
+    ),
+    Quantity(
+        name="inverse",
+        fields=("is_married", "church_tax", "extra_health_insurance"),
+        reference=Engine(
+            "calc_inverse_netto[analytic]",
+            _pointwise(
+                lambda net, config: calc_inverse_netto(
+                    net, config=config, method="analytic"
+                )
+            ),
+        ),
+        engines=(
+            Engine(
+                "calc_inverse_netto[newton]",
+                _pointwise(lambda net, config: calc_inverse_netto(net, config=config)),
+            ),
+            Engine(
+                "calc_inverse_netto_array",
+                lambda values, config: calc_inverse_netto_array(values, config=config),
+            ),
+            Engine(
+                "calc_inverse_netto[grid]",
+                _pointwise(
+                    lambda net, config: calc_inverse_netto(
+                        net, config=config, method="grid"
+                    )
+                ),
+            ),
+            Engine(
+                "calc_inverse_netto_array[grid]",
+                lambda values, config: calc_inverse_netto_array(
+                    values, config=config, method="grid"
+                ),
+            ),
+            Engine(
+                "Calculator.inverse",
+                lambda values, config: _calculator(config, values, inverse=True),
+            ),
+        ),
+    ),
+)
+
+
+def run(
+    grid: np.ndarray,
+    years: Sequence[int] = YEARS,
+    quantities: Sequence[str] | None = None,
+) -> list[Comparison]:
+    """
+    Compare all engines of the selected quantities on ``grid``.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        Inputs (taxable income, gross salary or desired net income)
+    years : sequence of int, optional
+        Tax years (default is every supported year)
+    quantities : sequence of str, optional
+        Names from `QUANTITIES` (default is all)
+
+    Returns
+    -------
+    list of Comparison
+        One entry per engine, references included with zero deviation
+    """
+    try:
+        import scipy.integrate  # noqa: F401
+
+        has_scipy = True
+    except ImportError:
+        has_scipy = False
+
+    comparisons = []
+    for quantity in QUANTITIES:
+        if quantities is not None and quantity.name not in quantities:
+            continue
+        reference = quantity.reference
+        engines = (reference,) + tuple(
+            engine for engine in quantity.engines if has_scipy or not engine.needs_scipy
+        )
+        tallies = {engine.name: _Tally() for engine in engines}
+
+        for year, *values in itertools.product(
+            years, *(FIELD_VALUES[name] for name in quantity.fields)
+        ):
+            config = TaxConfig(
+                year=year, **dict(zip(quantity.fields, values, strict=True))
+            )
+            results = {}
+            for engine in engines:
+                start = time.perf_counter()
+                results[engine.name] = np.asarray(
+                    engine.func(grid, config), dtype=float
+                )
+                tallies[engine.name].seconds += time.perf_counter() - start
+            for engine in engines:
+                tallies[engine.name].add(
+                    grid, results[engine.name], results[reference.name], config
+                )
+
+        comparisons += [
+            tallies[engine.name].comparison(quantity.name, engine.name, reference.name)
+            for engine in engines
+        ]
+    return comparisons
+
+
+class _Tally:
+    """Running deviation and timing totals of one engine."""
+
+    def __init__(self):
+        self.points = 0
+        self.max_cents = 0.0
+        self.at_value = None
+        self.at_config = None
+        self.mismatches = 0
+        self.failures = 0
+        self.seconds = 0.0
+
+    def add(self, grid, results, expected, config: TaxConfig) -> None:
+        self.points += grid.size
+        self.failures += int(np.count_nonzero(np.isnan(results)))
+        # Cents, rounded to remove binary noise below a thousandth of a cent
+        cents = np.round(np.abs(results - expected) * 100, 3)
+        cents[np.isnan(cents)] = -1
+        self.mismatches += int(np.count_nonzero(cents >= 1))
+        index = int(np.argmax(cents))
+        if cents[index] > self.max_cents:
+            self.max_cents = float(cents[index])
+            self.at_value = float(grid[index])
+            self.at_config = {
+                field.name: getattr(config, field.name) for field in fields(config)
+            }
+
+    def comparison(self, quantity: str, engine: str, reference: str) -> Comparison:
+        return Comparison(
+            quantity=quantity,
+            engine=engine,
+            reference=reference,
+            points=self.points,
+            max_cents=self.max_cents,
+            at_value=self.at_value,
+            at_config=self.at_config,
+            mismatches=self.mismatches,
+            failures=self.failures,
+            per_second=self.points / self.seconds if self.seconds else float("inf"),
+        )
+
+
+def format_report(comparisons: Sequence[Comparison]) -> str:
+    """Render comparisons as a plain-text table grouped by quantity."""
+    lines = []
+    for quantity, group in itertools.groupby(comparisons, lambda c: c.quantity):
+        group = list(group)
+        lines.append(f"{quantity} (reference: {group[0].reference})")
+        lines.append(
+            f"  {'engine':<38} {'max ct':>10} {'differ':>8} {'raised':>8}"
+            f" {'evals/s':>12}  worst case"
+        )
+        for c in group:
+            worst = ""
+            if c.at_config is not None:
+                worst = f"{c.at_value:.0f} @ " + ", ".join(
+                    f"{name}={value}" for name, value in c.at_config.items()
+                )
+            lines.append(
+                f"  {c.engine:<38} {c.max_cents:>10.2f} {c.mismatches:>8}"
+                f" {c.failures:>8} {c.per_second:>12,.0f}  {worst}"
+            )
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the harness from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.differential", description=__doc__.split("\n")[1]
+    )
+    parser.add_argument("--step", type=float, default=100.0, help="grid step in euros")
+    parser.add_argument("--max", type=float, default=300_000.0, help="grid end")
+    parser.add_argument("--years", type=int, nargs="+", default=YEARS)
+    parser.add_argument(
+        "--quantity",
+        action="append",
+        choices=[quantity.name for quantity in QUANTITIES],
+        help="quantity to compare, may be repeated (default is all)",
+    )
+    parser.add_argument("--json", help="also write the comparisons to this file")
+    args = parser.parse_args(argv)
+
+    grid = np.arange(0.0, args.max + args.step, args.step)
+    comparisons = run(grid, args.years, args.quantity)
+    print(format_report(comparisons))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "grid": {"step": args.step, "max": args.max},
+                    "years": args.years,
+                    "comparisons": [asdict(c) for c in comparisons],
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
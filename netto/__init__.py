@@ -1,5 +1,16 @@
-from netto.config import TaxConfig
-from netto.main import calc_inverse_netto, calc_netto
+from netto.batch import calc_inverse_netto_batch, calc_netto_batch
+from netto.calculator import Calculator
+from netto.config import DEFAULT_CONFIG, FrozenTaxConfig, TaxConfig, intern_config
+from netto.instrumentation import instrument, stats
+from netto.main import (
+    NettoResult,
+    calc_inverse_netto,
+    calc_inverse_netto_array,
+    calc_netto,
+    calc_netto_array,
+    calc_netto_detailed,
+)
+from netto.parameters import TaxParameters, get_parameters
 from netto.social_security import (
     calc_deductible_social_security,
     calc_insurance_health,
@@ -7,6 +18,7 @@ from netto.social_security import (
     calc_insurance_pension,
     calc_insurance_unemployment,
     calc_social_security,
+    calc_social_security_analytic,
     calc_social_security_by_integration,
     get_rate_health,
     get_rate_nursing,
@@ -15,22 +27,40 @@ from netto.social_security import (
 )
 from netto.taxes_income import (
     calc_income_tax,
+    calc_income_tax_analytic,
     calc_income_tax_by_integration,
     calc_taxable_income,
     get_marginal_tax_rate,
+    get_tax_curve,
 )
 from netto.taxes_other import calc_church_tax, calc_soli
 
 __all__ = [
     # Main API
     "calc_netto",
+    "calc_netto_array",
+    "calc_netto_detailed",
+    "NettoResult",
     "calc_inverse_netto",
+    "calc_inverse_netto_array",
+    "calc_netto_batch",
+    "calc_inverse_netto_batch",
+    "Calculator",
     # Configuration
     "TaxConfig",
+    "FrozenTaxConfig",
+    "DEFAULT_CONFIG",
+    "intern_config",
+    "get_parameters",
+    "TaxParameters",
+    # Instrumentation
+    "instrument",
+    "stats",
     # Social Security
     "calc_social_security",
     "calc_deductible_social_security",
     "calc_social_security_by_integration",
+    "calc_social_security_analytic",
     "calc_insurance_pension",
     "calc_insurance_health",
     "calc_insurance_nursing",
@@ -41,9 +71,11 @@ __all__ = [
     "get_rate_unemployment",
     # Income Tax
     "calc_income_tax",
+    "calc_income_tax_analytic",
     "calc_income_tax_by_integration",
     "calc_taxable_income",
     "get_marginal_tax_rate",
+    "get_tax_curve",
     # Other Taxes
     "calc_soli",
     "calc_church_tax",
@@ -0,0 +1,261 @@
+"""
+Batch calculations over rows with individual tax configurations.
+
+Payroll tables mix years, marital status, children, health insurance
+surcharges and church tax rates. The functions here take one column per
+`TaxConfig` field, group the rows by their configuration, run the vectorized
+calculation once per group and scatter the results back into the original
+row order.
+
+Examples
+--------
+>>> calc_netto_batch(
+...     [50000, 50000, 80000],
+...     year=[2024, 2025, 2025],
+...     is_married=[False, False, True],
+... )
+"""
+
+from collections.abc import Callable, Iterator
+
+import numpy as np
+
+from netto.config import DEFAULT_CONFIG, FrozenTaxConfig, intern_config
+from netto.main import (
+    calc_inverse_netto_array,
+    calc_netto_array,
+    calc_netto_detailed_array,
+)
+
+# Column dtypes of the grouping key, in TaxConfig field order
+__KEY_DTYPE = np.dtype(
+    [
+        ("year", np.int64),
+        ("has_children", np.bool_),
+        ("is_married", np.bool_),
+        ("extra_health_insurance", np.float64),
+        ("church_tax", np.float64),
+    ]
+)
+
+
+def group_by_config(
+    size: int,
+    year=None,
+    has_children=None,
+    is_married=None,
+    extra_health_insurance=None,
+    church_tax=None,
+) -> Iterator[tuple[FrozenTaxConfig, np.ndarray]]:
+    """
+    Group row indices by their tax configuration.
+
+    Each column is either one value per row, a single value for all rows or
+    None for the default of `TaxConfig`.
+
+    Parameters
+    ----------
+    size : int
+        Number of rows
+    year, has_children, is_married, extra_health_insurance, church_tax : array_like, optional
+        Configuration columns
+
+    Yields
+    ------
+    tuple
+        The interned `FrozenTaxConfig` of a group and the ascending row
+        indices belonging to it
+    """
+    columns = {
+        "year": year,
+        "has_children": has_children,
+        "is_married": is_married,
+        "extra_health_insurance": extra_health_insurance,
+        "church_tax": church_tax,
+    }
+    keys = np.empty(size, dtype=__KEY_DTYPE)
+    for name, column in columns.items():
+        if column is None:
+            column = getattr(DEFAULT_CONFIG, name)
+        keys[name] = np.broadcast_to(np.asarray(column), (size,))
+
+    if size == 0:
+        return
+    unique, inverse = np.unique(keys, return_inverse=True)
+    inverse = inverse.reshape(size)
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.cumsum(np.bincount(inverse, minlength=unique.size))[:-1]
+    for key, index in zip(unique.tolist(), np.split(order, bounds), strict=True):
+        year, has_children, is_married, extra_health_insurance, church_tax = key
+        config = intern_config(
+            FrozenTaxConfig(
+                year=int(year),
+                has_children=bool(has_children),
+                is_married=bool(is_married),
+                extra_health_insurance=float(extra_health_insurance),
+                church_tax=float(church_tax),
+            )
+        )
+        yield config, index
+
+
+def calc_netto_batch(
+    salary,
+    deductibles=0,
+    year=None,
+    has_children=None,
+    is_married=None,
+    extra_health_insurance=None,
+    church_tax=None,
+) -> np.ndarray:
+    """
+    Calculate net incomes for rows with individual tax configurations.
+
+    Rows with equal configuration are computed together with
+    `calc_netto_array`, so every result equals the corresponding
+    ``calc_netto(salary, deductibles, config=TaxConfig(...))``.
+
+    Parameters
+    ----------
+    salary : array_like
+        Yearly gross salaries
+    deductibles : array_like, optional
+        Additional deductibles per row or for all rows
+    year, has_children, is_married, extra_health_insurance, church_tax : array_like, optional
+        `TaxConfig` fields per row or for all rows (defaults if not provided)
+
+    Returns
+    -------
+    numpy.ndarray
+        Net incomes in the original row order
+    """
+    return __dispatch(
+        calc_netto_array,
+        salary,
+        deductibles,
+        year=year,
+        has_children=has_children,
+        is_married=is_married,
+        extra_health_insurance=extra_health_insurance,
+        church_tax=church_tax,
+    )
+
+
+def calc_inverse_netto_batch(
+    desired_netto,
+    deductibles=0,
+    year=None,
+    has_children=None,
+    is_married=None,
+    extra_health_insurance=None,
+    church_tax=None,
+) -> np.ndarray:
+    """
+    Calculate required gross salaries for rows with individual configurations.
+
+    Rows with equal configuration are solved together with
+    `calc_inverse_netto_array`.
+
+    Parameters
+    ----------
+    desired_netto : array_like
+        Desired net incomes
+    deductibles : array_like, optional
+        Additional deductibles per row or for all rows
+    year, has_children, is_married, extra_health_insurance, church_tax : array_like, optional
+        `TaxConfig` fields per row or for all rows (defaults if not provided)
+
+    Returns
+    -------
+    numpy.ndarray
+        Required gross salaries in the original row order
+    """
+    return __dispatch(
+        calc_inverse_netto_array,
+        desired_netto,
+        deductibles,
+        year=year,
+        has_children=has_children,
+        is_married=is_married,
+        extra_health_insurance=extra_health_insurance,
+        church_tax=church_tax,
+    )
+
+
+def calc_netto_detailed_batch(
+    values,
+    deductibles=0,
+    inverse=False,
+    year=None,
+    has_children=None,
+    is_married=None,
+    extra_health_insurance=None,
+    church_tax=None,
+) -> dict[str, np.ndarray]:
+    """
+    Calculate full breakdowns for rows with individual configurations.
+
+    Parameters
+    ----------
+    values : array_like
+        Yearly gross salaries, or desired net incomes where ``inverse`` is set
+    deductibles : array_like, optional
+        Additional deductibles per row or for all rows
+    inverse : bool or array_like, optional
+        Per row or for all rows, whether the value is a desired net income;
+        the required gross salary is solved with `calc_inverse_netto_array`
+        and broken down
+    year, has_children, is_married, extra_health_insurance, church_tax : array_like, optional
+        `TaxConfig` fields per row or for all rows (defaults if not provided)
+
+    Returns
+    -------
+    dict
+        One array per `NettoResult` field, in the original row order
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 1:
+        raise ValueError(f"expected a one-dimensional column, got shape {values.shape}")
+    deductibles = np.broadcast_to(
+        np.asarray(deductibles, dtype=np.float64), values.shape
+    )
+    inverse = np.broadcast_to(np.asarray(inverse, dtype=bool), values.shape)
+    gross = values.copy()
+    results = {}
+    for config, index in group_by_config(
+        values.size,
+        year=year,
+        has_children=has_children,
+        is_married=is_married,
+        extra_health_insurance=extra_health_insurance,
+        church_tax=church_tax,
+    ):
+        solve = index[inverse[index]]
+        if solve.size:
+            gross[solve] = calc_inverse_netto_array(
+                values[solve], deductibles[solve], config
+            )
+        breakdown = calc_netto_detailed_array(gross[index], deductibles[index], config)
+        for name, column in breakdown.items():
+            results.setdefault(name, np.empty_like(values))[index] = column
+    if not results:
+        results = calc_netto_detailed_array(values)
+    return results
+
+
+def __dispatch(
+    func: Callable[[np.ndarray, np.ndarray, FrozenTaxConfig], np.ndarray],
+    values,
+    deductibles,
+    **columns,
+) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 1:
+        raise ValueError(f"expected a one-dimensional column, got shape {values.shape}")
+    deductibles = np.broadcast_to(
+        np.asarray(deductibles, dtype=np.float64), values.shape
+    )
+    result = np.empty_like(values)
+    for config, index in group_by_config(values.size, **columns):
+        result[index] = func(values[index], deductibles[index], config)
+    return result
@@ -0,0 +1,161 @@
+"""
+Opt-in memoization for `calc_netto` and `calc_inverse_netto`.
+
+Caching is disabled by default. Once enabled with `enable_cache`, results are
+stored in a bounded LRU cache keyed by the function, the salary and
+deductibles rounded to the cent, the interned configuration and any further
+arguments that change the result. Inputs are rounded to the cent *before*
+the calculation, so cached and uncached calls return the same value for a
+given key.
+
+Examples
+--------
+>>> from netto import cache, calc_netto
+>>> cache.enable_cache(maxsize=10_000, ttl=3600)
+>>> calc_netto(50000)
+>>> cache.cache_info()
+CacheInfo(hits=0, misses=1, evictions=0, expirations=0, size=1, maxsize=10000)
+>>> cache.clear_cache()
+"""
+
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics as returned by `cache_info`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    maxsize: int
+
+
+class ResultCache:
+    """
+    Bounded LRU cache with optional time-to-live.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries; the least recently used entry is evicted
+        when the cache is full
+    ttl : float, optional
+        Seconds after which an entry expires (never if not provided)
+    """
+
+    __slots__ = (
+        "maxsize",
+        "ttl",
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "_entries",
+    )
+
+    def __init__(self, maxsize: int = 4096, ttl: float | None = None):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key, default=None):
+        """Return the cached value for ``key`` or ``default``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        value, expires = entry
+        if expires is not None and expires < time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        self._entries[key] = (value, expires)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def info(self) -> CacheInfo:
+        """Return the current statistics."""
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.expirations,
+            len(self._entries),
+            self.maxsize,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# The active cache, or None while caching is disabled
+active_cache: ResultCache | None = None
+
+
+def enable_cache(maxsize: int = 4096, ttl: float | None = None) -> ResultCache:
+    """
+    Enable memoization of `calc_netto` and `calc_inverse_netto`.
+
+    Replaces any previously active cache.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of cached results (default is 4096)
+    ttl : float, optional
+        Seconds after which a cached result expires (never if not provided)
+
+    Returns
+    -------
+    ResultCache
+        The new active cache
+    """
+    global active_cache
+    active_cache = ResultCache(maxsize=maxsize, ttl=ttl)
+    return active_cache
+
+
+def disable_cache() -> None:
+    """Disable memoization and drop all cached results."""
+    global active_cache
+    active_cache = None
+
+
+def clear_cache() -> None:
+    """Drop all cached results, e.g. after tax data has changed."""
+    if active_cache is not None:
+        active_cache.clear()
+
+
+def cache_info() -> CacheInfo | None:
+    """Return statistics of the active cache, or None if caching is disabled."""
+    if active_cache is None:
+        return None
+    return active_cache.info()
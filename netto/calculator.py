@@ -0,0 +1,229 @@
+import math
+from bisect import bisect_right
+
+from netto.config import TaxConfig
+from netto.main import NettoResult
+from netto.parameters import get_parameters
+from netto.segments import find_net_segment, get_net_segments
+
+
+class Calculator:
+    """
+    Net income calculator with all parameters of one configuration bound.
+
+    Rates, limits, pension factor, soli parameters and tax bracket
+    coefficients are resolved once at construction, so each call is plain
+    arithmetic. Results are identical to the module-level functions.
+
+    Parameters
+    ----------
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+
+    Examples
+    --------
+    >>> calculator = Calculator(TaxConfig(year=2025, is_married=True))
+    >>> calculator.netto(50000)
+    >>> calculator.inverse(35000)
+    >>> calculator.breakdown(50000).income_tax
+    >>> calculator.marginal_rate(40000)
+    """
+
+    __slots__ = (
+        "config",
+        "_pension_rate",
+        "_pension_cap",
+        "_unemployment_rate",
+        "_unemployment_cap",
+        "_health_rate",
+        "_health_cap",
+        "_health_deductible_rate",
+        "_health_deductible_cap",
+        "_nursing_rate",
+        "_nursing_cap",
+        "_pension_factor",
+        "_soli_start",
+        "_soli_fraction",
+        "_soli_rate",
+        "_church_tax",
+        "_tax_curve",
+        "_steps",
+        "_offsets",
+        "_rates",
+        "_half_slopes",
+    )
+
+    def __init__(self, config: TaxConfig | None = None):
+        parameters = get_parameters(config)
+        self.config = parameters.config
+        # Caps are limit * rate, multiplied exactly like netto.social_security
+        self._pension_rate = parameters.pension_rate
+        self._pension_cap = parameters.pension_limit * parameters.pension_rate
+        self._unemployment_rate = parameters.unemployment_rate
+        self._unemployment_cap = (
+            parameters.unemployment_limit * parameters.unemployment_rate
+        )
+        self._health_rate = parameters.health_rate
+        self._health_cap = parameters.health_limit * parameters.health_rate
+        self._health_deductible_rate = parameters.health_deductible_rate
+        self._health_deductible_cap = (
+            parameters.health_limit * parameters.health_deductible_rate
+        )
+        self._nursing_rate = parameters.nursing_rate
+        self._nursing_cap = parameters.nursing_limit * parameters.nursing_rate
+        self._pension_factor = parameters.pension_factor
+        self._soli_start = parameters.soli_start
+        self._soli_fraction = parameters.soli_fraction
+        self._soli_rate = parameters.soli_rate
+        self._church_tax = parameters.church_tax
+        self._tax_curve = parameters.tax_curve
+        self._steps = parameters.tax_curve.steps
+        self._offsets = parameters.tax_curve.offsets
+        self._rates = parameters.tax_curve.rates
+        self._half_slopes = parameters.tax_curve.half_slopes
+
+    def __repr__(self) -> str:
+        return f"Calculator({self.config!r})"
+
+    def netto(self, salary: float, deductibles: float = 0) -> float:
+        """
+        Calculate net income from gross salary, like `calc_netto`.
+
+        Parameters
+        ----------
+        salary : float
+            Yearly gross salary
+        deductibles : float, optional
+            Additional deductibles that reduce taxable income
+
+        Returns
+        -------
+        float
+            Net income
+        """
+        return self._calculate(salary, deductibles)[-1]
+
+    def breakdown(self, salary: float, deductibles: float = 0) -> NettoResult:
+        """
+        Calculate net income with a full breakdown, like `calc_netto_detailed`.
+
+        Parameters
+        ----------
+        salary : float
+            Yearly gross salary
+        deductibles : float, optional
+            Additional deductibles that reduce taxable income
+
+        Returns
+        -------
+        NettoResult
+            Taxes, contributions and net income
+        """
+        return NettoResult(salary, *self._calculate(salary, deductibles))
+
+    def inverse(self, desired_netto: float, deductibles: float = 0) -> float:
+        """
+        Calculate the required gross salary for a desired net income.
+
+        Returns the smallest whole-euro gross salary whose net income reaches
+        ``desired_netto``, like ``calc_inverse_netto(..., method="analytic")``.
+
+        Parameters
+        ----------
+        desired_netto : float
+            Desired net income
+        deductibles : float, optional
+            Additional deductibles that reduce taxable income
+
+        Returns
+        -------
+        float
+            Required gross salary
+        """
+        if desired_netto <= 0:
+            return 0.0
+
+        segments = get_net_segments(self.config, deductibles)
+        gross = math.ceil(
+            find_net_segment(segments, desired_netto).solve(desired_netto)
+        )
+        while self.netto(gross, deductibles) < desired_netto:
+            gross += 1
+        while gross > 0 and self.netto(gross - 1, deductibles) >= desired_netto:
+            gross -= 1
+        return float(gross)
+
+    def marginal_rate(self, taxable_income: float) -> float:
+        """
+        Return the marginal tax rate, like `get_marginal_tax_rate`.
+
+        Parameters
+        ----------
+        taxable_income : float
+            Taxable income
+
+        Returns
+        -------
+        float
+            Marginal tax rate
+        """
+        return self._tax_curve.marginal_rate(taxable_income)
+
+    def _calculate(self, salary: float, deductibles: float) -> tuple:
+        # Pipeline shared by netto and breakdown, returning the NettoResult
+        # fields after gross as a plain tuple so that netto does not build a
+        # NettoResult; the order of operations matches calc_netto_detailed
+        pension = min(salary * self._pension_rate, self._pension_cap)
+        health = min(salary * self._health_rate, self._health_cap)
+        nursing = min(salary * self._nursing_rate, self._nursing_cap)
+        unemployment = min(salary * self._unemployment_rate, self._unemployment_cap)
+        social_security = round(pension + health + nursing + unemployment, 2)
+        deductible_social_security = (
+            math.ceil(pension * self._pension_factor)
+            + math.ceil(
+                min(salary * self._health_deductible_rate, self._health_deductible_cap)
+            )
+            + math.ceil(nursing)
+        )
+        taxable_income = math.floor(
+            max(0, salary - deductible_social_security - 1200 - 36 - deductibles)
+        )
+        income_tax = self._income_tax(taxable_income)
+        soli = self._soli(income_tax)
+        church_tax = round(max(income_tax * self._church_tax, 0), 2)
+        net = round(salary - income_tax - soli - church_tax - social_security, 2)
+        return (
+            deductible_social_security,
+            taxable_income,
+            income_tax,
+            soli,
+            church_tax,
+            pension,
+            health,
+            nursing,
+            unemployment,
+            social_security,
+            net,
+        )
+
+    def _income_tax(self, taxable_income: float) -> float:
+        zone = bisect_right(self._steps, taxable_income) - 1
+        if zone < 0:
+            return 0.0
+        dx = taxable_income - self._steps[zone]
+        return (
+            self._offsets[zone]
+            + (self._rates[zone] + self._half_slopes[zone] * dx) * dx
+        )
+
+    def _soli(self, income_tax: float) -> float:
+        return round(
+            max(
+                min(
+                    max(0, income_tax - self._soli_start) * self._soli_fraction,
+                    income_tax * self._soli_rate,
+                ),
+                0,
+            ),
+            2,
+        )
@@ -0,0 +1,215 @@
+"""
+Command-line interface.
+
+Examples
+--------
+Net income for a gross salary, and the gross salary for a net income::
+
+    $ netto 50000 --year 2024 --married
+    $ netto --inverse 35000
+
+Full breakdown as JSON::
+
+    $ netto 50000 --json
+
+Streaming JSON lines, one object per line with ``salary`` or
+``desired_netto`` and optionally ``deductibles``, any `TaxConfig` field and
+an ``id`` that is echoed back::
+
+    $ printf '{"salary": 50000}\\n{"desired_netto": 35000, "year": 2024}\\n' \\
+        | netto --stream
+
+Rows are processed in batches of whatever input is available, so both bulk
+pipes and interactive request/response use stay efficient.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+from collections.abc import Iterator
+
+from netto.batch import calc_netto_detailed_batch
+from netto.config import DEFAULT_CONFIG, FrozenTaxConfig
+
+__CONFIG_FIELDS = (
+    "year",
+    "has_children",
+    "is_married",
+    "extra_health_insurance",
+    "church_tax",
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the ``netto`` console script and return its exit code."""
+    parser = __build_parser()
+    args = parser.parse_args(argv)
+    defaults = {
+        "year": args.year,
+        "has_children": args.children,
+        "is_married": args.married,
+        "extra_health_insurance": args.extra_health_insurance,
+        "church_tax": args.church_tax,
+    }
+    try:
+        FrozenTaxConfig(**defaults)
+    except (TypeError, ValueError) as error:
+        parser.error(str(error))
+
+    if not math.isfinite(args.deductibles):
+        parser.error("--deductibles must be finite")
+    if args.stream:
+        if args.value is not None:
+            parser.error("VALUE cannot be combined with --stream")
+        __stream(defaults, args.deductibles, args.batch_size)
+        return 0
+    if args.value is None:
+        parser.error("VALUE is required unless --stream is given")
+    if not math.isfinite(args.value):
+        parser.error("VALUE must be finite")
+
+    results = calc_netto_detailed_batch(
+        [args.value], args.deductibles, args.inverse, **defaults
+    )
+    row = {name: column[0] for name, column in results.items()}
+    if args.json:
+        print(json.dumps(row, allow_nan=False))
+    else:
+        print(f"{row['gross'] if args.inverse else row['net']:.2f}")
+    return 0
+
+
+def __build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="netto",
+        description="German net income from gross salary, and the inverse.",
+    )
+    parser.add_argument(
+        "value", nargs="?", type=float, help="gross salary, or net income with -i"
+    )
+    parser.add_argument(
+        "-i",
+        "--inverse",
+        action="store_true",
+        help="calculate the gross salary required for a net income",
+    )
+    parser.add_argument("-d", "--deductibles", type=float, default=0.0)
+    parser.add_argument("-y", "--year", type=int, default=DEFAULT_CONFIG.year)
+    parser.add_argument("--married", action="store_true")
+    parser.add_argument("--children", action="store_true")
+    parser.add_argument("--church-tax", type=float, default=DEFAULT_CONFIG.church_tax)
+    parser.add_argument(
+        "--extra-health-insurance",
+        type=float,
+        default=DEFAULT_CONFIG.extra_health_insurance,
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print the full breakdown as JSON"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="read JSON lines from stdin and write JSON lines to stdout",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=4096,
+        help="maximum number of rows calculated at once in --stream mode",
+    )
+    return parser
+
+
+def __stream(defaults: dict, deductibles: float, batch_size: int) -> None:
+    for lines in __read_batches(sys.stdin.fileno(), batch_size):
+        sys.stdout.write("".join(__process_lines(lines, defaults, deductibles)))
+        sys.stdout.flush()
+
+
+def __read_batches(fd: int, batch_size: int) -> Iterator[list[bytes]]:
+    # os.read returns whatever is available, so a batch holds the lines that
+    # have arrived so far without waiting for more
+    pending = b""
+    while True:
+        data = os.read(fd, 1 << 16)
+        if not data:
+            if pending.strip():
+                yield [pending]
+            return
+        lines = (pending + data).split(b"\n")
+        pending = lines.pop()
+        lines = [line for line in lines if line.strip()]
+        for start in range(0, len(lines), batch_size):
+            yield lines[start : start + batch_size]
+
+
+def __process_lines(
+    lines: list[bytes], defaults: dict, deductibles: float
+) -> list[str]:
+    output: list[str | None] = [None] * len(lines)
+    rows = []
+    for position, line in enumerate(lines):
+        try:
+            rows.append((position, __parse_row(line, defaults, deductibles)))
+        except (TypeError, ValueError) as error:
+            output[position] = __error_line(error)
+
+    if rows:
+        columns = list(zip(*(row for _, row in rows), strict=True))
+        ids, values, row_deductibles, inverse = columns[:4]
+        results = calc_netto_detailed_batch(
+            values,
+            row_deductibles,
+            inverse,
+            **dict(zip(__CONFIG_FIELDS, columns[4:], strict=True)),
+        )
+        results = {name: column.tolist() for name, column in results.items()}
+        for index, (position, _) in enumerate(rows):
+            result = {name: column[index] for name, column in results.items()}
+            if ids[index] is not None:
+                result = {"id": ids[index], **result}
+            try:
+                output[position] = json.dumps(result, allow_nan=False) + "\n"
+            except ValueError:
+                output[position] = __error_line("result is not finite")
+    return output
+
+
+def __error_line(error: Exception | str) -> str:
+    return json.dumps({"error": str(error)}) + "\n"
+
+
+def __parse_row(line: bytes, defaults: dict, deductibles: float) -> tuple:
+    row = json.loads(line)
+    if not isinstance(row, dict):
+        raise ValueError("expected a JSON object")
+    if ("salary" in row) == ("desired_netto" in row):
+        raise ValueError("exactly one of 'salary' and 'desired_netto' is required")
+    inverse = "desired_netto" in row
+    key = "desired_netto" if inverse else "salary"
+    value = __finite(key, row[key])
+    config = {name: row.get(name, defaults[name]) for name in __CONFIG_FIELDS}
+    # Validates the row before it joins the batch
+    FrozenTaxConfig(**config)
+    for name in ("extra_health_insurance", "church_tax"):
+        __finite(name, config[name])
+    return (
+        row.get("id"),
+        value,
+        __finite("deductibles", row.get("deductibles", deductibles)),
+        inverse,
+        *config.values(),
+    )
+
+
+def __finite(name: str, value) -> float:
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f"{name} must be finite, got {value}")
+    return value
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 
 
@@ -34,17 +35,116 @@ class TaxConfig:
 
     def __post_init__(self):
         """Validate configuration values."""
-        if not isinstance(self.year, int):
-            raise TypeError(f"year must be int, got {type(self.year)}")
-        if self.year < 2018 or self.year > 2026:
-            raise ValueError(f"year must be between 2018 and 2026, got {self.year}")
-        if not isinstance(self.has_children, bool):
-            raise TypeError(f"has_children must be bool, got {type(self.has_children)}")
-        if not isinstance(self.is_married, bool):
-            raise TypeError(f"is_married must be bool, got {type(self.is_married)}")
-        if self.extra_health_insurance < 0:
-            raise ValueError(
-                f"extra_health_insurance must be non-negative, got {self.extra_health_insurance}"
-            )
-        if self.church_tax < 0:
-            raise ValueError(f"church_tax must be non-negative, got {self.church_tax}")
+        _validate(self)
+
+    def freeze(self) -> "FrozenTaxConfig":
+        """Return the interned, hashable counterpart of this configuration."""
+        return intern_config(self)
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenTaxConfig:
+    """
+    Immutable, hashable configuration for tax and social security calculations.
+
+    Has the same fields and validation as `TaxConfig` and can be used wherever
+    a `TaxConfig` is accepted. Being hashable, it can serve as a cache key.
+    Use `intern_config` or `TaxConfig.freeze` to obtain the shared instance
+    for a set of values instead of constructing new ones.
+
+    Examples
+    --------
+    >>> FrozenTaxConfig(year=2025, is_married=True)
+    >>> TaxConfig(year=2025).freeze() is intern_config(TaxConfig(year=2025))
+    True
+    """
+
+    year: int = 2025
+    has_children: bool = False
+    is_married: bool = False
+    extra_health_insurance: float = 0.025
+    church_tax: float = 0.09
+
+    def __post_init__(self):
+        """Validate configuration values."""
+        _validate(self)
+
+    def freeze(self) -> "FrozenTaxConfig":
+        """Return the interned instance for this configuration."""
+        return intern_config(self)
+
+
+def _validate(config: TaxConfig | FrozenTaxConfig) -> None:
+    if not isinstance(config.year, int):
+        raise TypeError(f"year must be int, got {type(config.year)}")
+    if config.year < 2018 or config.year > 2026:
+        raise ValueError(f"year must be between 2018 and 2026, got {config.year}")
+    if not isinstance(config.has_children, bool):
+        raise TypeError(f"has_children must be bool, got {type(config.has_children)}")
+    if not isinstance(config.is_married, bool):
+        raise TypeError(f"is_married must be bool, got {type(config.is_married)}")
+    if config.extra_health_insurance < 0:
+        raise ValueError(
+            f"extra_health_insurance must be non-negative, got {config.extra_health_insurance}"
+        )
+    if config.church_tax < 0:
+        raise ValueError(f"church_tax must be non-negative, got {config.church_tax}")
+
+
+# Shared default configuration used whenever no config is passed
+DEFAULT_CONFIG = FrozenTaxConfig()
+
+# Most recently used interned configurations, bounded so that callers
+# iterating over many distinct configs do not grow it without limit
+__INTERNED: OrderedDict[tuple, FrozenTaxConfig] = OrderedDict()
+__INTERNED_SIZE = 1024
+
+
+def intern_config(
+    config: TaxConfig | FrozenTaxConfig | None = None,
+) -> FrozenTaxConfig:
+    """
+    Return the shared frozen configuration with the same values as ``config``.
+
+    Identical configurations map to one `FrozenTaxConfig` instance, which is
+    validated only once and can be used as a cache key. The 1024 most
+    recently used configurations are kept; an evicted one is interned again
+    as a new, equal instance. Defaults always map to `DEFAULT_CONFIG`.
+
+    Parameters
+    ----------
+    config : TaxConfig or FrozenTaxConfig, optional
+        Configuration to intern (uses defaults if not provided)
+
+    Returns
+    -------
+    FrozenTaxConfig
+        The interned configuration
+
+    Examples
+    --------
+    >>> intern_config() is DEFAULT_CONFIG
+    True
+    """
+    if config is None:
+        return DEFAULT_CONFIG
+    key = (
+        config.year,
+        config.has_children,
+        config.is_married,
+        config.extra_health_insurance,
+        config.church_tax,
+    )
+    interned = __INTERNED.get(key)
+    if interned is None:
+        interned = (
+            config if isinstance(config, FrozenTaxConfig) else FrozenTaxConfig(*key)
+        )
+        if interned == DEFAULT_CONFIG:
+            interned = DEFAULT_CONFIG
+        if len(__INTERNED) >= __INTERNED_SIZE:
+            __INTERNED.popitem(last=False)
+        __INTERNED[key] = interned
+    else:
+        __INTERNED.move_to_end(key)
+    return interned
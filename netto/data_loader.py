@@ -5,78 +5,43 @@ This module loads tax data from JSON files and provides validation
 using Pydantic models. All data is organized in individual yearly files
 for better maintainability and auditability.
 
-The loaded data is exposed as module-level variables for easy import:
+The data is exposed as module-level dictionaries keyed by year:
 - tax_curve: Tax brackets by year
 - social_security_curve: Social security rates by year
 - soli_curve: Solidarity tax parameters by year
 - correction_factor_pensions: Pension deduction factors by year
+
+These are `LazyYearDict` instances: a year is read on first access and
+cached afterwards, so processes that only need one year do not pay for
+parsing all of them at import time. Years are taken from the precompiled
+snapshot (see `netto.snapshot`) when it is up to date, which avoids importing
+pydantic altogether.
 """
 
 import json
+from collections.abc import Callable
+from functools import cache
 from pathlib import Path
 
-from pydantic import BaseModel, Field, field_validator
-
 DATA_DIR = Path(__file__).parent.parent / "data"
 
-
-class TaxBracket(BaseModel):
-    step: float = Field(gt=0, description="Income threshold for this bracket")
-    rate: float = Field(ge=0, le=1, description="Tax rate for this bracket")
-    const: list[float] | None = Field(
-        default=None, description="Polynomial coefficients"
-    )
-
-    @field_validator("const")
-    @classmethod
-    def validate_const_length(cls, v, info):
-        if v is not None and len(v) == 0:
-            raise ValueError("const array cannot be empty")
-        return v
-
-
-class TaxCurve(BaseModel):
-    year: int = Field(ge=2018, le=2030, description="Tax year")
-    brackets: dict[str, TaxBracket] = Field(description="Tax brackets (0-3)")
-
-    @field_validator("brackets")
-    @classmethod
-    def validate_brackets(cls, v):
-        if set(v.keys()) != {"0", "1", "2", "3"}:
-            raise ValueError("Tax curve must have exactly 4 brackets (0-3)")
-        return v
+# Models live in netto.models and are imported on first use, see __getattr__
+__MODELS = (
+    "TaxBracket",
+    "TaxCurve",
+    "SocialSecurityEntry",
+    "SocialSecurity",
+    "SoliCurve",
+    "PensionFactor",
+)
 
 
-class SocialSecurityEntry(BaseModel):
-    limit: float = Field(gt=0, description="Income limit for this contribution")
-    rate: float = Field(ge=0, le=1, description="Contribution rate")
-    extra: float | None = Field(
-        default=None, ge=0, le=1, description="Extra rate (nursing only)"
-    )
+def __getattr__(name: str):
+    if name in __MODELS:
+        from netto import models
 
-
-class SocialSecurity(BaseModel):
-    year: int = Field(ge=2018, le=2030, description="Tax year")
-    pension: SocialSecurityEntry
-    unemployment: SocialSecurityEntry
-    health: SocialSecurityEntry
-    nursing: SocialSecurityEntry
-
-
-class SoliCurve(BaseModel):
-    year: int = Field(ge=2018, le=2030, description="Tax year")
-    start_taxable_income: float = Field(
-        gt=0, description="Income threshold where soli starts"
-    )
-    start_fraction: float = Field(
-        ge=0, le=1, description="Starting fraction for progressive phase-in"
-    )
-    end_rate: float = Field(ge=0, le=1, description="Maximum soli rate")
-
-
-class PensionFactor(BaseModel):
-    year: int = Field(ge=2018, le=2030, description="Tax year")
-    factor: float = Field(ge=0, le=1, description="Pension deduction factor")
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def load_tax_curve(year: int) -> dict[int, dict]:
@@ -107,6 +72,8 @@ def load_tax_curve(year: int) -> dict[int, dict]:
     with open(file_path) as f:
         data = json.load(f)
 
+    from netto.models import TaxCurve
+
     tax_curve = TaxCurve(**data)
 
     # Convert string keys to integers for backward compatibility
@@ -145,6 +112,8 @@ def load_social_security(year: int) -> dict:
     with open(file_path) as f:
         data = json.load(f)
 
+    from netto.models import SocialSecurity
+
     social_security = SocialSecurity(**data)
 
     return social_security.model_dump(exclude={"year"})
@@ -178,6 +147,8 @@ def load_soli(year: int) -> dict:
     with open(file_path) as f:
         data = json.load(f)
 
+    from netto.models import SoliCurve
+
     soli_curve = SoliCurve(**data)
 
     return soli_curve.model_dump(exclude={"year"})
@@ -211,6 +182,8 @@ def load_pension_factor(year: int) -> float:
     with open(file_path) as f:
         data = json.load(f)
 
+    from netto.models import PensionFactor
+
     pension_factor = PensionFactor(**data)
 
     return pension_factor.factor
@@ -292,8 +265,134 @@ def load_all_pension_factors() -> dict[int, float]:
     return pension_factors
 
 
-# Load all data at module import time and expose as module-level variables
-tax_curve = load_all_tax_curves()
-social_security_curve = load_all_social_security()
-soli_curve = load_all_soli()
-correction_factor_pensions = load_all_pension_factors()
+class LazyYearDict(dict):
+    """
+    Dictionary of yearly data that loads each year on first access.
+
+    Behaves like the dictionaries returned by the ``load_all_*`` functions:
+    membership and length reflect all years with a data file, indexing loads
+    and validates a single year, and iteration loads all remaining years.
+
+    Parameters
+    ----------
+    loader : callable
+        Function loading the data for one year, e.g. `load_tax_curve`
+    directory : str
+        Subdirectory of the data directory holding one JSON file per year
+    extra : dict, optional
+        Entries available without loading
+    snapshot_key : str, optional
+        Key of this data in the snapshot; years found there are not validated
+        again
+
+    Examples
+    --------
+    >>> curves = LazyYearDict(load_tax_curve, "tax_curves")
+    >>> 2022 in curves  # no file is read yet
+    True
+    >>> curves[2022][0]["step"]  # reads and validates 2022 only
+    10347
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[int], object],
+        directory: str,
+        extra: dict | None = None,
+        snapshot_key: str | None = None,
+    ):
+        super().__init__(extra or {})
+        self._loader = loader
+        self._directory = directory
+        self._snapshot_key = snapshot_key
+        self._years: list[int] | None = None
+
+    def available_years(self) -> list[int]:
+        """Return all years that have data, loaded or not, in ascending order."""
+        if self._years is None:
+            years = {
+                int(path.stem)
+                for path in (DATA_DIR / self._directory).glob("*.json")
+                if path.stem.isdigit()
+            }
+            self._years = sorted(years | set(dict.keys(self)))
+        return self._years
+
+    def load_all(self) -> None:
+        """Load every available year that has not been loaded yet."""
+        years = self.available_years()
+        if dict.__len__(self) == len(years):
+            return
+        loaded = {year: self[year] for year in years}
+        dict.clear(self)
+        dict.update(self, loaded)
+
+    def __missing__(self, year):
+        if year not in self.available_years():
+            raise KeyError(year)
+        snapshot = _snapshot_data() if self._snapshot_key else None
+        if snapshot is not None and year in snapshot[self._snapshot_key]:
+            value = snapshot[self._snapshot_key][year]
+        else:
+            value = self._loader(year)
+        self[year] = value
+        return value
+
+    def __contains__(self, year) -> bool:
+        return year in self.available_years()
+
+    def __len__(self) -> int:
+        return len(self.available_years())
+
+    def __iter__(self):
+        self.load_all()
+        return dict.__iter__(self)
+
+    def __eq__(self, other) -> bool:
+        self.load_all()
+        return dict.__eq__(self, other)
+
+    def __repr__(self) -> str:
+        self.load_all()
+        return dict.__repr__(self)
+
+    def get(self, year, default=None):
+        try:
+            return self[year]
+        except KeyError:
+            return default
+
+    def keys(self):
+        self.load_all()
+        return dict.keys(self)
+
+    def values(self):
+        self.load_all()
+        return dict.values(self)
+
+    def items(self):
+        self.load_all()
+        return dict.items(self)
+
+
+@cache
+def _snapshot_data() -> dict | None:
+    # Imported here as netto.snapshot depends on this module
+    from netto import snapshot
+
+    return snapshot.load_or_build()
+
+
+# Module-level data, loaded per year on first access
+tax_curve = LazyYearDict(load_tax_curve, "tax_curves", snapshot_key="tax_curve")
+social_security_curve = LazyYearDict(
+    load_social_security,
+    "social_security",
+    # NotImplementedError marker for 2027+ to maintain backward compatibility
+    extra={2027: NotImplementedError},
+    snapshot_key="social_security_curve",
+)
+soli_curve = LazyYearDict(load_soli, "soli", snapshot_key="soli_curve")
+correction_factor_pensions = LazyYearDict(
+    load_pension_factor, "pension_factors", snapshot_key="correction_factor_pensions"
+)
@@ -0,0 +1,160 @@
+"""
+Opt-in counters and timers for the scalar calculations.
+
+Instrumentation is disabled by default; the instrumented functions then only
+check whether a recorder is active. Once enabled with `instrument`, the
+active recorder counts
+
+- net income evaluations of the scalar pipeline, whether they come from
+  `calc_netto`, `calc_netto_detailed` or an inverse search,
+- iterations of the `netto.solvers.secant` solver behind
+  ``calc_inverse_netto(method="newton")``,
+- ``quad`` calls and integrand evaluations of the ``*_by_integration``
+  functions,
+
+and accumulates the time spent in each stage of the pipeline (`STAGES`). Every
+`calc_inverse_netto` call is logged with its iterations, net income
+evaluations and duration, so slow calls can be traced to their inputs.
+
+Examples
+--------
+>>> import netto
+>>> netto.instrument()
+>>> netto.calc_inverse_netto(35000)
+>>> stats = netto.stats()
+>>> stats.inverse[-1].netto_calls, stats.stage_seconds["income_tax"]
+>>> max(stats.inverse, key=lambda record: record.seconds)
+>>> netto.instrument(False)
+"""
+
+from collections import deque
+from collections.abc import Callable
+from typing import NamedTuple
+
+# Stages of the scalar pipeline in calculation order
+STAGES = ("social_security", "taxable_income", "income_tax", "soli", "church_tax")
+
+
+class InverseRecord(NamedTuple):
+    """One `calc_inverse_netto` call as logged by the active recorder."""
+
+    desired_netto: float
+    deductibles: float
+    year: int
+    method: str
+    iterations: int
+    netto_calls: int
+    seconds: float
+
+
+class Stats(NamedTuple):
+    """Instrumentation statistics as returned by `stats`."""
+
+    netto_calls: int
+    inverse_calls: int
+    solver_iterations: int
+    quad_calls: int
+    quad_evaluations: dict[str, int]
+    stage_seconds: dict[str, float]
+    inverse: tuple[InverseRecord, ...]
+
+
+class Recorder:
+    """
+    Mutable counters and timers filled by the instrumented functions.
+
+    Parameters
+    ----------
+    log_size : int
+        Number of most recent `calc_inverse_netto` calls kept in the log
+    """
+
+    __slots__ = (
+        "netto_calls",
+        "inverse_calls",
+        "solver_iterations",
+        "quad_calls",
+        "quad_evaluations",
+        "stage_seconds",
+        "inverse",
+    )
+
+    def __init__(self, log_size: int = 1000):
+        self.inverse: deque[InverseRecord] = deque(maxlen=log_size)
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters and timers and clear the inverse log."""
+        self.netto_calls = 0
+        self.inverse_calls = 0
+        self.solver_iterations = 0
+        self.quad_calls = 0
+        self.quad_evaluations: dict[str, int] = {}
+        self.stage_seconds = dict.fromkeys(STAGES, 0.0)
+        self.inverse.clear()
+
+    def counting(
+        self, name: str, integrand: Callable[[float], float]
+    ) -> Callable[[float], float]:
+        """Wrap a ``quad`` integrand so its evaluations count under ``name``."""
+        self.quad_calls += 1
+        self.quad_evaluations.setdefault(name, 0)
+
+        def counted(x):
+            self.quad_evaluations[name] += 1
+            return integrand(x)
+
+        return counted
+
+    def info(self) -> Stats:
+        """Return a snapshot of the current statistics."""
+        return Stats(
+            self.netto_calls,
+            self.inverse_calls,
+            self.solver_iterations,
+            self.quad_calls,
+            dict(self.quad_evaluations),
+            dict(self.stage_seconds),
+            tuple(self.inverse),
+        )
+
+
+# The active recorder, or None while instrumentation is disabled
+active_recorder: Recorder | None = None
+
+
+def instrument(enabled: bool = True, log_size: int = 1000) -> Recorder | None:
+    """
+    Enable or disable instrumentation.
+
+    Enabling replaces any previously active recorder, so statistics start
+    from zero.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether to record (default is True)
+    log_size : int, optional
+        Number of most recent `calc_inverse_netto` calls kept (default is 1000)
+
+    Returns
+    -------
+    Recorder or None
+        The new active recorder, or None if disabled
+    """
+    global active_recorder
+    active_recorder = Recorder(log_size) if enabled else None
+    return active_recorder
+
+
+def stats() -> Stats | None:
+    """Return the statistics of the active recorder, or None if disabled."""
+    if active_recorder is None:
+        return None
+    return active_recorder.info()
+
+
+def reset_stats() -> None:
+    """Zero the statistics of the active recorder, if any."""
+    if active_recorder is not None:
+        active_recorder.reset()
@@ -0,0 +1,273 @@
+"""
+Streaming file processing for payroll exports.
+
+`process_file` reads a CSV or Parquet file in fixed-size chunks, calculates
+the full breakdown for every row with the vectorized functions and appends
+the result columns to the output chunk by chunk. Memory use depends on the
+chunk size only, not on the size of the file.
+
+Parquet support requires pyarrow, e.g. ``pip install netto[parquet]``.
+
+Examples
+--------
+>>> process_file("payroll.csv", "payroll_net.csv", columns={"salary": "brutto"})
+>>> process_file(
+...     "targets.parquet",
+...     "targets_gross.parquet",
+...     columns={"desired_netto": "netto", "year": "jahr"},
+...     inverse=True,
+... )
+"""
+
+import csv
+import itertools
+from collections.abc import Iterator, Mapping
+from dataclasses import fields
+from pathlib import Path
+
+import numpy as np
+
+from netto.batch import calc_netto_detailed_batch
+from netto.config import DEFAULT_CONFIG, TaxConfig
+from netto.main import NettoResult
+
+RESULT_COLUMNS = tuple(field.name for field in fields(NettoResult))
+
+# TaxConfig fields and the dtype of their columns
+__CONFIG_FIELDS = {
+    "year": np.int64,
+    "has_children": bool,
+    "is_married": bool,
+    "extra_health_insurance": np.float64,
+    "church_tax": np.float64,
+}
+__TRUE = {"1", "true", "yes", "y", "t"}
+__FALSE = {"0", "false", "no", "n", "f"}
+
+
+def process_file(
+    input: str | Path,
+    output: str | Path,
+    columns: Mapping[str, str] | None = None,
+    config: TaxConfig | None = None,
+    inverse: bool = False,
+    chunk_size: int = 65_536,
+) -> int:
+    """
+    Calculate the net income breakdown for every row of a payroll file.
+
+    The output holds all input columns followed by `RESULT_COLUMNS`. With
+    ``inverse`` set, the required gross salary is solved first and the
+    breakdown is calculated for it, so ``gross`` holds the answer.
+
+    Parameters
+    ----------
+    input : str or Path
+        CSV or Parquet file (chosen by the ``.parquet``/``.pq`` suffix)
+    output : str or Path
+        CSV or Parquet file to write
+    columns : mapping, optional
+        Input column name per role. Roles are ``"salary"`` (or
+        ``"desired_netto"`` with ``inverse``), ``"deductibles"`` and the
+        `TaxConfig` fields. Default maps the value role to a column of the
+        same name.
+    config : TaxConfig, optional
+        Configuration for every field without a column (uses defaults if not
+        provided)
+    inverse : bool, optional
+        Treat the value column as desired net income and solve for gross
+    chunk_size : int, optional
+        Number of rows read, calculated and written at a time
+
+    Returns
+    -------
+    int
+        Number of processed rows
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if config is None:
+        config = DEFAULT_CONFIG
+    value_role = "desired_netto" if inverse else "salary"
+    columns = dict(columns or {value_role: value_role})
+    if value_role not in columns:
+        raise ValueError(f"columns must map the {value_role!r} role")
+    unknown = set(columns) - {value_role, "deductibles", *__CONFIG_FIELDS}
+    if unknown:
+        raise ValueError(f"unknown column roles: {sorted(unknown)}")
+
+    names, chunks = __read_chunks(Path(input), chunk_size)
+    collisions = set(names) & set(RESULT_COLUMNS)
+    if collisions:
+        raise ValueError(f"input already has result columns: {sorted(collisions)}")
+
+    rows = 0
+    writer = __open_writer(Path(output), names + list(RESULT_COLUMNS))
+    try:
+        for chunk in chunks:
+            results = __calculate_chunk(chunk, columns, config, value_role, inverse)
+            writer.write(chunk, results)
+            rows += len(results["net"])
+    finally:
+        writer.close()
+    return rows
+
+
+def __calculate_chunk(
+    chunk: dict, columns: dict, config: TaxConfig, value_role: str, inverse: bool
+) -> dict[str, np.ndarray]:
+    values = __column(chunk, columns[value_role], np.float64)
+    deductibles = (
+        __column(chunk, columns["deductibles"], np.float64)
+        if "deductibles" in columns
+        else np.zeros_like(values)
+    )
+    config_columns = {
+        name: __column(chunk, columns[name], dtype)
+        if name in columns
+        else getattr(config, name)
+        for name, dtype in __CONFIG_FIELDS.items()
+    }
+
+    return calc_netto_detailed_batch(values, deductibles, inverse, **config_columns)
+
+
+def __column(chunk: dict, name: str, dtype) -> np.ndarray:
+    if name not in chunk:
+        raise KeyError(f"column {name!r} not found in input")
+    column = chunk[name]
+    if not isinstance(column, list):
+        if column.null_count:
+            raise ValueError(f"column {name!r} has missing values")
+        if "string" not in str(column.type):
+            # Typed pyarrow arrays convert directly
+            return np.asarray(column, dtype=dtype)
+        column = column.to_pylist()
+    if dtype is bool:
+        return np.array([__parse_bool(name, value) for value in column], dtype=bool)
+    return np.array(column, dtype=dtype)
+
+
+def __parse_bool(name: str, value: str) -> bool:
+    token = value.strip().lower()
+    if token in __TRUE:
+        return True
+    if token in __FALSE:
+        return False
+    raise ValueError(f"column {name!r} has invalid boolean {value!r}")
+
+
+def __read_chunks(path: Path, chunk_size: int) -> tuple[list[str], Iterator[dict]]:
+    if __is_parquet(path):
+        parquet_file = __import_parquet().ParquetFile(path)
+        return parquet_file.schema_arrow.names, __read_parquet_chunks(
+            parquet_file, chunk_size
+        )
+
+    with open(path, newline="") as f:
+        header = next(csv.reader(f), None)
+    if header is None:
+        raise ValueError(f"{path} has no header")
+    return header, __read_csv_chunks(path, header, chunk_size)
+
+
+def __read_parquet_chunks(parquet_file, chunk_size: int):
+    import pyarrow as pa
+
+    empty = True
+    for batch in parquet_file.iter_batches(batch_size=chunk_size):
+        empty = False
+        yield dict(zip(batch.schema.names, batch.columns, strict=True))
+    if empty:
+        # One empty chunk so that the output still gets its schema
+        batch = pa.RecordBatch.from_pylist([], schema=parquet_file.schema_arrow)
+        yield dict(zip(batch.schema.names, batch.columns, strict=True))
+
+
+def __read_csv_chunks(path: Path, header: list[str], chunk_size: int):
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        first = True
+        while True:
+            rows = []
+            for row in itertools.islice(reader, chunk_size):
+                if len(row) != len(header):
+                    raise ValueError(
+                        f"{path}, line {reader.line_num}: expected {len(header)} "
+                        f"fields, got {len(row)}"
+                    )
+                rows.append(row)
+            # The first chunk is yielded even if empty so the output gets a schema
+            if rows or first:
+                yield {name: [row[i] for row in rows] for i, name in enumerate(header)}
+            if len(rows) < chunk_size:
+                return
+            first = False
+
+
+def __open_writer(path: Path, names: list[str]):
+    if __is_parquet(path):
+        __import_parquet()
+        return _ParquetWriter(path, names)
+    return _CsvWriter(path, names)
+
+
+class _CsvWriter:
+    def __init__(self, path: Path, names: list[str]):
+        self._file = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(names)
+
+    def write(self, chunk: dict, results: dict[str, np.ndarray]) -> None:
+        columns = [
+            column if isinstance(column, list) else column.to_pylist()
+            for column in chunk.values()
+        ]
+        columns += [results[name].tolist() for name in RESULT_COLUMNS]
+        self._writer.writerows(zip(*columns, strict=True))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path, names: list[str]):
+        self._path = path
+        self._names = names
+        self._writer = None
+
+    def write(self, chunk: dict, results: dict[str, np.ndarray]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # CSV columns are lists of strings, typed explicitly for empty chunks
+        arrays = [
+            pa.array(column, type=pa.string()) if isinstance(column, list) else column
+            for column in chunk.values()
+        ]
+        arrays += [pa.array(results[name]) for name in RESULT_COLUMNS]
+        batch = pa.RecordBatch.from_arrays(arrays, names=self._names)
+        if self._writer is None:
+            # The schema is only known once the first chunk has been read
+            self._writer = pq.ParquetWriter(self._path, batch.schema)
+        self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def __is_parquet(path: Path) -> bool:
+    return path.suffix.lower() in (".parquet", ".pq")
+
+
+def __import_parquet():
+    try:
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError(
+            "Parquet files require pyarrow, install it with "
+            "'pip install netto[parquet]'"
+        ) from error
+    return pyarrow.parquet
@@ -0,0 +1,400 @@
+"""
+Precomputed, memory-mapped net income tables for whole-euro salaries.
+
+A table holds the `calc_netto_detailed` breakdown of every whole-euro gross
+salary from 0 to ``max_salary`` for one configuration, as int32 cents in one
+contiguous column per field. `NettoTable` maps the file read-only and looks
+values up without copying, so processes that open the same file share its
+pages through the page cache. Salaries that are not whole euros, lie outside
+the table or come with deductibles are calculated instead.
+
+``net``, ``social_security``, ``soli``, ``church_tax``, ``taxable_income`` and
+``deductible_social_security`` are exact; ``income_tax`` and the four
+contributions are stored rounded to the cent.
+
+Tables store the configuration and the hash of the tax data they were built
+from, and are rejected once the data changes. Build one ahead of time with::
+
+    python -m netto.lookup --year 2025 --married [--max-salary 300000] [path]
+
+Examples
+--------
+>>> table = load_table(TaxConfig(year=2025))
+>>> table.netto(50000)
+>>> table.netto_array([42000, 50000.5, 1_000_000])
+>>> table.breakdown(50000).income_tax
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from dataclasses import fields
+from functools import cache
+from pathlib import Path
+
+import numpy as np
+
+from netto.config import DEFAULT_CONFIG, FrozenTaxConfig, TaxConfig, intern_config
+from netto.main import (
+    NettoResult,
+    calc_netto,
+    calc_netto_array,
+    calc_netto_detailed,
+    calc_netto_detailed_array,
+)
+from netto.snapshot import default_path as snapshot_path
+from netto.snapshot import source_hash
+
+MAGIC = b"NETTOLUT"
+VERSION = 1
+# Stored fields in file order; the gross salary is the row index
+COLUMNS = tuple(field.name for field in fields(NettoResult) if field.name != "gross")
+# Largest salary whose cents still fit the int32 columns
+MAX_SALARY = (2**31 - 1) // 100
+
+# Referenced from the class body, so not double-underscore (name mangling)
+_HEADER = struct.Struct("<8sH32si??ddIH")
+# Columns start on a cache line boundary
+_DATA_OFFSET = 128
+# Whole euros, returned as int like `calc_netto_detailed` does
+_EURO_COLUMNS = ("deductible_social_security", "taxable_income")
+__CHUNK_SIZE = 1 << 18
+
+
+def default_path(config: TaxConfig | None = None, max_salary: int = 300_000) -> Path:
+    """Return the table location next to the data snapshot."""
+    config = intern_config(config)
+    name = (
+        f"netto-{config.year}-married{int(config.is_married)}"
+        f"-children{int(config.has_children)}-ehi{config.extra_health_insurance}"
+        f"-church{config.church_tax}-{max_salary}.bin"
+    )
+    return snapshot_path().parent / name
+
+
+def build_table(
+    config: TaxConfig | None = None,
+    max_salary: int = 300_000,
+    path: str | Path | None = None,
+) -> Path:
+    """
+    Calculate the breakdown of every whole-euro salary and write a table.
+
+    Parameters
+    ----------
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+    max_salary : int, optional
+        Largest tabulated salary in euros, at most `MAX_SALARY` (default is
+        300,000)
+    path : str or Path, optional
+        Target file (default is `default_path`)
+
+    Returns
+    -------
+    Path
+        The written file
+    """
+    config = intern_config(config)
+    if not 0 <= max_salary <= MAX_SALARY:
+        raise ValueError(
+            f"max_salary must be between 0 and {MAX_SALARY}, got {max_salary}"
+        )
+    path = default_path(config, max_salary) if path is None else Path(path)
+    rows = max_salary + 1
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so readers never see a partial table
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        source_hash(),
+        config.year,
+        config.has_children,
+        config.is_married,
+        config.extra_health_insurance,
+        config.church_tax,
+        max_salary,
+        len(COLUMNS),
+    )
+    with open(temporary, "wb") as f:
+        f.write(header.ljust(_DATA_OFFSET, b"\0"))
+    table = np.memmap(
+        temporary,
+        dtype="<i4",
+        mode="r+",
+        offset=_DATA_OFFSET,
+        shape=(len(COLUMNS), rows),
+    )
+    for start in range(0, rows, __CHUNK_SIZE):
+        stop = min(start + __CHUNK_SIZE, rows)
+        salaries = np.arange(start, stop, dtype=np.float64)
+        results = calc_netto_detailed_array(salaries, config=config)
+        for i, name in enumerate(COLUMNS):
+            table[i, start:stop] = np.rint(results[name] * 100)
+    table.flush()
+    del table
+    os.replace(temporary, path)
+    return path
+
+
+class NettoTable:
+    """
+    Read-only, memory-mapped lookup table for one configuration.
+
+    Parameters
+    ----------
+    path : str or Path
+        Table written by `build_table`
+
+    Raises
+    ------
+    ValueError
+        If the file is not a table of this version or was built from
+        different tax data
+
+    Attributes
+    ----------
+    config : FrozenTaxConfig
+        Configuration the table was built for
+    max_salary : int
+        Largest tabulated salary
+    """
+
+    __slots__ = ("path", "config", "max_salary", "_mmap", "_net", "_columns")
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (
+                magic,
+                version,
+                stored_hash,
+                year,
+                has_children,
+                is_married,
+                extra_health_insurance,
+                church_tax,
+                max_salary,
+                columns,
+            ) = _HEADER.unpack_from(self._mmap)
+        except struct.error as error:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a netto table") from error
+        rows = max_salary + 1
+        if (
+            magic != MAGIC
+            or version != VERSION
+            or columns != len(COLUMNS)
+            or len(self._mmap) != _DATA_OFFSET + 4 * columns * rows
+        ):
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a netto table of version {VERSION}")
+        if stored_hash != source_hash():
+            self._mmap.close()
+            raise ValueError(f"{self.path} was built from different tax data")
+
+        self.config = intern_config(
+            FrozenTaxConfig(
+                year=year,
+                has_children=has_children,
+                is_married=is_married,
+                extra_health_insurance=extra_health_insurance,
+                church_tax=church_tax,
+            )
+        )
+        self.max_salary = max_salary
+        # Zero-copy views: a memoryview for fast scalar indexing and one
+        # read-only array per column
+        net_start = _DATA_OFFSET + 4 * rows * COLUMNS.index("net")
+        self._net = memoryview(self._mmap)[net_start : net_start + 4 * rows].cast("i")
+        self._columns = {
+            name: np.frombuffer(
+                self._mmap, dtype="<i4", count=rows, offset=_DATA_OFFSET + 4 * rows * i
+            )
+            for i, name in enumerate(COLUMNS)
+        }
+
+    def __enter__(self) -> "NettoTable":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"NettoTable({str(self.path)!r}, max_salary={self.max_salary})"
+
+    def close(self) -> None:
+        """
+        Release the mapping.
+
+        If arrays returned by `column` are still referenced, the mapping is
+        released once the last of them is garbage collected instead.
+        """
+        self._net.release()
+        self._columns.clear()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def column(self, name: str) -> np.ndarray:
+        """Return the read-only int32 cent column of a `COLUMNS` field."""
+        return self._columns[name]
+
+    def netto(self, salary: float, deductibles: float = 0) -> float:
+        """
+        Return the net income, like `calc_netto` with the table's config.
+
+        Parameters
+        ----------
+        salary : float
+            Yearly gross salary
+        deductibles : float, optional
+            Additional deductibles; anything but 0 is calculated
+
+        Returns
+        -------
+        float
+            Net income
+        """
+        if deductibles == 0 and 0 <= salary <= self.max_salary:
+            index = int(salary)
+            if index == salary:
+                return self._net[index] / 100
+        return calc_netto(salary, deductibles, config=self.config)
+
+    def netto_array(self, salaries, deductibles=0) -> np.ndarray:
+        """
+        Return net incomes, like `calc_netto_array` with the table's config.
+
+        Parameters
+        ----------
+        salaries : array_like
+            Yearly gross salaries
+        deductibles : array_like, optional
+            Additional deductibles per element or for all elements
+
+        Returns
+        -------
+        numpy.ndarray
+            Net incomes in the shape of ``salaries``
+        """
+        salaries = np.asarray(salaries, dtype=np.float64)
+        deductibles = np.broadcast_to(
+            np.asarray(deductibles, dtype=np.float64), salaries.shape
+        )
+        in_range = (salaries >= 0) & (salaries <= self.max_salary)
+        index = np.where(in_range, salaries, 0).astype(np.int64)
+        hit = in_range & (index == salaries) & (deductibles == 0)
+
+        net = np.empty(salaries.shape)
+        net[hit] = self._columns["net"][index[hit]] / 100
+        miss = ~hit
+        if miss.any():
+            net[miss] = calc_netto_array(
+                salaries[miss], deductibles[miss], config=self.config
+            )
+        return net
+
+    def breakdown(self, salary: float, deductibles: float = 0) -> NettoResult:
+        """
+        Return the breakdown, like `calc_netto_detailed` with the table's config.
+
+        Fields that are not whole cents in the calculation are rounded to
+        the cent, see the module documentation.
+        """
+        if deductibles == 0 and 0 <= salary <= self.max_salary:
+            index = int(salary)
+            if index == salary:
+                return NettoResult(
+                    gross=salary,
+                    **{
+                        name: int(column[index]) // 100
+                        if name in _EURO_COLUMNS
+                        else int(column[index]) / 100
+                        for name, column in self._columns.items()
+                    },
+                )
+        return calc_netto_detailed(salary, deductibles, config=self.config)
+
+
+def load_table(
+    config: TaxConfig | None = None,
+    max_salary: int = 300_000,
+    path: str | Path | None = None,
+) -> NettoTable:
+    """
+    Open the table for a configuration, building it if missing or stale.
+
+    Tables are opened once per process and path and shared by all callers,
+    so they should not be closed.
+
+    Parameters
+    ----------
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+    max_salary : int, optional
+        Largest tabulated salary in euros (default is 300,000)
+    path : str or Path, optional
+        Table file (default is `default_path`)
+
+    Returns
+    -------
+    NettoTable
+        The opened table
+    """
+    config = intern_config(config)
+    path = default_path(config, max_salary) if path is None else Path(path)
+    return __load(config, max_salary, path)
+
+
+@cache
+def __load(config: FrozenTaxConfig, max_salary: int, path: Path) -> NettoTable:
+    try:
+        table = NettoTable(path)
+    except (OSError, ValueError):
+        build_table(config, max_salary, path)
+        return NettoTable(path)
+    if table.config != config or table.max_salary != max_salary:
+        table.close()
+        build_table(config, max_salary, path)
+        return NettoTable(path)
+    return table
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Build a table from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m netto.lookup", description="Build a netto lookup table."
+    )
+    parser.add_argument("path", nargs="?", type=Path)
+    parser.add_argument("--year", type=int, default=DEFAULT_CONFIG.year)
+    parser.add_argument("--married", action="store_true")
+    parser.add_argument("--children", action="store_true")
+    parser.add_argument("--church-tax", type=float, default=DEFAULT_CONFIG.church_tax)
+    parser.add_argument(
+        "--extra-health-insurance",
+        type=float,
+        default=DEFAULT_CONFIG.extra_health_insurance,
+    )
+    parser.add_argument("--max-salary", type=int, default=300_000)
+    args = parser.parse_args(argv)
+
+    config = TaxConfig(
+        year=args.year,
+        has_children=args.children,
+        is_married=args.married,
+        extra_health_insurance=args.extra_health_insurance,
+        church_tax=args.church_tax,
+    )
+    path = build_table(config, args.max_salary, args.path)
+    print(f"Wrote table to {path}")
+
+
+if __name__ == "__main__":
+    main()
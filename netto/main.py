@@ -1,9 +1,51 @@
-from scipy.optimize import newton
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import perf_counter
 
-from netto.config import TaxConfig
-from netto.social_security import calc_deductible_social_security, calc_social_security
-from netto.taxes_income import calc_income_tax_by_integration, calc_taxable_income
-from netto.taxes_other import calc_church_tax, calc_soli
+import numpy as np
+
+from netto import cache, instrumentation
+from netto.config import DEFAULT_CONFIG, FrozenTaxConfig, TaxConfig, intern_config
+from netto.data_loader import correction_factor_pensions
+from netto.rounding import round_array
+from netto.segments import find_net_segment, get_net_segments
+from netto.social_security import (
+    calc_deductible_social_security_array,
+    calc_insurance_health,
+    calc_insurance_health_array,
+    calc_insurance_health_deductable,
+    calc_insurance_nursing,
+    calc_insurance_nursing_array,
+    calc_insurance_pension,
+    calc_insurance_pension_array,
+    calc_insurance_unemployment,
+    calc_insurance_unemployment_array,
+    calc_social_security_array,
+)
+from netto.solvers import BracketedRoot, bracketed_root, secant
+from netto.taxes_income import (
+    calc_income_tax_analytic,
+    calc_income_tax_analytic_array,
+    calc_taxable_income,
+    calc_taxable_income_array,
+)
+from netto.taxes_other import (
+    calc_church_tax,
+    calc_church_tax_array,
+    calc_soli,
+    calc_soli_array,
+)
+
+# Sentinel for cache misses
+_MISSING = object()
+
+# Largest whole-euro gross salary in the grids of `get_netto_grid`
+GRID_MAX_SALARY = 300_000
+
+# Most recently used grids by interned config and deductibles
+__NETTO_GRIDS: OrderedDict[tuple, np.ndarray] = OrderedDict()
+__NETTO_GRIDS_SIZE = 16
 
 
 def calc_netto(
@@ -31,6 +73,10 @@ def calc_netto(
     float
         Net income
 
+    Notes
+    -----
+    Results are memoized while caching is enabled, see `netto.cache`.
+
     Examples
     --------
     >>> calc_netto(50000)
@@ -40,38 +86,305 @@ def calc_netto(
     >>> calc_netto(50000, config=config)
     """
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
 
-    deductible_social_security = calc_deductible_social_security(salary, config)
-    taxable_income = calc_taxable_income(
-        salary=salary,
-        deductible_social_security=deductible_social_security,
-        deductibles_other=deductibles,
-    )
-    income_tax = calc_income_tax_by_integration(taxable_income, config)
+    result_cache = cache.active_cache
+    if result_cache is None or verbose:
+        return __calc_netto(salary, deductibles, verbose, config)
+
+    salary = round(salary, 2)
+    deductibles = round(deductibles, 2)
+    key = ("netto", salary, deductibles, intern_config(config))
+    netto = result_cache.get(key, _MISSING)
+    if netto is _MISSING:
+        netto = __calc_netto(salary, deductibles, False, config)
+        result_cache.put(key, netto)
+    return netto
+
+
+def __calc_netto(
+    salary: float, deductibles: float, verbose: bool, config: TaxConfig
+) -> float:
+    result = __calc_netto_detailed(salary, deductibles, config)
     if verbose:
         repr = (
             "Yearly Evaluation:\n"
-            + f"Income Tax:      {round(income_tax, 2):>12}\n"
-            + f"Soli:            {round(calc_soli(income_tax, config), 2):>12}\n"
-            + f"Church Tax:      {round(calc_church_tax(income_tax, config), 2):>12}\n"
-            + f"Social Security: {round(calc_social_security(salary, config), 2):>12}"
+            + f"Income Tax:      {round(result.income_tax, 2):>12}\n"
+            + f"Soli:            {round(result.soli, 2):>12}\n"
+            + f"Church Tax:      {round(result.church_tax, 2):>12}\n"
+            + f"Social Security: {round(result.social_security, 2):>12}"
         )
         print(repr)
-    return round(
+    return result.net
+
+
+@dataclass(frozen=True, slots=True)
+class NettoResult:
+    """
+    Breakdown of a net income calculation.
+
+    Attributes
+    ----------
+    gross : float
+        Yearly gross salary
+    deductible_social_security : float
+        Social security contributions deductible from taxable income
+    taxable_income : float
+        Taxable income
+    income_tax : float
+        Income tax
+    soli : float
+        Solidarity tax
+    church_tax : float
+        Church tax
+    pension : float
+        Pension insurance contribution
+    health : float
+        Health insurance contribution
+    nursing : float
+        Nursing insurance contribution
+    unemployment : float
+        Unemployment insurance contribution
+    social_security : float
+        Total social security contributions
+    net : float
+        Net income, identical to `calc_netto`
+    """
+
+    gross: float
+    deductible_social_security: float
+    taxable_income: float
+    income_tax: float
+    soli: float
+    church_tax: float
+    pension: float
+    health: float
+    nursing: float
+    unemployment: float
+    social_security: float
+    net: float
+
+
+def calc_netto_detailed(
+    salary: float, deductibles: float = 0, config: TaxConfig | None = None
+) -> NettoResult:
+    """
+    Calculate net income from gross salary with a full breakdown.
+
+    Every intermediate value is computed exactly once.
+
+    Parameters
+    ----------
+    salary: float
+        Yearly gross salary
+    deductibles: float, optional
+        Additional deductibles that reduce taxable income
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+
+    Returns
+    -------
+    NettoResult
+        Taxes, contributions and net income
+
+    Examples
+    --------
+    >>> result = calc_netto_detailed(50000)
+    >>> result.net == calc_netto(50000)
+    True
+    >>> result.income_tax, result.social_security
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    return __calc_netto_detailed(salary, deductibles, config)
+
+
+def __calc_netto_detailed(
+    salary: float, deductibles: float, config: TaxConfig
+) -> NettoResult:
+    recorder = instrumentation.active_recorder
+    if recorder is not None:
+        recorder.netto_calls += 1
+        start = perf_counter()
+
+    pension = calc_insurance_pension(salary, config)
+    health = calc_insurance_health(salary, config)
+    nursing = calc_insurance_nursing(salary, config)
+    unemployment = calc_insurance_unemployment(salary, config)
+    social_security = round(pension + health + nursing + unemployment, 2)
+
+    # Same terms as calc_deductible_social_security, reusing the contributions
+    deductible_social_security = (
+        math.ceil(pension * correction_factor_pensions[config.year])
+        + math.ceil(calc_insurance_health_deductable(salary, config))
+        + math.ceil(nursing)
+    )
+    if recorder is not None:
+        start = __lap(recorder, "social_security", start)
+    taxable_income = calc_taxable_income(
+        salary=salary,
+        deductible_social_security=deductible_social_security,
+        deductibles_other=deductibles,
+    )
+    if recorder is not None:
+        start = __lap(recorder, "taxable_income", start)
+    income_tax = calc_income_tax_analytic(taxable_income, config)
+    if recorder is not None:
+        start = __lap(recorder, "income_tax", start)
+    soli = calc_soli(income_tax, config)
+    if recorder is not None:
+        start = __lap(recorder, "soli", start)
+    church_tax = calc_church_tax(income_tax, config)
+    if recorder is not None:
+        __lap(recorder, "church_tax", start)
+    return NettoResult(
+        gross=salary,
+        deductible_social_security=deductible_social_security,
+        taxable_income=taxable_income,
+        income_tax=income_tax,
+        soli=soli,
+        church_tax=church_tax,
+        pension=pension,
+        health=health,
+        nursing=nursing,
+        unemployment=unemployment,
+        social_security=social_security,
+        net=round(salary - income_tax - soli - church_tax - social_security, 2),
+    )
+
+
+def __lap(recorder: instrumentation.Recorder, stage: str, start: float) -> float:
+    now = perf_counter()
+    recorder.stage_seconds[stage] += now - start
+    return now
+
+
+def calc_netto_array(
+    salaries, deductibles=0, config: TaxConfig | None = None
+) -> np.ndarray:
+    """
+    Calculate net income for an array of gross salaries.
+
+    Vectorized counterpart of `calc_netto`: runs the whole chain on NumPy
+    arrays and returns the same values elementwise, including all rounding.
+
+    Parameters
+    ----------
+    salaries: array_like
+        Yearly gross salaries
+    deductibles: array_like, optional
+        Additional deductibles that reduce taxable income, either one value
+        for all salaries or one per salary
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+
+    Returns
+    -------
+    numpy.ndarray
+        Net incomes
+
+    Examples
+    --------
+    >>> calc_netto_array([30000, 50000, 70000])
+    >>> calc_netto_array(np.arange(0, 200000, 1000), deductibles=2000)
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    salaries = np.asarray(salaries, dtype=np.float64)
+    deductibles = np.asarray(deductibles, dtype=np.float64)
+
+    deductible_social_security = calc_deductible_social_security_array(salaries, config)
+    taxable_income = calc_taxable_income_array(
+        salary=salaries,
+        deductible_social_security=deductible_social_security,
+        deductibles_other=deductibles,
+    )
+    income_tax = calc_income_tax_analytic_array(taxable_income, config)
+    return round_array(
         (
-            salary
+            salaries
             - income_tax
-            - calc_soli(income_tax, config)
-            - calc_church_tax(income_tax, config)
-            - calc_social_security(salary, config)
+            - calc_soli_array(income_tax, config)
+            - calc_church_tax_array(income_tax, config)
+            - calc_social_security_array(salaries, config)
         ),
         2,
     )
 
 
+def calc_netto_detailed_array(
+    salaries, deductibles=0, config: TaxConfig | None = None
+) -> dict[str, np.ndarray]:
+    """
+    Calculate net incomes with a full breakdown for an array of gross salaries.
+
+    Vectorized counterpart of `calc_netto_detailed`.
+
+    Parameters
+    ----------
+    salaries: array_like
+        Yearly gross salaries
+    deductibles: array_like, optional
+        Additional deductibles that reduce taxable income, either one value
+        for all salaries or one per salary
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+
+    Returns
+    -------
+    dict
+        One array per `NettoResult` field, in field order; ``"net"`` equals
+        `calc_netto_array`
+
+    Examples
+    --------
+    >>> calc_netto_detailed_array([30000, 50000])["income_tax"]
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    salaries = np.asarray(salaries, dtype=np.float64)
+    deductibles = np.asarray(deductibles, dtype=np.float64)
+
+    pension = calc_insurance_pension_array(salaries, config)
+    health = calc_insurance_health_array(salaries, config)
+    nursing = calc_insurance_nursing_array(salaries, config)
+    unemployment = calc_insurance_unemployment_array(salaries, config)
+    social_security = round_array(pension + health + nursing + unemployment, 2)
+    deductible_social_security = calc_deductible_social_security_array(salaries, config)
+    taxable_income = calc_taxable_income_array(
+        salary=salaries,
+        deductible_social_security=deductible_social_security,
+        deductibles_other=deductibles,
+    )
+    income_tax = calc_income_tax_analytic_array(taxable_income, config)
+    soli = calc_soli_array(income_tax, config)
+    church_tax = calc_church_tax_array(income_tax, config)
+    return {
+        "gross": salaries,
+        "deductible_social_security": deductible_social_security,
+        "taxable_income": taxable_income,
+        "income_tax": income_tax,
+        "soli": soli,
+        "church_tax": church_tax,
+        "pension": pension,
+        "health": health,
+        "nursing": nursing,
+        "unemployment": unemployment,
+        "social_security": social_security,
+        "net": round_array(
+            salaries - income_tax - soli - church_tax - social_security, 2
+        ),
+    }
+
+
 def calc_inverse_netto(
-    desired_netto: float, deductibles: float = 0, config: TaxConfig | None = None
+    desired_netto: float,
+    deductibles: float = 0,
+    config: TaxConfig | None = None,
+    method: str = "newton",
 ) -> float:
     """
     Calculate required gross salary to reach desired net income.
@@ -84,25 +397,335 @@ def calc_inverse_netto(
         Additional deductibles that reduce taxable income
     config : TaxConfig, optional
         Tax configuration (uses defaults if not provided)
+    method : str, optional
+        ``"newton"`` runs the secant variant of Newton's method on
+        `calc_netto` (see `netto.solvers.secant`). ``"analytic"``
+        solves the closed-form net income segment containing the target and
+        returns the smallest whole-euro gross salary whose net income reaches
+        ``desired_netto``. ``"grid"`` returns the same salary by binary search
+        in the whole-euro grid of `get_netto_grid`. Only the grid without
+        deductibles is built on demand; other deductibles and targets beyond
+        the grid use ``"analytic"`` unless their grid is already cached.
 
     Returns
     -------
     float
         Required gross salary
 
+    Notes
+    -----
+    Results are memoized while caching is enabled, see `netto.cache`.
+
     Examples
     --------
     >>> calc_inverse_netto(50000)
     >>> calc_inverse_netto(50000, deductibles=5000)
+    >>> calc_inverse_netto(50000, method="analytic")
+    >>> calc_inverse_netto(50000, method="grid")
     >>> config = TaxConfig(year=2025, is_married=True)
     >>> calc_inverse_netto(50000, config=config)
     """
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
+
+    result_cache = cache.active_cache
+    if result_cache is None:
+        return __calc_inverse_netto(desired_netto, deductibles, config, method)
+
+    desired_netto = round(desired_netto, 2)
+    deductibles = round(deductibles, 2)
+    key = ("inverse", desired_netto, deductibles, intern_config(config), method)
+    gross = result_cache.get(key, _MISSING)
+    if gross is _MISSING:
+        gross = __calc_inverse_netto(desired_netto, deductibles, config, method)
+        result_cache.put(key, gross)
+    return gross
+
+
+def __calc_inverse_netto(
+    desired_netto: float, deductibles: float, config: TaxConfig, method: str
+) -> float:
+    recorder = instrumentation.active_recorder
+    if recorder is None:
+        return __solve_inverse_netto(desired_netto, deductibles, config, method)
+
+    netto_calls = recorder.netto_calls
+    iterations = recorder.solver_iterations
+    start = perf_counter()
+    try:
+        return __solve_inverse_netto(desired_netto, deductibles, config, method)
+    finally:
+        recorder.inverse_calls += 1
+        recorder.inverse.append(
+            instrumentation.InverseRecord(
+                desired_netto=desired_netto,
+                deductibles=deductibles,
+                year=config.year,
+                method=method,
+                iterations=recorder.solver_iterations - iterations,
+                netto_calls=recorder.netto_calls - netto_calls,
+                seconds=perf_counter() - start,
+            )
+        )
+
+
+def __solve_inverse_netto(
+    desired_netto: float, deductibles: float, config: TaxConfig, method: str
+) -> float:
+    if method == "grid":
+        return __calc_inverse_netto_grid(desired_netto, deductibles, config)
+    if method == "analytic":
+        return __calc_inverse_netto_analytic(desired_netto, deductibles, config)
+    if method != "newton":
+        raise ValueError(
+            f"method must be 'newton', 'analytic' or 'grid', got {method!r}"
+        )
 
     def f(salary):
-        return (
-            calc_netto(salary, deductibles=deductibles, config=config) - desired_netto
+        return __calc_netto(salary, deductibles, False, config) - desired_netto
+
+    return round(secant(f, x0=desired_netto), 0)
+
+
+def __calc_inverse_netto_analytic(
+    desired_netto: float, deductibles: float, config: TaxConfig
+) -> float:
+    if desired_netto <= 0:
+        return 0.0
+
+    segments = get_net_segments(config, deductibles)
+    salary = find_net_segment(segments, desired_netto).solve(desired_netto)
+
+    # The segments ignore euro and cent rounding, which moves the net income
+    # by a few euros at most; step to the exact whole-euro answer
+    gross = math.ceil(salary)
+    while __calc_netto(gross, deductibles, False, config) < desired_netto:
+        gross += 1
+    while (
+        gross > 0
+        and __calc_netto(gross - 1, deductibles, False, config) >= desired_netto
+    ):
+        gross -= 1
+    return float(gross)
+
+
+def __calc_inverse_netto_grid(
+    desired_netto: float, deductibles: float, config: TaxConfig
+) -> float:
+    if desired_netto <= 0:
+        return 0.0
+    grid = __find_netto_grid(config, deductibles)
+    if grid is None or desired_netto > grid[-1]:
+        return __calc_inverse_netto_analytic(desired_netto, deductibles, config)
+    # The grid is nondecreasing, so the first entry reaching the target is the
+    # smallest whole-euro gross salary whose net income reaches it
+    return float(grid.searchsorted(desired_netto))
+
+
+def get_netto_grid(
+    config: TaxConfig | None = None, deductibles: float = 0
+) -> np.ndarray:
+    """
+    Return the net income of every whole-euro gross salary.
+
+    The 16 most recently used grids are cached per interned configuration
+    and deductibles. Building one evaluates `calc_netto_array` on 300,001
+    salaries.
+
+    Parameters
+    ----------
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+    deductibles : float, optional
+        Additional deductibles that reduce taxable income
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only net incomes indexed by gross salaries from 0 to
+        `GRID_MAX_SALARY` euros
+    """
+    key = (intern_config(config), float(deductibles))
+    grid = __NETTO_GRIDS.get(key)
+    if grid is None:
+        grid = __build_netto_grid(*key)
+        if len(__NETTO_GRIDS) >= __NETTO_GRIDS_SIZE:
+            __NETTO_GRIDS.popitem(last=False)
+        __NETTO_GRIDS[key] = grid
+    else:
+        __NETTO_GRIDS.move_to_end(key)
+    return grid
+
+
+def __find_netto_grid(config: TaxConfig, deductibles: float) -> np.ndarray | None:
+    # Grids with deductibles are only used once built, as building one costs
+    # as much as hundreds of analytic inverses
+    if deductibles == 0:
+        return get_netto_grid(config, 0)
+    key = (intern_config(config), float(deductibles))
+    grid = __NETTO_GRIDS.get(key)
+    if grid is not None:
+        __NETTO_GRIDS.move_to_end(key)
+    return grid
+
+
+def __build_netto_grid(config: FrozenTaxConfig, deductibles: float) -> np.ndarray:
+    salaries = np.arange(GRID_MAX_SALARY + 1, dtype=np.float64)
+    grid = calc_netto_array(salaries, deductibles, config)
+    grid.setflags(write=False)
+    return grid
+
+
+def calc_inverse_netto_array(
+    desired_netto,
+    deductibles=0,
+    config: TaxConfig | None = None,
+    xtol: float = 0.01,
+    maxiter: int = 100,
+    full_output: bool = False,
+    method: str = "bracket",
+) -> np.ndarray | tuple[np.ndarray, BracketedRoot]:
+    """
+    Calculate required gross salaries for an array of desired net incomes.
+
+    Vectorized counterpart of `calc_inverse_netto`. All targets are solved at
+    once with bracketed Illinois root finding on `calc_netto_array`, which
+    always converges on the kinks and steps of the net income curve.
+
+    Parameters
+    ----------
+    desired_netto: array_like
+        Desired net incomes; targets of zero or less give a gross of zero
+    deductibles: array_like, optional
+        Additional deductibles that reduce taxable income, either one value
+        for all targets or one per target
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+    xtol : float, optional
+        Bracket width in euros at which a target counts as solved
+    maxiter : int, optional
+        Maximum number of iterations
+    full_output : bool, optional
+        Also return the `BracketedRoot` with per-element convergence flags and
+        iteration counts (``method="bracket"`` only)
+    method : str, optional
+        ``"bracket"`` rounds the bracketed root to whole euros. ``"grid"``
+        returns the smallest whole-euro gross salary whose net income reaches
+        the target, like ``calc_inverse_netto(..., method="grid")``, by binary
+        search in the grids of `get_netto_grid`. Targets beyond the grid and
+        deductibles other than 0 without a cached grid are bracketed and
+        stepped to that salary instead.
+
+    Returns
+    -------
+    numpy.ndarray or tuple
+        Required gross salaries in whole euros, and the solver result if
+        ``full_output`` is set
+
+    Examples
+    --------
+    >>> calc_inverse_netto_array([20000, 35000, 50000])
+    >>> gross, info = calc_inverse_netto_array([20000, 35000], full_output=True)
+    >>> info.converged.all()
+    >>> calc_inverse_netto_array([20000, 35000, 50000], method="grid")
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    desired_netto = np.array(desired_netto, dtype=np.float64, ndmin=1)
+    deductibles = np.broadcast_to(
+        np.asarray(deductibles, dtype=np.float64), desired_netto.shape
+    )
+    if method == "grid":
+        if full_output:
+            raise ValueError("full_output requires method='bracket'")
+        return __calc_inverse_netto_grid_array(
+            desired_netto, deductibles, config, xtol, maxiter
+        )
+    if method != "bracket":
+        raise ValueError(f"method must be 'bracket' or 'grid', got {method!r}")
+    targets = np.maximum(desired_netto, 0)
+
+    def f(salaries, index):
+        return calc_netto_array(salaries, deductibles[index], config) - targets[index]
+
+    # Net income never exceeds gross, so the target itself is a lower bound
+    lower = targets.copy()
+    solved = f(lower, np.arange(lower.size)) >= 0
+    upper = 2.5 * targets + 1000
+    short = np.flatnonzero(~solved)
+    while short.size:
+        too_low = f(upper[short], short) < 0
+        short = short[too_low]
+        upper[short] *= 2
+
+    unsolved = np.flatnonzero(~solved)
+    result = bracketed_root(
+        lambda x, index: f(x, unsolved[index]),
+        lower[unsolved],
+        upper[unsolved],
+        xtol=xtol,
+        maxiter=maxiter,
+    )
+
+    root = lower.copy()
+    root[unsolved] = result.root
+    converged = np.ones(root.shape, dtype=bool)
+    converged[unsolved] = result.converged
+    iterations = np.zeros(root.shape, dtype=np.int64)
+    iterations[unsolved] = result.iterations
+
+    gross = round_array(root)
+    if full_output:
+        return gross, BracketedRoot(
+            root=root, converged=converged, iterations=iterations
         )
+    return gross
+
+
+def __calc_inverse_netto_grid_array(
+    desired_netto: np.ndarray,
+    deductibles: np.ndarray,
+    config: TaxConfig,
+    xtol: float,
+    maxiter: int,
+) -> np.ndarray:
+    targets = desired_netto.ravel()
+    all_deductibles = deductibles.ravel()
+    gross = np.zeros(targets.size)
 
-    return round(newton(f, x0=desired_netto), 0)
+    # Look up targets whose deductibles have a grid, bracket all others
+    unsolved = targets > 0
+    for value in np.unique(all_deductibles[unsolved]).tolist():
+        grid = __find_netto_grid(config, value)
+        if grid is None:
+            continue
+        index = np.flatnonzero(
+            unsolved & (all_deductibles == value) & (targets <= grid[-1])
+        )
+        gross[index] = grid.searchsorted(targets[index])
+        unsolved[index] = False
+
+    beyond = np.flatnonzero(unsolved)
+    if beyond.size:
+        target = targets[beyond]
+        beyond_deductibles = all_deductibles[beyond]
+
+        def reaches(salaries, index):
+            netto = calc_netto_array(salaries, beyond_deductibles[index], config)
+            return netto >= target[index]
+
+        # Step from the rounded root to the smallest sufficient whole euro
+        salary = calc_inverse_netto_array(
+            target, beyond_deductibles, config, xtol, maxiter
+        )
+        short = np.flatnonzero(~reaches(salary, np.arange(salary.size)))
+        while short.size:
+            salary[short] += 1
+            short = short[~reaches(salary[short], short)]
+        over = np.flatnonzero(reaches(salary - 1, np.arange(salary.size)))
+        while over.size:
+            salary[over] -= 1
+            over = over[reaches(salary[over] - 1, over)]
+        gross[beyond] = salary
+    return gross.reshape(desired_netto.shape)
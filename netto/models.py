@@ -0,0 +1,67 @@
+"""
+Pydantic models validating the JSON tax data files.
+
+Kept separate from `netto.data_loader` so that pydantic is only imported
+when data is actually validated, not when it is read from a snapshot.
+"""
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class TaxBracket(BaseModel):
+    step: float = Field(gt=0, description="Income threshold for this bracket")
+    rate: float = Field(ge=0, le=1, description="Tax rate for this bracket")
+    const: list[float] | None = Field(
+        default=None, description="Polynomial coefficients"
+    )
+
+    @field_validator("const")
+    @classmethod
+    def validate_const_length(cls, v, info):
+        if v is not None and len(v) == 0:
+            raise ValueError("const array cannot be empty")
+        return v
+
+
+class TaxCurve(BaseModel):
+    year: int = Field(ge=2018, le=2030, description="Tax year")
+    brackets: dict[str, TaxBracket] = Field(description="Tax brackets (0-3)")
+
+    @field_validator("brackets")
+    @classmethod
+    def validate_brackets(cls, v):
+        if set(v.keys()) != {"0", "1", "2", "3"}:
+            raise ValueError("Tax curve must have exactly 4 brackets (0-3)")
+        return v
+
+
+class SocialSecurityEntry(BaseModel):
+    limit: float = Field(gt=0, description="Income limit for this contribution")
+    rate: float = Field(ge=0, le=1, description="Contribution rate")
+    extra: float | None = Field(
+        default=None, ge=0, le=1, description="Extra rate (nursing only)"
+    )
+
+
+class SocialSecurity(BaseModel):
+    year: int = Field(ge=2018, le=2030, description="Tax year")
+    pension: SocialSecurityEntry
+    unemployment: SocialSecurityEntry
+    health: SocialSecurityEntry
+    nursing: SocialSecurityEntry
+
+
+class SoliCurve(BaseModel):
+    year: int = Field(ge=2018, le=2030, description="Tax year")
+    start_taxable_income: float = Field(
+        gt=0, description="Income threshold where soli starts"
+    )
+    start_fraction: float = Field(
+        ge=0, le=1, description="Starting fraction for progressive phase-in"
+    )
+    end_rate: float = Field(ge=0, le=1, description="Maximum soli rate")
+
+
+class PensionFactor(BaseModel):
+    year: int = Field(ge=2018, le=2030, description="Tax year")
+    factor: float = Field(ge=0, le=1, description="Pension deduction factor")
@@ -0,0 +1,226 @@
+"""
+Multiprocess execution of the vectorized calculations for very large inputs.
+
+Input and output live in shared memory: the parent copies salaries (or
+desired net incomes) and deductibles into shared buffers once, workers read
+their chunk from there and write results straight into a shared output
+buffer. Only chunk boundaries travel through the pool's pipes, and results
+end up in input order without pickling any arrays.
+
+Workers are initialised once with the parameter tables of the configuration
+and can be reused across calls with `NettoPool`.
+
+Examples
+--------
+>>> import numpy as np
+>>> salaries = np.random.default_rng(0).uniform(20000, 120000, 50_000_000)
+>>> net = map_netto(salaries, workers=8)
+>>> with NettoPool(workers=8) as pool:
+...     net = pool.map_netto(salaries)
+...     gross = pool.map_netto(net, inverse=True)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from netto.config import FrozenTaxConfig, TaxConfig, intern_config
+from netto.main import calc_inverse_netto_array, calc_netto_array
+
+# Buffers attached in a worker process, keyed by shared memory name
+_attached: dict[str, shared_memory.SharedMemory] = {}
+
+
+class NettoPool:
+    """
+    Reusable pool of warm worker processes.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Number of worker processes (default is the number of CPUs)
+    config : TaxConfig, optional
+        Configuration whose parameter tables are loaded in every worker on
+        start-up (uses defaults if not provided)
+    """
+
+    __slots__ = ("workers", "_executor")
+
+    def __init__(self, workers: int | None = None, config: TaxConfig | None = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(intern_config(config),),
+        )
+
+    def __enter__(self) -> "NettoPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown()
+
+    def map_netto(
+        self,
+        values,
+        deductibles=0,
+        config: TaxConfig | None = None,
+        inverse: bool = False,
+        chunk_size: int = 250_000,
+    ) -> np.ndarray:
+        """
+        Calculate net incomes, or gross salaries, in parallel chunks.
+
+        Parameters
+        ----------
+        values : array_like
+            Yearly gross salaries, or desired net incomes if ``inverse``
+        deductibles : array_like, optional
+            Additional deductibles per element or for all elements
+        config : TaxConfig, optional
+            Tax configuration (uses defaults if not provided)
+        inverse : bool, optional
+            Solve for gross salaries with `calc_inverse_netto_array` instead
+            of calculating net incomes with `calc_netto_array`
+        chunk_size : int, optional
+            Number of elements per task
+
+        Returns
+        -------
+        numpy.ndarray
+            One-dimensional results in input order
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        values = np.ravel(np.asarray(values, dtype=np.float64))
+        deductibles = np.asarray(deductibles, dtype=np.float64)
+        per_element = deductibles.ndim > 0
+        if per_element:
+            deductibles = np.ravel(np.broadcast_to(deductibles, values.shape))
+        config = intern_config(config)
+
+        # Input values, output and per-element deductibles (if any)
+        buffers = [
+            shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            for _ in range(3 if per_element else 2)
+        ]
+        try:
+            _as_array(buffers[0], values.size)[:] = values
+            if per_element:
+                _as_array(buffers[2], values.size)[:] = deductibles
+            names = tuple(buffer.name for buffer in buffers)
+            scalar_deductibles = None if per_element else float(deductibles)
+
+            futures = [
+                self._executor.submit(
+                    _run_chunk,
+                    names,
+                    values.size,
+                    start,
+                    min(start + chunk_size, values.size),
+                    scalar_deductibles,
+                    config,
+                    inverse,
+                )
+                for start in range(0, values.size, chunk_size)
+            ]
+            for future in futures:
+                future.result()
+            return _as_array(buffers[1], values.size).copy()
+        finally:
+            for buffer in buffers:
+                buffer.close()
+                buffer.unlink()
+
+
+def map_netto(
+    values,
+    deductibles=0,
+    config: TaxConfig | None = None,
+    inverse: bool = False,
+    workers: int | None = None,
+    chunk_size: int = 250_000,
+) -> np.ndarray:
+    """
+    Calculate net incomes, or gross salaries, on a temporary process pool.
+
+    Inputs that fit in a single chunk, or ``workers=1``, are calculated in
+    the calling process. Use `NettoPool` to keep workers warm across calls.
+
+    Parameters
+    ----------
+    values : array_like
+        Yearly gross salaries, or desired net incomes if ``inverse``
+    deductibles : array_like, optional
+        Additional deductibles per element or for all elements
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+    inverse : bool, optional
+        Solve for gross salaries instead of calculating net incomes
+    workers : int, optional
+        Number of worker processes (default is the number of CPUs)
+    chunk_size : int, optional
+        Number of elements per task
+
+    Returns
+    -------
+    numpy.ndarray
+        One-dimensional results in input order
+    """
+    values = np.ravel(np.asarray(values, dtype=np.float64))
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or values.size <= chunk_size:
+        deductibles = np.asarray(deductibles, dtype=np.float64)
+        if deductibles.ndim > 0:
+            deductibles = np.ravel(np.broadcast_to(deductibles, values.shape))
+        return _calculate(values, deductibles, intern_config(config), inverse)
+    with NettoPool(workers=workers, config=config) as pool:
+        return pool.map_netto(values, deductibles, config, inverse, chunk_size)
+
+
+def _init_worker(config: FrozenTaxConfig) -> None:
+    # Load the parameter tables once so that the first chunk is not slower
+    calc_netto_array(np.zeros(1), config=config)
+
+
+def _run_chunk(
+    names: tuple[str, ...],
+    size: int,
+    start: int,
+    stop: int,
+    deductibles: float | None,
+    config: FrozenTaxConfig,
+    inverse: bool,
+) -> None:
+    values, out, *per_element = (_as_array(buffer, size) for buffer in _attach(names))
+    if per_element:
+        deductibles = per_element[0][start:stop]
+    out[start:stop] = _calculate(values[start:stop], deductibles, config, inverse)
+
+
+def _calculate(
+    values: np.ndarray, deductibles, config: FrozenTaxConfig, inverse: bool
+) -> np.ndarray:
+    if inverse:
+        return calc_inverse_netto_array(values, deductibles, config)
+    return calc_netto_array(values, deductibles, config)
+
+
+def _attach(names: tuple[str, ...]) -> list[shared_memory.SharedMemory]:
+    # Buffers of earlier calls are no longer needed
+    for name in set(_attached) - set(names):
+        _attached.pop(name).close()
+    for name in names:
+        if name not in _attached:
+            _attached[name] = shared_memory.SharedMemory(name=name)
+    return [_attached[name] for name in names]
+
+
+def _as_array(buffer: shared_memory.SharedMemory, size: int) -> np.ndarray:
+    return np.ndarray((size,), dtype=np.float64, buffer=buffer.buf)
@@ -0,0 +1,118 @@
+"""
+Resolved calculation parameters per configuration.
+
+`get_parameters` looks up every rate, limit and factor that a configuration
+needs once and bundles them in a `TaxParameters` instance, which is shared by
+all identical configurations.
+"""
+
+from dataclasses import dataclass
+from functools import cache
+
+from netto.config import FrozenTaxConfig, TaxConfig, intern_config
+from netto.data_loader import (
+    correction_factor_pensions,
+    social_security_curve,
+    soli_curve,
+)
+from netto.taxes_income import CompiledTaxCurve, get_tax_curve
+
+
+@dataclass(frozen=True, slots=True)
+class TaxParameters:
+    """
+    All parameters needed to calculate net income for one configuration.
+
+    Insurance rates already include the configured extras (health surcharge,
+    nursing surcharge for the childless).
+
+    Attributes
+    ----------
+    config : FrozenTaxConfig
+        The interned configuration
+    tax_curve : CompiledTaxCurve
+        Compiled income tax curve for year and marital status
+    pension_rate, pension_limit : float
+        Pension insurance rate and contribution limit
+    unemployment_rate, unemployment_limit : float
+        Unemployment insurance rate and contribution limit
+    health_rate, health_limit : float
+        Health insurance rate and contribution limit
+    health_deductible_rate : float
+        Health insurance rate used for the deductible part
+    nursing_rate, nursing_limit : float
+        Nursing insurance rate and contribution limit
+    pension_factor : float
+        Deductible fraction of pension contributions
+    soli_start, soli_fraction, soli_rate : float
+        Soli threshold, phase-in fraction and full rate
+    church_tax : float
+        Church tax rate
+    """
+
+    config: FrozenTaxConfig
+    tax_curve: CompiledTaxCurve
+    pension_rate: float
+    pension_limit: float
+    unemployment_rate: float
+    unemployment_limit: float
+    health_rate: float
+    health_limit: float
+    health_deductible_rate: float
+    nursing_rate: float
+    nursing_limit: float
+    pension_factor: float
+    soli_start: float
+    soli_fraction: float
+    soli_rate: float
+    church_tax: float
+
+
+def get_parameters(config: TaxConfig | FrozenTaxConfig | None = None) -> TaxParameters:
+    """
+    Return the shared parameter bundle for a configuration.
+
+    Parameters
+    ----------
+    config : TaxConfig or FrozenTaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+
+    Returns
+    -------
+    TaxParameters
+        Resolved parameters, built once per distinct configuration
+
+    Examples
+    --------
+    >>> get_parameters(TaxConfig(year=2024)).pension_limit
+    90600
+    """
+    return __build_parameters(intern_config(config))
+
+
+@cache
+def __build_parameters(config: FrozenTaxConfig) -> TaxParameters:
+    social_security = social_security_curve[config.year]
+    soli = soli_curve[config.year]
+    extra_health = config.extra_health_insurance / 2
+    extra_nursing = 0 if config.has_children else social_security["nursing"]["extra"]
+    # Rates are summed exactly like in netto.social_security so results match
+    return TaxParameters(
+        config=config,
+        tax_curve=get_tax_curve(config.year, config.is_married),
+        pension_rate=social_security["pension"]["rate"],
+        pension_limit=social_security["pension"]["limit"],
+        unemployment_rate=social_security["unemployment"]["rate"],
+        unemployment_limit=social_security["unemployment"]["limit"],
+        health_rate=social_security["health"]["rate"] + extra_health,
+        health_limit=social_security["health"]["limit"],
+        health_deductible_rate=social_security["health"]["rate"]
+        + (extra_health - 0.003),
+        nursing_rate=social_security["nursing"]["rate"] + extra_nursing,
+        nursing_limit=social_security["nursing"]["limit"],
+        pension_factor=correction_factor_pensions[config.year],
+        soli_start=soli["start_taxable_income"],
+        soli_fraction=soli["start_fraction"],
+        soli_rate=soli["end_rate"],
+        church_tax=config.church_tax,
+    )
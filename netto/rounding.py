@@ -0,0 +1,51 @@
+"""
+Rounding helpers for the vectorized calculation paths.
+
+The scalar functions round with the builtin ``round()``, which rounds the
+exact decimal value of a float half to even. ``numpy.round`` scales by a
+power of ten first and can therefore disagree in the last digit for values
+that lie within a few ulps of a half. `round_array` uses numpy for the bulk
+and falls back to ``round()`` for those few ambiguous elements, so the array
+paths match the scalar paths exactly.
+"""
+
+import numpy as np
+
+
+def round_array(values, ndigits: int = 0) -> np.ndarray:
+    """
+    Round an array elementwise exactly like the builtin ``round()``.
+
+    Parameters
+    ----------
+    values : array_like
+        Values to round
+    ndigits : int, optional
+        Number of decimal digits (default is 0)
+
+    Returns
+    -------
+    numpy.ndarray
+        Rounded values as float64
+
+    Examples
+    --------
+    >>> round_array([2.675, 0.125, 1.5], 2)
+    array([2.67, 0.12, 1.5 ])
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if ndigits == 0:
+        return np.rint(values)
+
+    scale = 10.0**ndigits
+    scaled = values * scale
+    # np.asarray keeps zero-dimensional input an array rather than a scalar
+    rounded = np.asarray(np.rint(scaled) / scale)
+
+    # Scaling is exact to half an ulp, so only values this close to a half
+    # can end up on the wrong side
+    distance = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+    ambiguous = distance <= 2 * np.spacing(np.abs(scaled))
+    if ambiguous.any():
+        rounded[ambiguous] = [round(v, ndigits) for v in values[ambiguous].tolist()]
+    return rounded
@@ -0,0 +1,215 @@
+"""
+Piecewise closed-form representation of net income as a function of gross.
+
+Leaving out the euro and cent rounding, every quantity in the net income
+chain is piecewise polynomial in the gross salary: social security is linear
+up to the contribution limits, taxable income is therefore piecewise linear,
+income tax is piecewise quadratic in taxable income and soli switches between
+zero, a phase-in fraction and the full rate. Net income is thus quadratic
+between a handful of breakpoints, which makes it invertible in closed form.
+"""
+
+import math
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+
+from netto.config import FrozenTaxConfig, TaxConfig, intern_config
+from netto.parameters import get_parameters
+from netto.taxes_income import CompiledTaxCurve
+
+
+@dataclass(frozen=True, slots=True)
+class NetSegment:
+    """
+    Gross salary interval on which the unrounded net income is quadratic.
+
+    Attributes
+    ----------
+    start : float
+        Lower end of the interval
+    end : float
+        Upper end of the interval (``math.inf`` for the last segment)
+    coefficients : tuple
+        ``(c0, c1, c2)`` with net income ``c0 + c1 * g + c2 * g**2``
+    """
+
+    start: float
+    end: float
+    coefficients: tuple[float, float, float]
+
+    def evaluate(self, salary: float) -> float:
+        """Return the unrounded net income at ``salary``."""
+        c0, c1, c2 = self.coefficients
+        return c0 + (c1 + c2 * salary) * salary
+
+    def solve(self, netto: float) -> float:
+        """Return the gross salary within the segment that yields ``netto``."""
+        c0, c1, c2 = self.coefficients
+        # Root with positive slope, written to avoid cancellation for small c2
+        discriminant = max(c1 * c1 + 4 * c2 * (netto - c0), 0.0)
+        salary = 2 * (netto - c0) / (c1 + math.sqrt(discriminant))
+        return min(max(salary, self.start), self.end)
+
+
+class NetSegments(tuple):
+    """
+    Consecutive `NetSegment` instances with the net income at each start.
+
+    Attributes
+    ----------
+    starts : tuple of float
+        Unrounded net income at the start of each segment, ascending
+    """
+
+    def __new__(cls, segments):
+        self = super().__new__(cls, segments)
+        self.starts = tuple(segment.evaluate(segment.start) for segment in self)
+        return self
+
+
+def get_net_segments(
+    config: TaxConfig | None = None, deductibles: float = 0
+) -> NetSegments:
+    """
+    Return the quadratic segments of the unrounded net income curve.
+
+    Segments are cached per interned configuration and deductibles.
+
+    Parameters
+    ----------
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+    deductibles : float, optional
+        Additional deductibles that reduce taxable income
+
+    Returns
+    -------
+    NetSegments
+        Consecutive segments covering all gross salaries from zero upwards
+    """
+    return __build_net_segments(intern_config(config), deductibles)
+
+
+def find_net_segment(segments: NetSegments, netto: float) -> NetSegment:
+    """
+    Find the segment whose net income range contains ``netto``.
+
+    Parameters
+    ----------
+    segments : NetSegments
+        Segments as returned by `get_net_segments`
+    netto : float
+        Net income to look up
+
+    Returns
+    -------
+    NetSegment
+        The segment to solve for ``netto``
+    """
+    return segments[max(bisect_right(segments.starts, netto) - 1, 0)]
+
+
+@lru_cache(maxsize=256)
+def __build_net_segments(config: FrozenTaxConfig, deductibles: float) -> NetSegments:
+    parameters = get_parameters(config)
+    # (limit, contribution rate, deductible rate) per insurance
+    components = (
+        (
+            parameters.pension_limit,
+            parameters.pension_rate,
+            parameters.pension_rate * parameters.pension_factor,
+        ),
+        (parameters.unemployment_limit, parameters.unemployment_rate, 0.0),
+        (
+            parameters.health_limit,
+            parameters.health_rate,
+            parameters.health_deductible_rate,
+        ),
+        (parameters.nursing_limit, parameters.nursing_rate, parameters.nursing_rate),
+    )
+
+    def linear_parts(salary):
+        # Social security and taxable income as (slope, intercept) at salary
+        paid_slope = paid_intercept = deductible_slope = deductible_intercept = 0.0
+        for limit, rate, deductible_rate in components:
+            if salary < limit:
+                paid_slope += rate
+                deductible_slope += deductible_rate
+            else:
+                paid_intercept += rate * limit
+                deductible_intercept += deductible_rate * limit
+        return (
+            (paid_slope, paid_intercept),
+            (1 - deductible_slope, -deductible_intercept - 1236 - deductibles),
+        )
+
+    curve = parameters.tax_curve
+    church_tax = parameters.church_tax
+    soli_start = parameters.soli_start
+    soli_fraction = parameters.soli_fraction
+    soli_rate = parameters.soli_rate
+    soli_full = soli_start * soli_fraction / (soli_fraction - soli_rate)
+
+    # Breakpoints in taxable income, then mapped back to gross salary
+    taxable_breaks = list(curve.steps) + [
+        __invert_income_tax(curve, soli_start),
+        __invert_income_tax(curve, soli_full),
+    ]
+    limits = sorted({limit for limit, _, _ in components})
+    pieces = list(zip([0.0] + limits, limits + [math.inf], strict=True))
+    breaks = set(limits)
+    for start, end in pieces:
+        _, (slope, intercept) = linear_parts(start)
+        for taxable_income in taxable_breaks:
+            salary = (taxable_income - intercept) / slope
+            if start < salary < end:
+                breaks.add(salary)
+
+    bounds = [0.0] + sorted(breaks) + [math.inf]
+    segments = []
+    for start, end in zip(bounds[:-1], bounds[1:], strict=True):
+        probe = start + 1 if end == math.inf else (start + end) / 2
+        (paid_slope, paid_intercept), (slope, intercept) = linear_parts(probe)
+
+        # Income tax as a quadratic in gross salary
+        zone = bisect_right(curve.steps, slope * probe + intercept) - 1
+        if zone < 0:
+            tax = (0.0, 0.0, 0.0)
+        else:
+            shift = intercept - curve.steps[zone]
+            rate = curve.rates[zone]
+            half_slope = curve.half_slopes[zone]
+            tax = (
+                curve.offsets[zone] + (rate + half_slope * shift) * shift,
+                (rate + 2 * half_slope * shift) * slope,
+                half_slope * slope * slope,
+            )
+
+        # Soli and church tax are linear in income tax within a segment
+        tax_at_probe = tax[0] + (tax[1] + tax[2] * probe) * probe
+        if tax_at_probe <= soli_start:
+            multiplier, constant = 1 + church_tax, 0.0
+        elif (tax_at_probe - soli_start) * soli_fraction < tax_at_probe * soli_rate:
+            multiplier = 1 + church_tax + soli_fraction
+            constant = soli_start * soli_fraction
+        else:
+            multiplier, constant = 1 + church_tax + soli_rate, 0.0
+
+        coefficients = (
+            constant - multiplier * tax[0] - paid_intercept,
+            1 - multiplier * tax[1] - paid_slope,
+            -multiplier * tax[2],
+        )
+        segments.append(NetSegment(start, end, coefficients))
+    return NetSegments(segments)
+
+
+def __invert_income_tax(curve: CompiledTaxCurve, income_tax: float) -> float:
+    zone = max(bisect_right(curve.offsets, income_tax) - 1, 0)
+    remainder = max(income_tax - curve.offsets[zone], 0.0)
+    rate = curve.rates[zone]
+    half_slope = curve.half_slopes[zone]
+    return curve.steps[zone] + 2 * remainder / (
+        rate + math.sqrt(rate * rate + 4 * half_slope * remainder)
+    )
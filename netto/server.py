@@ -0,0 +1,402 @@
+"""
+HTTP/JSON service with micro-batching, built on asyncio only.
+
+Endpoints (``POST`` with a JSON object body):
+
+- ``/netto``: ``{"salary": ...}`` returns ``{"net": ...}``
+- ``/inverse``: ``{"desired_netto": ...}`` returns ``{"gross": ...}``
+- ``/breakdown``: ``{"salary": ...}`` or ``{"desired_netto": ...}`` returns
+  every `NettoResult` field
+
+Bodies may also contain ``deductibles`` and any `TaxConfig` field. ``GET
+/stats`` returns per-endpoint latency histograms and batch statistics.
+
+Requests arriving within ``window`` seconds of each other are collected and
+calculated together with `calc_netto_detailed_batch`, so a burst of
+concurrent requests costs one vectorized call instead of one call each.
+
+Examples
+--------
+::
+
+    $ python -m netto.server --port 8000
+    $ curl -s localhost:8000/netto -d '{"salary": 50000, "year": 2024}'
+    {"net": 31483.73}
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import math
+import time
+
+from netto.batch import calc_netto_detailed_batch
+from netto.config import DEFAULT_CONFIG, FrozenTaxConfig
+
+# Upper bucket bounds of the latency histograms in milliseconds
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Referenced from class bodies, so not double-underscore (name mangling)
+_CONFIG_FIELDS = (
+    "year",
+    "has_children",
+    "is_married",
+    "extra_health_insurance",
+    "church_tax",
+)
+__REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+_MAX_BODY = 1 << 20
+
+
+class LatencyHistogram:
+    """Cumulative request latency histogram with fixed millisecond buckets."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        """Record one request that took ``seconds``."""
+        milliseconds = seconds * 1000
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, milliseconds)] += 1
+        self.total += milliseconds
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        """Return count, mean and per-bucket counts as a JSON-ready dict."""
+        labels = [f"le_{bound}" for bound in LATENCY_BUCKETS_MS] + ["le_inf"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+class MicroBatcher:
+    """
+    Collects rows from concurrent requests and calculates them together.
+
+    Parameters
+    ----------
+    window : float
+        Seconds to wait for further rows after the first row of a batch
+    max_batch : int
+        Number of rows that triggers a calculation before the window ends
+    """
+
+    __slots__ = (
+        "window",
+        "max_batch",
+        "batches",
+        "rows",
+        "largest",
+        "_pending",
+        "_timer",
+    )
+
+    def __init__(self, window: float = 0.002, max_batch: int = 4096):
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.rows = 0
+        self.largest = 0
+        self._pending: list[tuple[tuple, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def submit(self, row: tuple) -> dict:
+        """Queue a parsed row and wait for its breakdown."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((row, future))
+        if len(self._pending) == 1:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self.flush)
+        elif len(self._pending) >= self.max_batch:
+            self.flush()
+        return await future
+
+    def flush(self) -> None:
+        """Calculate all pending rows now."""
+        # A batch filled before its window ends must not flush the next one
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        self.batches += 1
+        self.rows += len(pending)
+        self.largest = max(self.largest, len(pending))
+        columns = list(zip(*(row for row, _ in pending), strict=True))
+        try:
+            results = calc_netto_detailed_batch(
+                columns[0],
+                columns[1],
+                columns[2],
+                **dict(zip(_CONFIG_FIELDS, columns[3:], strict=True)),
+            )
+        except Exception as error:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        results = {name: column.tolist() for name, column in results.items()}
+        for index, (_, future) in enumerate(pending):
+            if not future.done():
+                future.set_result(
+                    {name: column[index] for name, column in results.items()}
+                )
+
+    def snapshot(self) -> dict:
+        """Return batch statistics as a JSON-ready dict."""
+        return {
+            "count": self.batches,
+            "rows": self.rows,
+            "mean_size": self.rows / self.batches if self.batches else 0.0,
+            "max_size": self.largest,
+        }
+
+
+class NettoServer:
+    """
+    Asyncio HTTP server for the netto endpoints.
+
+    Parameters
+    ----------
+    host : str, optional
+        Interface to bind (default is ``127.0.0.1``)
+    port : int, optional
+        Port to bind, ``0`` picks a free one (default is 8000)
+    window : float, optional
+        Micro-batching window in seconds
+    max_batch : int, optional
+        Maximum number of rows per batch
+    """
+
+    __slots__ = ("host", "port", "batcher", "latency", "_server")
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        window: float = 0.002,
+        max_batch: int = 4096,
+    ):
+        self.host = host
+        self.port = port
+        self.batcher = MicroBatcher(window, max_batch)
+        self.latency = {
+            path: LatencyHistogram() for path in ("/netto", "/inverse", "/breakdown")
+        }
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        """Start listening; ``port`` is updated if it was ``0``."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Start if needed and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def stats(self) -> dict:
+        """Return latency histograms per endpoint and batch statistics."""
+        return {
+            "latency": {path: h.snapshot() for path, h in self.latency.items()},
+            "batches": self.batcher.snapshot(),
+        }
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                header_lines = []
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    header_lines.append(line)
+                try:
+                    method, path, version, headers = _parse_head(
+                        request_line, header_lines
+                    )
+                    length = _content_length(headers)
+                except ValueError as error:
+                    writer.write(_response(400, {"error": str(error)}, False))
+                    await writer.drain()
+                    break
+                if length > _MAX_BODY:
+                    writer.write(_response(413, {"error": "body too large"}, False))
+                    await writer.drain()
+                    # Closing with unread data would reset the connection and
+                    # could discard the response before the client reads it
+                    while length > 0:
+                        chunk = await reader.read(min(length, 1 << 16))
+                        if not chunk:
+                            break
+                        length -= len(chunk)
+                    break
+                body = await reader.readexactly(length)
+                keep_alive = (
+                    headers.get("connection", "").lower() != "close"
+                    and version != "HTTP/1.0"
+                )
+                status, payload = await self._dispatch(method, path, body)
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ValueError:
+            # A line longer than the stream limit
+            writer.write(_response(400, {"error": "line too long"}, False))
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> tuple:
+        if path == "/stats":
+            if method != "GET":
+                return 405, {"error": "use GET"}
+            return 200, self.stats()
+        if path not in self.latency:
+            return 404, {"error": f"unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": "use POST"}
+
+        start = time.perf_counter()
+        try:
+            row = _parse_row(path, body)
+        except (TypeError, ValueError) as error:
+            return 400, {"error": str(error)}
+        try:
+            result = await self.batcher.submit(row)
+        except Exception as error:
+            return 500, {"error": f"calculation failed: {error}"}
+        self.latency[path].observe(time.perf_counter() - start)
+        if path == "/netto":
+            return 200, {"net": result["net"]}
+        if path == "/inverse":
+            return 200, {"gross": result["gross"]}
+        return 200, result
+
+
+def _parse_head(request_line: bytes, header_lines: list[bytes]) -> tuple:
+    parts = request_line.decode("latin-1").split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+        raise ValueError("malformed request line")
+    headers = {}
+    for line in header_lines:
+        name, colon, value = line.decode("latin-1").partition(":")
+        if not colon or not name.strip():
+            raise ValueError("malformed header line")
+        headers[name.strip().lower()] = value.strip()
+    return *parts, headers
+
+
+def _content_length(headers: dict) -> int:
+    value = headers.get("content-length", "0")
+    # int() would also accept signs, underscores and surrounding whitespace
+    if not (value.isascii() and value.isdigit()):
+        raise ValueError(f"invalid Content-Length {value!r}")
+    return int(value)
+
+
+def _parse_row(path: str, body: bytes) -> tuple:
+    data = json.loads(body or b"null")
+    if not isinstance(data, dict):
+        raise ValueError("expected a JSON object")
+    if path == "/breakdown":
+        inverse = "desired_netto" in data
+    else:
+        inverse = path == "/inverse"
+    key = "desired_netto" if inverse else "salary"
+    if key not in data:
+        raise ValueError(f"missing {key!r}")
+    config = {
+        name: data.get(name, getattr(DEFAULT_CONFIG, name)) for name in _CONFIG_FIELDS
+    }
+    # Validates the row so that one bad request cannot fail a whole batch
+    FrozenTaxConfig(**config)
+    for name in ("extra_health_insurance", "church_tax"):
+        __finite(name, config[name])
+    return (
+        __finite(key, data[key]),
+        __finite("deductibles", data.get("deductibles", 0)),
+        inverse,
+        *config.values(),
+    )
+
+
+def __finite(name: str, value) -> float:
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f"{name} must be finite, got {value}")
+    return value
+
+
+def _response(status: int, payload: dict, keep_alive: bool) -> bytes:
+    try:
+        body = json.dumps(payload, allow_nan=False).encode()
+    except ValueError:
+        status = 500
+        body = json.dumps({"error": "result is not finite"}).encode()
+    head = (
+        f"HTTP/1.1 {status} {__REASONS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode() + body
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the server from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m netto.server", description="netto HTTP/JSON service"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--window-ms", type=float, default=2.0, help="micro-batching window"
+    )
+    parser.add_argument("--max-batch", type=int, default=4096)
+    args = parser.parse_args(argv)
+
+    server = NettoServer(args.host, args.port, args.window_ms / 1000, args.max_batch)
+
+    async def run():
+        await server.start()
+        print(f"Serving on http://{server.host}:{server.port}", flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""
+Precompiled binary snapshot of the validated tax data.
+
+Validating the JSON files requires importing pydantic, which dominates the
+start-up time of short-lived processes. The snapshot stores all validated
+parameters in one struct-packed file together with a SHA-256 hash of the
+JSON sources. `netto.data_loader` reads it without any validation as long as
+the hash matches. Years missing from the snapshot, or all years if it is
+missing or stale, are validated one at a time on first use as before, and
+merged into the snapshot when the process exits.
+
+The snapshot lives in ``$NETTO_CACHE_DIR`` (default: ``~/.cache/netto``).
+Set ``NETTO_SNAPSHOT=0`` to disable it. Build it ahead of time with::
+
+    python -m netto.snapshot [path]
+
+File layout (little endian):
+
+- header: magic ``NETTOSNP``, version (uint16), source hash (32 bytes),
+  number of years (uint16)
+- one record per year: year (int32), flags (uint8) marking which of tax
+  curve, social security, soli and pension factor are present, then 40
+  doubles: 4 tax brackets as (step, rate, number of coefficients, three
+  coefficients), 4 insurances as (limit, rate, extra), the 3 soli parameters
+  and the pension factor. Missing values are stored as NaN.
+"""
+
+import atexit
+import hashlib
+import math
+import os
+import struct
+import sys
+from pathlib import Path
+
+from netto import data_loader
+
+MAGIC = b"NETTOSNP"
+VERSION = 1
+
+__HEADER = struct.Struct("<8sH32sH")
+__RECORD = struct.Struct("<iB40d")
+__INSURANCES = ("pension", "unemployment", "health", "nursing")
+__SOLI = ("start_taxable_income", "start_fraction", "end_rate")
+__SOURCES = ("tax_curves", "social_security", "soli", "pension_factors")
+# Snapshot keys, named like the `netto.data_loader` module-level dictionaries
+__KEYS = (
+    "tax_curve",
+    "social_security_curve",
+    "soli_curve",
+    "correction_factor_pensions",
+)
+
+
+def default_path() -> Path:
+    """Return the snapshot location, honouring ``$NETTO_CACHE_DIR``."""
+    cache_dir = os.environ.get("NETTO_CACHE_DIR")
+    if cache_dir is None:
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        cache_dir = cache_dir / "netto"
+    return Path(cache_dir) / "snapshot.bin"
+
+
+def source_hash(data_dir: Path | None = None) -> bytes:
+    """
+    Return the SHA-256 digest of all JSON data files.
+
+    Parameters
+    ----------
+    data_dir : Path, optional
+        Data directory (default is `netto.data_loader.DATA_DIR`)
+
+    Returns
+    -------
+    bytes
+        The 32-byte digest
+    """
+    data_dir = data_loader.DATA_DIR if data_dir is None else data_dir
+    digest = hashlib.sha256()
+    for source in __SOURCES:
+        for path in sorted((data_dir / source).glob("*.json")):
+            digest.update(f"{source}/{path.name}\0".encode())
+            digest.update(path.read_bytes())
+    return digest.digest()
+
+
+def write_snapshot(path: Path | None = None, data: dict | None = None) -> Path:
+    """
+    Validate all JSON data and write it to a snapshot file.
+
+    Parameters
+    ----------
+    path : Path, optional
+        Target file (default is `default_path`)
+    data : dict, optional
+        Already validated data as returned by `load_validated`
+
+    Returns
+    -------
+    Path
+        The written file
+
+    Raises
+    ------
+    ValueError
+        If a tax bracket has more coefficients than the layout holds
+    """
+    path = default_path() if path is None else Path(path)
+    data = load_validated() if data is None else data
+    years = sorted(set().union(*(data[key] for key in data)))
+
+    chunks = [__HEADER.pack(MAGIC, VERSION, source_hash(), len(years))]
+    for year in years:
+        flags = 0
+        values = [math.nan] * 40
+        curve = data["tax_curve"].get(year)
+        if curve is not None:
+            flags |= 1
+            for i in range(4):
+                const = curve[i]["const"]
+                if const is not None and len(const) > 3:
+                    raise ValueError(
+                        f"tax bracket {i} of {year} has {len(const)} coefficients,"
+                        " the snapshot holds at most 3"
+                    )
+                values[6 * i : 6 * i + 3] = [
+                    curve[i]["step"],
+                    curve[i]["rate"],
+                    -1 if const is None else len(const),
+                ]
+                for j, value in enumerate(const or ()):
+                    values[6 * i + 3 + j] = value
+        social_security = data["social_security_curve"].get(year)
+        if social_security is not None:
+            flags |= 2
+            for i, insurance in enumerate(__INSURANCES):
+                entry = social_security[insurance]
+                extra = entry["extra"]
+                values[24 + 3 * i : 27 + 3 * i] = [
+                    entry["limit"],
+                    entry["rate"],
+                    math.nan if extra is None else extra,
+                ]
+        soli = data["soli_curve"].get(year)
+        if soli is not None:
+            flags |= 4
+            values[36:39] = [soli[key] for key in __SOLI]
+        factor = data["correction_factor_pensions"].get(year)
+        if factor is not None:
+            flags |= 8
+            values[39] = factor
+        chunks.append(__RECORD.pack(year, flags, *values))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so readers never see a partial snapshot
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temporary.write_bytes(b"".join(chunks))
+    os.replace(temporary, path)
+    return path
+
+
+def read_snapshot(
+    path: Path | None = None, expected_hash: bytes | None = None
+) -> dict | None:
+    """
+    Read a snapshot without any validation.
+
+    Parameters
+    ----------
+    path : Path, optional
+        Snapshot file (default is `default_path`)
+    expected_hash : bytes, optional
+        Source hash the snapshot must have (default is the current
+        `source_hash`)
+
+    Returns
+    -------
+    dict or None
+        Data keyed like the `netto.data_loader` module-level dictionaries, or
+        None if the file is missing, corrupt or stale
+    """
+    path = default_path() if path is None else Path(path)
+    expected_hash = source_hash() if expected_hash is None else expected_hash
+    try:
+        content = path.read_bytes()
+        magic, version, stored_hash, count = __HEADER.unpack_from(content)
+    except (OSError, struct.error):
+        return None
+    if (
+        magic != MAGIC
+        or version != VERSION
+        or stored_hash != expected_hash
+        or len(content) != __HEADER.size + count * __RECORD.size
+    ):
+        return None
+
+    data = {
+        "tax_curve": {},
+        "social_security_curve": {},
+        "soli_curve": {},
+        "correction_factor_pensions": {},
+    }
+    for year, flags, *values in __RECORD.iter_unpack(content[__HEADER.size :]):
+        if flags & 1:
+            curve = {}
+            for i in range(4):
+                step, rate, length = values[6 * i : 6 * i + 3]
+                const = values[6 * i + 3 : 6 * i + 3 + int(length)]
+                curve[i] = {
+                    "step": step,
+                    "rate": rate,
+                    "const": None if length < 0 else const,
+                }
+            data["tax_curve"][year] = curve
+        if flags & 2:
+            data["social_security_curve"][year] = {
+                insurance: {
+                    "limit": values[24 + 3 * i],
+                    "rate": values[25 + 3 * i],
+                    "extra": None
+                    if math.isnan(values[26 + 3 * i])
+                    else values[26 + 3 * i],
+                }
+                for i, insurance in enumerate(__INSURANCES)
+            }
+        if flags & 4:
+            data["soli_curve"][year] = dict(zip(__SOLI, values[36:39], strict=True))
+        if flags & 8:
+            data["correction_factor_pensions"][year] = values[39]
+    return data
+
+
+def load_validated() -> dict:
+    """Load and validate all JSON data, keyed like `read_snapshot`."""
+    social_security = data_loader.load_all_social_security()
+    social_security.pop(2027, None)
+    return {
+        "tax_curve": data_loader.load_all_tax_curves(),
+        "social_security_curve": social_security,
+        "soli_curve": data_loader.load_all_soli(),
+        "correction_factor_pensions": data_loader.load_all_pension_factors(),
+    }
+
+
+def load_or_build() -> dict | None:
+    """
+    Return the data in the snapshot and keep the snapshot up to date.
+
+    Returns None if snapshots are disabled with ``NETTO_SNAPSHOT=0``. A
+    missing or stale snapshot gives empty data, so `netto.data_loader`
+    validates each year on first use instead of all JSON files up front. At
+    exit, the years validated by this process are merged into the snapshot
+    with `update_snapshot`.
+    """
+    if os.environ.get("NETTO_SNAPSHOT", "1") == "0":
+        return None
+    data = read_snapshot()
+    if data is None:
+        data = {key: {} for key in __KEYS}
+    # The path is resolved now, as the environment may change before exit
+    atexit.register(update_snapshot, data, default_path())
+    return data
+
+
+def update_snapshot(data: dict, path: Path | None = None) -> bool:
+    """
+    Merge the years validated by `netto.data_loader` into a snapshot.
+
+    A snapshot that cannot be written (e.g. read-only cache directory or data
+    that does not fit the layout) is silently skipped.
+
+    Parameters
+    ----------
+    data : dict
+        Current snapshot data as returned by `load_or_build`
+    path : Path, optional
+        Target file (default is `default_path`)
+
+    Returns
+    -------
+    bool
+        Whether a snapshot with additional years was written
+    """
+    merged = {key: dict(data[key]) for key in __KEYS}
+    added = False
+    for key in __KEYS:
+        # Only years that are loaded already, without loading further ones
+        for year, value in dict.items(getattr(data_loader, key)):
+            if year not in merged[key] and isinstance(value, (dict, float)):
+                merged[key][year] = value
+                added = True
+    if not added:
+        return False
+    try:
+        write_snapshot(path, merged)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Build the snapshot, optionally at the path given on the command line."""
+    argv = sys.argv[1:] if argv is None else argv
+    path = write_snapshot(Path(argv[0]) if argv else None)
+    print(f"Wrote snapshot to {path}")
+
+
+if __name__ == "__main__":
+    main()
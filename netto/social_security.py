@@ -1,9 +1,12 @@
 import math
 
-from scipy.integrate import quad
+import numpy as np
 
-from netto.config import TaxConfig
+from netto import instrumentation
+from netto.config import DEFAULT_CONFIG, TaxConfig
 from netto.data_loader import correction_factor_pensions, social_security_curve
+from netto.parameters import get_parameters
+from netto.rounding import round_array
 
 
 def get_rate_pension(salary: float, config: TaxConfig | None = None) -> float:
@@ -14,7 +17,7 @@ def __get_rate(
     salary: float, type: str, extra: float = 0, config: TaxConfig | None = None
 ) -> float:
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
     return (
         social_security_curve[config.year][type]["rate"] + extra
         if 0 < salary <= social_security_curve[config.year][type]["limit"]
@@ -28,14 +31,14 @@ def get_rate_unemployment(salary: float, config: TaxConfig | None = None) -> flo
 
 def get_rate_health(salary: float, config: TaxConfig | None = None) -> float:
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
     extra = config.extra_health_insurance / 2
     return __get_rate(salary, "health", extra, config=config)
 
 
 def get_rate_nursing(salary: float, config: TaxConfig | None = None) -> float:
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
     extra = (
         0
         if config.has_children
@@ -52,7 +55,7 @@ def __get_value(
     salary: float, type: str, extra: float = 0, config: TaxConfig | None = None
 ) -> float:
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
     return min(
         salary * (social_security_curve[config.year][type]["rate"] + extra),
         social_security_curve[config.year][type]["limit"]
@@ -68,7 +71,7 @@ def calc_insurance_unemployment(
 
 def calc_insurance_health(salary: float, config: TaxConfig | None = None) -> float:
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
     extra = config.extra_health_insurance / 2
     return __get_value(salary, "health", extra, config=config)
 
@@ -77,14 +80,14 @@ def calc_insurance_health_deductable(
     salary: float, config: TaxConfig | None = None
 ) -> float:
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
     extra = config.extra_health_insurance / 2
     return __get_value(salary, "health", extra - 0.003, config=config)
 
 
 def calc_insurance_nursing(salary: float, config: TaxConfig | None = None) -> float:
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
     extra = (
         0
         if config.has_children
@@ -97,7 +100,7 @@ def calc_deductible_social_security(
     salary: float, config: TaxConfig | None = None
 ) -> float:
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
     return (
         math.ceil(
             calc_insurance_pension(salary, config)
@@ -121,10 +124,324 @@ def calc_social_security(salary: float, config: TaxConfig | None = None) -> floa
 def calc_social_security_by_integration(
     salary: float, config: TaxConfig | None = None
 ) -> float:
+    # scipy is only needed here, so it is not imported with the package
+    from scipy.integrate import quad
+
     if config is None:
-        config = TaxConfig()
-    pension, _ = quad(lambda s: get_rate_pension(s, config), 0, salary)
-    health, _ = quad(lambda s: get_rate_health(s, config), 0, salary)
-    nursing, _ = quad(lambda s: get_rate_nursing(s, config), 0, salary)
-    unemployment, _ = quad(lambda s: get_rate_unemployment(s, config), 0, salary)
+        config = DEFAULT_CONFIG
+    rates = {
+        "pension_rate": get_rate_pension,
+        "health_rate": get_rate_health,
+        "nursing_rate": get_rate_nursing,
+        "unemployment_rate": get_rate_unemployment,
+    }
+    recorder = instrumentation.active_recorder
+    contributions = []
+    for name, rate in rates.items():
+
+        def integrand(s, rate=rate):
+            return rate(s, config)
+
+        if recorder is not None:
+            integrand = recorder.counting(name, integrand)
+        contributions.append(quad(integrand, 0, salary)[0])
+    pension, health, nursing, unemployment = contributions
     return round(pension + health + nursing + unemployment, 2)
+
+
+def calc_social_security_analytic(salary, config: TaxConfig | None = None):
+    """
+    Calculate social security contributions as the exact integral of the rates.
+
+    Closed-form replacement for `calc_social_security_by_integration`: the
+    integral of a flat rate that stops at the contribution limit is
+    ``min(salary, limit) * rate``, so no numerical integration is needed.
+
+    Parameters
+    ----------
+    salary : float or array_like
+        Yearly gross salary or salaries
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+
+    Returns
+    -------
+    float or numpy.ndarray
+        Social security contributions, a float for scalar input
+
+    Examples
+    --------
+    >>> calc_social_security_analytic(50000)
+    >>> calc_social_security_analytic([30000, 50000, 120000])
+    """
+    parameters = get_parameters(config)
+    components = (
+        (parameters.pension_limit, parameters.pension_rate),
+        (parameters.health_limit, parameters.health_rate),
+        (parameters.nursing_limit, parameters.nursing_rate),
+        (parameters.unemployment_limit, parameters.unemployment_rate),
+    )
+    if np.ndim(salary) == 0:
+        salary = float(salary)
+        return round(
+            sum(min(max(salary, 0), limit) * rate for limit, rate in components), 2
+        )
+
+    salaries = np.asarray(salary, dtype=np.float64)
+    total = np.zeros_like(salaries)
+    for limit, rate in components:
+        total += np.clip(salaries, 0, limit) * rate
+    return round_array(total, 2)
+
+
+def __get_value_array(
+    salary: np.ndarray, type: str, extra=0, config: TaxConfig | None = None
+) -> np.ndarray:
+    if config is None:
+        config = DEFAULT_CONFIG
+    rate = social_security_curve[config.year][type]["rate"] + extra
+    return np.minimum(
+        salary * rate, social_security_curve[config.year][type]["limit"] * rate
+    )
+
+
+def __get_extra_health_array(config: TaxConfig, extra_health_insurance=None):
+    if extra_health_insurance is None:
+        return config.extra_health_insurance / 2
+    return np.asarray(extra_health_insurance, dtype=np.float64) / 2
+
+
+def __get_extra_nursing_array(config: TaxConfig, has_children=None):
+    extra = social_security_curve[config.year]["nursing"]["extra"]
+    if has_children is None:
+        return 0 if config.has_children else extra
+    return np.where(np.asarray(has_children, dtype=bool), 0.0, extra)
+
+
+def calc_insurance_pension_array(salary, config: TaxConfig | None = None) -> np.ndarray:
+    """
+    Calculate pension insurance contributions for an array of salaries.
+
+    Vectorized counterpart of `calc_insurance_pension`; returns the same
+    values elementwise.
+
+    Parameters
+    ----------
+    salary : array_like
+        Yearly gross salaries
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+
+    Returns
+    -------
+    numpy.ndarray
+        Pension insurance contributions
+    """
+    salary = np.asarray(salary, dtype=np.float64)
+    return __get_value_array(salary, "pension", config=config)
+
+
+def calc_insurance_unemployment_array(
+    salary, config: TaxConfig | None = None
+) -> np.ndarray:
+    """
+    Calculate unemployment insurance contributions for an array of salaries.
+
+    Vectorized counterpart of `calc_insurance_unemployment`; returns the same
+    values elementwise.
+
+    Parameters
+    ----------
+    salary : array_like
+        Yearly gross salaries
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+
+    Returns
+    -------
+    numpy.ndarray
+        Unemployment insurance contributions
+    """
+    salary = np.asarray(salary, dtype=np.float64)
+    return __get_value_array(salary, "unemployment", config=config)
+
+
+def calc_insurance_health_array(
+    salary, config: TaxConfig | None = None, extra_health_insurance=None
+) -> np.ndarray:
+    """
+    Calculate health insurance contributions for an array of salaries.
+
+    Vectorized counterpart of `calc_insurance_health`; returns the same values
+    elementwise.
+
+    Parameters
+    ----------
+    salary : array_like
+        Yearly gross salaries
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+    extra_health_insurance : float or array_like, optional
+        Health insurance surcharge per row, overriding
+        ``config.extra_health_insurance``
+
+    Returns
+    -------
+    numpy.ndarray
+        Health insurance contributions
+
+    Examples
+    --------
+    >>> calc_insurance_health_array([40000, 60000], extra_health_insurance=[0.017, 0.025])
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+    salary = np.asarray(salary, dtype=np.float64)
+    extra = __get_extra_health_array(config, extra_health_insurance)
+    return __get_value_array(salary, "health", extra, config=config)
+
+
+def calc_insurance_health_deductable_array(
+    salary, config: TaxConfig | None = None, extra_health_insurance=None
+) -> np.ndarray:
+    """
+    Calculate the deductible part of health insurance for an array of salaries.
+
+    Vectorized counterpart of `calc_insurance_health_deductable`; returns the
+    same values elementwise.
+
+    Parameters
+    ----------
+    salary : array_like
+        Yearly gross salaries
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+    extra_health_insurance : float or array_like, optional
+        Health insurance surcharge per row, overriding
+        ``config.extra_health_insurance``
+
+    Returns
+    -------
+    numpy.ndarray
+        Deductible health insurance contributions
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+    salary = np.asarray(salary, dtype=np.float64)
+    extra = __get_extra_health_array(config, extra_health_insurance)
+    return __get_value_array(salary, "health", extra - 0.003, config=config)
+
+
+def calc_insurance_nursing_array(
+    salary, config: TaxConfig | None = None, has_children=None
+) -> np.ndarray:
+    """
+    Calculate nursing insurance contributions for an array of salaries.
+
+    Vectorized counterpart of `calc_insurance_nursing`; returns the same values
+    elementwise.
+
+    Parameters
+    ----------
+    salary : array_like
+        Yearly gross salaries
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+    has_children : bool or array_like, optional
+        Whether each row has children, overriding ``config.has_children``
+
+    Returns
+    -------
+    numpy.ndarray
+        Nursing insurance contributions
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+    salary = np.asarray(salary, dtype=np.float64)
+    extra = __get_extra_nursing_array(config, has_children)
+    return __get_value_array(salary, "nursing", extra, config=config)
+
+
+def calc_deductible_social_security_array(
+    salary,
+    config: TaxConfig | None = None,
+    has_children=None,
+    extra_health_insurance=None,
+) -> np.ndarray:
+    """
+    Calculate deductible social security contributions for an array of salaries.
+
+    Vectorized counterpart of `calc_deductible_social_security`; returns the
+    same values elementwise.
+
+    Parameters
+    ----------
+    salary : array_like
+        Yearly gross salaries
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+    has_children : bool or array_like, optional
+        Whether each row has children, overriding ``config.has_children``
+    extra_health_insurance : float or array_like, optional
+        Health insurance surcharge per row, overriding
+        ``config.extra_health_insurance``
+
+    Returns
+    -------
+    numpy.ndarray
+        Deductible social security contributions
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+    return (
+        np.ceil(
+            calc_insurance_pension_array(salary, config)
+            * correction_factor_pensions[config.year]
+        )
+        + np.ceil(
+            calc_insurance_health_deductable_array(
+                salary, config, extra_health_insurance
+            )
+        )
+        + np.ceil(calc_insurance_nursing_array(salary, config, has_children))
+    )
+
+
+def calc_social_security_array(
+    salary,
+    config: TaxConfig | None = None,
+    has_children=None,
+    extra_health_insurance=None,
+) -> np.ndarray:
+    """
+    Calculate total social security contributions for an array of salaries.
+
+    Vectorized counterpart of `calc_social_security`; returns the same values
+    elementwise.
+
+    Parameters
+    ----------
+    salary : array_like
+        Yearly gross salaries
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+    has_children : bool or array_like, optional
+        Whether each row has children, overriding ``config.has_children``
+    extra_health_insurance : float or array_like, optional
+        Health insurance surcharge per row, overriding
+        ``config.extra_health_insurance``
+
+    Returns
+    -------
+    numpy.ndarray
+        Social security contributions
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+    return round_array(
+        calc_insurance_pension_array(salary, config)
+        + calc_insurance_health_array(salary, config, extra_health_insurance)
+        + calc_insurance_nursing_array(salary, config, has_children)
+        + calc_insurance_unemployment_array(salary, config),
+        2,
+    )
@@ -0,0 +1,180 @@
+"""
+Root finding helpers for the inverse calculations.
+
+The net income is a monotone, step-shaped function of the gross salary, so
+bracketed methods are used: they never leave the bracket and cannot diverge
+on the kinks and steps that trip up Newton-type iterations. `secant` backs the
+scalar ``method="newton"`` inverse without requiring scipy.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+from netto import instrumentation
+
+
+@dataclass(slots=True)
+class BracketedRoot:
+    """
+    Result of a vectorized bracketed root search.
+
+    Attributes
+    ----------
+    root : numpy.ndarray
+        Upper end of the final bracket, i.e. the smallest point found with
+        ``f(root) >= 0``
+    converged : numpy.ndarray
+        Whether the bracket shrank below ``xtol`` for each element
+    iterations : numpy.ndarray
+        Number of function evaluations spent on each element
+    """
+
+    root: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+
+
+def bracketed_root(
+    func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    lower,
+    upper,
+    xtol: float = 0.01,
+    maxiter: int = 100,
+) -> BracketedRoot:
+    """
+    Find roots of a nondecreasing function for many brackets at once.
+
+    Uses the Illinois variant of regula falsi on all elements simultaneously.
+    Only the elements that have not converged yet are evaluated in each
+    iteration.
+
+    Parameters
+    ----------
+    func : callable
+        ``func(x, index)`` returns the function values at ``x`` for the rows
+        ``index`` of the problem
+    lower : array_like
+        Lower bracket ends with ``func(lower) < 0``
+    upper : array_like
+        Upper bracket ends with ``func(upper) >= 0``
+    xtol : float, optional
+        Absolute bracket width at which an element counts as converged
+    maxiter : int, optional
+        Maximum number of iterations
+
+    Returns
+    -------
+    BracketedRoot
+        Roots, convergence flags and iteration counts
+    """
+    lo = np.array(lower, dtype=np.float64, ndmin=1)
+    hi = np.array(upper, dtype=np.float64, ndmin=1)
+    index = np.arange(lo.size)
+    f_lo = func(lo, index)
+    f_hi = func(hi, index)
+    if np.any(f_lo >= 0) or np.any(f_hi < 0):
+        raise ValueError("func(lower) must be negative and func(upper) non-negative")
+
+    # Which end was moved last: -1 for lower, +1 for upper
+    side = np.zeros(lo.size, dtype=np.int8)
+    iterations = np.zeros(lo.size, dtype=np.int64)
+    converged = hi - lo <= xtol
+
+    for _ in range(maxiter):
+        active = np.flatnonzero(~converged)
+        if active.size == 0:
+            break
+
+        a, b = lo[active], hi[active]
+        fa, fb = f_lo[active], f_hi[active]
+        x = b - fb * (b - a) / (fb - fa)
+        # Fall back to bisection if the secant leaves the open bracket
+        outside = ~((x > a) & (x < b))
+        x[outside] = 0.5 * (a[outside] + b[outside])
+        fx = func(x, active)
+        iterations[active] += 1
+
+        upper_moves = fx >= 0
+        moved_up = active[upper_moves]
+        moved_down = active[~upper_moves]
+
+        # Illinois: halve the value at the end that stays for a second time
+        f_lo[moved_up[side[moved_up] == 1]] *= 0.5
+        f_hi[moved_down[side[moved_down] == -1]] *= 0.5
+
+        hi[moved_up] = x[upper_moves]
+        f_hi[moved_up] = fx[upper_moves]
+        side[moved_up] = 1
+        lo[moved_down] = x[~upper_moves]
+        f_lo[moved_down] = fx[~upper_moves]
+        side[moved_down] = -1
+
+        converged[active] = hi[active] - lo[active] <= xtol
+
+    return BracketedRoot(root=hi, converged=converged, iterations=iterations)
+
+
+def secant(
+    func: Callable[[float], float],
+    x0: float,
+    tol: float = 1.48e-8,
+    maxiter: int = 50,
+) -> float:
+    """
+    Find a root of a scalar function with the secant method.
+
+    Follows `scipy.optimize.newton` without derivative step by step, so the
+    iterates and results are identical, including the errors raised.
+
+    Parameters
+    ----------
+    func : callable
+        Scalar function whose root is wanted
+    x0 : float
+        Initial guess; the second point is placed a relative ``1e-4`` above
+    tol : float, optional
+        Absolute tolerance between consecutive iterates
+    maxiter : int, optional
+        Maximum number of iterations
+
+    Returns
+    -------
+    float
+        The root
+
+    Raises
+    ------
+    RuntimeError
+        If the function values of two iterates coincide (e.g. on a step of a
+        rounded function) or the iteration does not converge
+    """
+    p0 = x0
+    p1 = x0 * (1 + 1e-4)
+    p1 += 1e-4 if p1 >= 0 else -1e-4
+    q0 = func(p0)
+    q1 = func(p1)
+    if abs(q1) < abs(q0):
+        p0, p1, q0, q1 = p1, p0, q1, q0
+    recorder = instrumentation.active_recorder
+    for iteration in range(1, maxiter + 1):
+        if recorder is not None:
+            recorder.solver_iterations += 1
+        if q1 == q0:
+            if p1 != p0:
+                raise RuntimeError(
+                    f"Tolerance of {p1 - p0} reached. Failed to converge after "
+                    f"{iteration} iterations, value is {p1}."
+                )
+            return (p1 + p0) / 2.0
+        if abs(q1) > abs(q0):
+            p = (-q0 / q1 * p1 + p0) / (1 - q0 / q1)
+        else:
+            p = (-q1 / q0 * p0 + p1) / (1 - q1 / q0)
+        if abs(p - p1) <= tol:
+            return p
+        p0, q0 = p1, q1
+        p1 = p
+        q1 = func(p1)
+    raise RuntimeError(f"Failed to converge after {maxiter} iterations, value is {p}.")
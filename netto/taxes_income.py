@@ -1,11 +1,137 @@
 import math
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import cache
 
-from scipy.integrate import quad
+import numpy as np
 
-from netto.config import TaxConfig
+from netto import instrumentation
+from netto.config import DEFAULT_CONFIG, TaxConfig
 from netto.data_loader import tax_curve as TAX_CURVE_DATA
 
 
+@dataclass(frozen=True, slots=True)
+class CompiledTaxCurve:
+    """
+    Immutable tax curve for one year and marital status.
+
+    Built once by `get_tax_curve` and shared by all functions in this module.
+    For married couples the steps are doubled (Ehegattensplitting).
+
+    Attributes
+    ----------
+    year : int
+        Tax year
+    is_married : bool
+        Whether the steps are doubled
+    steps : tuple
+        Income thresholds of the four brackets
+    rates : tuple
+        Marginal tax rates at the bracket thresholds
+    consts : tuple
+        Polynomial coefficients per bracket (empty if not available)
+    offsets : tuple
+        Income tax accumulated up to each step
+    half_slopes : tuple
+        Half the slope of the marginal rate within each zone
+    """
+
+    year: int
+    is_married: bool
+    steps: tuple[float, ...]
+    rates: tuple[float, ...]
+    consts: tuple[tuple[float, ...], ...]
+    offsets: tuple[float, ...]
+    half_slopes: tuple[float, ...]
+
+    @staticmethod
+    def _calc_gradient(
+        x_i: float, x_j: float, y_i: float, y_j: float, x: float
+    ) -> float:
+        return (1 - (x_j - x) / (x_j - x_i)) * (y_j - y_i) + y_i
+
+    def marginal_rate(self, taxable_income: float) -> float:
+        """Return the marginal tax rate at ``taxable_income``."""
+        steps = self.steps
+        rates = self.rates
+        if taxable_income < steps[0]:
+            return 0
+        elif taxable_income <= steps[1]:
+            return self._calc_gradient(
+                steps[0], steps[1], rates[0], rates[1], taxable_income
+            )
+        elif taxable_income <= steps[2]:
+            return self._calc_gradient(
+                steps[1], steps[2], rates[1], rates[2], taxable_income
+            )
+        elif taxable_income < steps[3]:
+            return rates[2]
+        else:
+            return rates[3]
+
+    def income_tax(self, taxable_income: float) -> float:
+        """Return the closed-form integral of the marginal tax rate."""
+        zone = bisect_right(self.steps, taxable_income) - 1
+        if zone < 0:
+            return 0.0
+        dx = taxable_income - self.steps[zone]
+        return (
+            self.offsets[zone] + (self.rates[zone] + self.half_slopes[zone] * dx) * dx
+        )
+
+
+@cache
+def get_tax_curve(year: int, is_married: bool = False) -> CompiledTaxCurve:
+    """
+    Return the compiled tax curve for a year and marital status.
+
+    Curves are built on first use and cached for the lifetime of the process.
+
+    Parameters
+    ----------
+    year : int
+        Tax year
+    is_married : bool, optional
+        Double the bracket steps (default is False)
+
+    Returns
+    -------
+    CompiledTaxCurve
+        The compiled tax curve
+
+    Examples
+    --------
+    >>> get_tax_curve(2025).steps
+    (12096, 17443, 68480, 277826)
+    """
+    brackets = [TAX_CURVE_DATA[year][i] for i in range(4)]
+    factor = 2 if is_married else 1
+    steps = tuple(bracket["step"] * factor for bracket in brackets)
+    rates = tuple(bracket["rate"] for bracket in brackets)
+    consts = tuple(tuple(bracket.get("const") or ()) for bracket in brackets)
+    # Marginal rate is linear within the first two zones, constant afterwards
+    slopes = (
+        (rates[1] - rates[0]) / (steps[1] - steps[0]),
+        (rates[2] - rates[1]) / (steps[2] - steps[1]),
+        0.0,
+        0.0,
+    )
+    # Tax accumulated at the start of each zone
+    offsets = [0.0]
+    for i in range(3):
+        width = steps[i + 1] - steps[i]
+        offsets.append(offsets[i] + rates[i] * width + slopes[i] / 2 * width * width)
+    return CompiledTaxCurve(
+        year=year,
+        is_married=is_married,
+        steps=steps,
+        rates=rates,
+        consts=consts,
+        offsets=tuple(offsets),
+        half_slopes=tuple(slope / 2 for slope in slopes),
+    )
+
+
 def get_marginal_tax_rate(
     taxable_income: float, config: TaxConfig | None = None
 ) -> float:
@@ -30,49 +156,9 @@ def get_marginal_tax_rate(
     get_marginal_tax_rate(10000)
     """
     if config is None:
-        config = TaxConfig()
-
-    # If the person is married, double the tax brackets
-    if config.is_married:
-        tax_curve = {
-            year: {
-                bracket: {
-                    "step": data["step"] * 2,
-                    "rate": data["rate"],
-                    "const": data.get("const", []),
-                }
-                for bracket, data in year_data.items()
-            }
-            for year, year_data in TAX_CURVE_DATA.items()
-        }
-    else:
-        tax_curve = TAX_CURVE_DATA
-    if taxable_income < tax_curve[config.year][0]["step"]:
-        return 0
-    elif taxable_income <= tax_curve[config.year][1]["step"]:
-        return __calc_gradient(
-            tax_curve[config.year][0]["step"],
-            tax_curve[config.year][1]["step"],
-            tax_curve[config.year][0]["rate"],
-            tax_curve[config.year][1]["rate"],
-            taxable_income,
-        )
-    elif taxable_income <= tax_curve[config.year][2]["step"]:
-        return __calc_gradient(
-            tax_curve[config.year][1]["step"],
-            tax_curve[config.year][2]["step"],
-            tax_curve[config.year][1]["rate"],
-            tax_curve[config.year][2]["rate"],
-            taxable_income,
-        )
-    elif taxable_income < tax_curve[config.year][3]["step"]:
-        return tax_curve[config.year][2]["rate"]
-    else:
-        return tax_curve[config.year][3]["rate"]
+        config = DEFAULT_CONFIG
 
-
-def __calc_gradient(x_i: float, x_j: float, y_i: float, y_j: float, x: float) -> float:
-    return (1 - (x_j - x) / (x_j - x_i)) * (y_j - y_i) + y_i
+    return get_tax_curve(config.year, config.is_married).marginal_rate(taxable_income)
 
 
 def calc_taxable_income(
@@ -109,6 +195,37 @@ def calc_taxable_income(
     )
 
 
+def calc_taxable_income_array(
+    salary, deductible_social_security, deductibles_other=0
+) -> np.ndarray:
+    """
+    Calculate the taxable income for arrays of salaries and deductibles.
+
+    Vectorized counterpart of `calc_taxable_income`; returns the same values
+    elementwise.
+
+    Parameters
+    ----------
+    salary : array_like
+        Yearly salaries
+    deductible_social_security : array_like
+        Deductible social security contributions
+    deductibles_other : array_like, optional
+        Other deductibles that reduce the taxable income (default is 0)
+
+    Returns
+    -------
+    numpy.ndarray
+        Taxable incomes
+    """
+    salary = np.asarray(salary, dtype=np.float64)
+    return np.floor(
+        np.maximum(
+            0, salary - deductible_social_security - 1200 - 36 - deductibles_other
+        )
+    )
+
+
 def calc_income_tax(taxable_income: float, config: TaxConfig | None = None) -> float:
     """
     Calculate the income tax for a given taxable income.
@@ -131,33 +248,25 @@ def calc_income_tax(taxable_income: float, config: TaxConfig | None = None) -> f
     calc_income_tax(10000)
     """
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
+
+    curve = get_tax_curve(config.year)
+    steps = curve.steps
+    consts = curve.consts
 
     taxable_income = round(taxable_income)
-    if taxable_income <= TAX_CURVE_DATA[config.year][0]["step"]:
+    if taxable_income <= steps[0]:
         return 0
-    elif taxable_income <= TAX_CURVE_DATA[config.year][1]["step"]:
-        y = (taxable_income - TAX_CURVE_DATA[config.year][0]["step"]) / 10000
-        return (
-            TAX_CURVE_DATA[config.year][1]["const"][0] * y
-            + TAX_CURVE_DATA[config.year][1]["const"][1]
-        ) * y
-    elif taxable_income <= TAX_CURVE_DATA[config.year][2]["step"]:
-        z = (taxable_income - TAX_CURVE_DATA[config.year][1]["step"]) / 10000
-        return (
-            TAX_CURVE_DATA[config.year][2]["const"][0] * z
-            + TAX_CURVE_DATA[config.year][2]["const"][1]
-        ) * z + TAX_CURVE_DATA[config.year][2]["const"][2]
-    elif taxable_income <= TAX_CURVE_DATA[config.year][3]["step"]:
-        return (
-            TAX_CURVE_DATA[config.year][2]["rate"] * taxable_income
-            - TAX_CURVE_DATA[config.year][3]["const"][0]
-        )
+    elif taxable_income <= steps[1]:
+        y = (taxable_income - steps[0]) / 10000
+        return (consts[1][0] * y + consts[1][1]) * y
+    elif taxable_income <= steps[2]:
+        z = (taxable_income - steps[1]) / 10000
+        return (consts[2][0] * z + consts[2][1]) * z + consts[2][2]
+    elif taxable_income <= steps[3]:
+        return curve.rates[2] * taxable_income - consts[3][0]
     else:
-        return (
-            TAX_CURVE_DATA[config.year][3]["rate"] * taxable_income
-            - TAX_CURVE_DATA[config.year][3]["const"][1]
-        )
+        return curve.rates[3] * taxable_income - consts[3][1]
 
 
 def calc_income_tax_by_integration(
@@ -178,14 +287,96 @@ def calc_income_tax_by_integration(
     float
         Income tax amount
 
+    Notes
+    -----
+    Requires scipy, e.g. ``pip install netto[integration]``.
+
     Examples
     --------
     >>> calc_income_tax_by_integration(10000)
     """
+    # scipy is only needed here, so it is not imported with the package
+    from scipy.integrate import quad
+
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
 
-    income_tax, _ = quad(
-        lambda ti: get_marginal_tax_rate(ti, config), 0, taxable_income
-    )
+    curve = get_tax_curve(config.year, config.is_married)
+    integrand = curve.marginal_rate
+    recorder = instrumentation.active_recorder
+    if recorder is not None:
+        integrand = recorder.counting("marginal_tax_rate", integrand)
+    income_tax, _ = quad(integrand, 0, taxable_income)
     return income_tax
+
+
+def calc_income_tax_analytic(
+    taxable_income: float, config: TaxConfig | None = None
+) -> float:
+    """
+    Calculate income tax from the closed-form integral of marginal tax rates.
+
+    Evaluates the antiderivative of the piecewise linear marginal tax rate
+    used by `calc_income_tax_by_integration` directly, so the result matches
+    the numerical integration without calling `quad`.
+
+    Parameters
+    ----------
+    taxable_income: float
+        Taxable income
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+
+    Returns
+    -------
+    float
+        Income tax amount
+
+    Examples
+    --------
+    >>> calc_income_tax_analytic(10000)
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    return get_tax_curve(config.year, config.is_married).income_tax(taxable_income)
+
+
+def calc_income_tax_analytic_array(
+    taxable_income, config: TaxConfig | None = None
+) -> np.ndarray:
+    """
+    Calculate income tax from the closed-form integral for an array of incomes.
+
+    Vectorized counterpart of `calc_income_tax_analytic`; brackets are picked
+    with ``numpy.searchsorted`` and the results match the scalar function
+    elementwise.
+
+    Parameters
+    ----------
+    taxable_income : array_like
+        Taxable incomes
+    config : TaxConfig, optional
+        Tax configuration (uses defaults if not provided)
+
+    Returns
+    -------
+    numpy.ndarray
+        Income tax amounts
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    curve = get_tax_curve(config.year, config.is_married)
+    taxable_income = np.asarray(taxable_income, dtype=np.float64)
+    steps = np.asarray(curve.steps, dtype=np.float64)
+    zone = np.searchsorted(steps, taxable_income, side="right") - 1
+    below = zone < 0
+    zone = np.maximum(zone, 0)
+    dx = taxable_income - steps[zone]
+    income_tax = (
+        np.asarray(curve.offsets)[zone]
+        + (np.asarray(curve.rates)[zone] + np.asarray(curve.half_slopes)[zone] * dx)
+        * dx
+    )
+    return np.where(below, 0.0, income_tax)
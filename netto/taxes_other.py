@@ -1,5 +1,8 @@
-from netto.config import TaxConfig
+import numpy as np
+
+from netto.config import DEFAULT_CONFIG, TaxConfig
 from netto.data_loader import soli_curve
+from netto.rounding import round_array
 
 
 def calc_soli(tax_assessment: float, config: TaxConfig | None = None) -> float:
@@ -19,7 +22,7 @@ def calc_soli(tax_assessment: float, config: TaxConfig | None = None) -> float:
         The solidarity tax amount
     """
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
 
     return round(
         max(
@@ -54,6 +57,73 @@ def calc_church_tax(tax_assessment: float, config: TaxConfig | None = None) -> f
         The church tax amount
     """
     if config is None:
-        config = TaxConfig()
+        config = DEFAULT_CONFIG
 
     return round(max(tax_assessment * config.church_tax, 0), 2)
+
+
+def calc_soli_array(tax_assessment, config: TaxConfig | None = None) -> np.ndarray:
+    """
+    Calculate solidarity tax for an array of tax assessments.
+
+    Vectorized counterpart of `calc_soli`; returns the same values
+    elementwise.
+
+    Parameters
+    ----------
+    tax_assessment : array_like
+        The income tax assessment bases
+    config : TaxConfig, optional
+        Tax configuration (uses default if not provided)
+
+    Returns
+    -------
+    numpy.ndarray
+        The solidarity tax amounts
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    tax_assessment = np.asarray(tax_assessment, dtype=np.float64)
+    return round_array(
+        np.maximum(
+            np.minimum(
+                np.maximum(
+                    0,
+                    tax_assessment - soli_curve[config.year]["start_taxable_income"],
+                )
+                * soli_curve[config.year]["start_fraction"],
+                tax_assessment * soli_curve[config.year]["end_rate"],
+            ),
+            0,
+        ),
+        2,
+    )
+
+
+def calc_church_tax_array(
+    tax_assessment, config: TaxConfig | None = None
+) -> np.ndarray:
+    """
+    Calculate church tax for an array of tax assessments.
+
+    Vectorized counterpart of `calc_church_tax`; returns the same values
+    elementwise.
+
+    Parameters
+    ----------
+    tax_assessment : array_like
+        The income tax assessment bases
+    config : TaxConfig, optional
+        Tax configuration (uses default if not provided)
+
+    Returns
+    -------
+    numpy.ndarray
+        The church tax amounts
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    tax_assessment = np.asarray(tax_assessment, dtype=np.float64)
+    return round_array(np.maximum(tax_assessment * config.church_tax, 0), 2)
@@ -0,0 +1,224 @@
+"""
+Dense, year-indexed parameter arrays.
+
+The yearly data in `netto.data_loader` is a set of nested dictionaries. For
+vectorized calculations that span several years, `get_year_arrays` exposes
+the same values as NumPy arrays whose first axis is ``year - FIRST_YEAR``, so
+parameters for a whole column of years are gathered with fancy indexing.
+
+Examples
+--------
+>>> arrays = get_year_arrays()
+>>> rows = arrays.index([2018, 2025, 2025])
+>>> arrays.pension_limit[rows]
+array([78000., 96600., 96600.])
+"""
+
+from dataclasses import dataclass
+from functools import cache
+
+import numpy as np
+
+from netto.data_loader import (
+    correction_factor_pensions,
+    social_security_curve,
+    soli_curve,
+    tax_curve,
+)
+from netto.taxes_income import get_tax_curve
+
+FIRST_YEAR = 2018
+LAST_YEAR = 2026
+
+
+@dataclass(frozen=True, slots=True)
+class YearArrays:
+    """
+    Parameters of all supported years as read-only arrays.
+
+    The first axis of every yearly array is ``year - FIRST_YEAR``. The
+    compiled curve arrays have a leading axis for the marital status
+    (``0`` single, ``1`` married).
+
+    Attributes
+    ----------
+    years : numpy.ndarray
+        Covered years, shape ``(n,)``
+    tax_steps, tax_rates : numpy.ndarray
+        Bracket steps and rates as in the data files, shape ``(n, 4)``
+    tax_consts : numpy.ndarray
+        Bracket polynomial coefficients, NaN where absent, shape ``(n, 4, 3)``
+    curve_steps, curve_offsets, curve_half_slopes : numpy.ndarray
+        Steps, accumulated tax and half marginal-rate slopes of the compiled
+        tax curves, shape ``(2, n, 4)``
+    pension_limit, pension_rate : numpy.ndarray
+        Pension insurance limit and rate, shape ``(n,)``
+    unemployment_limit, unemployment_rate : numpy.ndarray
+        Unemployment insurance limit and rate, shape ``(n,)``
+    health_limit, health_rate : numpy.ndarray
+        Health insurance limit and base rate, shape ``(n,)``
+    nursing_limit, nursing_rate, nursing_extra : numpy.ndarray
+        Nursing insurance limit, base rate and surcharge for the childless,
+        shape ``(n,)``
+    soli_start, soli_fraction, soli_rate : numpy.ndarray
+        Soli threshold, phase-in fraction and full rate, shape ``(n,)``
+    pension_factor : numpy.ndarray
+        Deductible fraction of pension contributions, shape ``(n,)``
+    """
+
+    years: np.ndarray
+    tax_steps: np.ndarray
+    tax_rates: np.ndarray
+    tax_consts: np.ndarray
+    curve_steps: np.ndarray
+    curve_offsets: np.ndarray
+    curve_half_slopes: np.ndarray
+    pension_limit: np.ndarray
+    pension_rate: np.ndarray
+    unemployment_limit: np.ndarray
+    unemployment_rate: np.ndarray
+    health_limit: np.ndarray
+    health_rate: np.ndarray
+    nursing_limit: np.ndarray
+    nursing_rate: np.ndarray
+    nursing_extra: np.ndarray
+    soli_start: np.ndarray
+    soli_fraction: np.ndarray
+    soli_rate: np.ndarray
+    pension_factor: np.ndarray
+
+    def index(self, year) -> np.ndarray:
+        """
+        Convert years to row indices of the yearly arrays.
+
+        Parameters
+        ----------
+        year : int or array_like
+            Tax years
+
+        Returns
+        -------
+        numpy.ndarray
+            ``year - FIRST_YEAR`` as integer indices
+
+        Raises
+        ------
+        ValueError
+            If a year is not covered
+        """
+        year = np.asarray(year)
+        if year.size and (year.min() < FIRST_YEAR or year.max() > LAST_YEAR):
+            raise ValueError(
+                f"year must be between {FIRST_YEAR} and {LAST_YEAR}, "
+                f"got {year.min()} to {year.max()}"
+            )
+        return year.astype(np.intp) - FIRST_YEAR
+
+
+@cache
+def get_year_arrays() -> YearArrays:
+    """
+    Return the shared year-indexed parameter arrays.
+
+    Built on first use from `netto.data_loader` and the compiled tax curves.
+
+    Returns
+    -------
+    YearArrays
+        Read-only parameter arrays for all years from `FIRST_YEAR` to
+        `LAST_YEAR`
+    """
+    years = list(range(FIRST_YEAR, LAST_YEAR + 1))
+    tax_consts = np.full((len(years), 4, 3), np.nan)
+    for row, year in enumerate(years):
+        for bracket in range(4):
+            const = tax_curve[year][bracket]["const"] or ()
+            tax_consts[row, bracket, : len(const)] = const
+    curves = [[get_tax_curve(year, married) for year in years] for married in (0, 1)]
+
+    def insurance(name, key):
+        return [social_security_curve[year][name][key] for year in years]
+
+    fields = {
+        "years": years,
+        "tax_steps": [[tax_curve[y][i]["step"] for i in range(4)] for y in years],
+        "tax_rates": [[tax_curve[y][i]["rate"] for i in range(4)] for y in years],
+        "tax_consts": tax_consts,
+        "curve_steps": [[curve.steps for curve in row] for row in curves],
+        "curve_offsets": [[curve.offsets for curve in row] for row in curves],
+        "curve_half_slopes": [[curve.half_slopes for curve in row] for row in curves],
+        "pension_limit": insurance("pension", "limit"),
+        "pension_rate": insurance("pension", "rate"),
+        "unemployment_limit": insurance("unemployment", "limit"),
+        "unemployment_rate": insurance("unemployment", "rate"),
+        "health_limit": insurance("health", "limit"),
+        "health_rate": insurance("health", "rate"),
+        "nursing_limit": insurance("nursing", "limit"),
+        "nursing_rate": insurance("nursing", "rate"),
+        "nursing_extra": insurance("nursing", "extra"),
+        "soli_start": [soli_curve[year]["start_taxable_income"] for year in years],
+        "soli_fraction": [soli_curve[year]["start_fraction"] for year in years],
+        "soli_rate": [soli_curve[year]["end_rate"] for year in years],
+        "pension_factor": [correction_factor_pensions[year] for year in years],
+    }
+    arrays = {}
+    for name, values in fields.items():
+        array = np.array(values, dtype=np.int64 if name == "years" else np.float64)
+        # Shared between all callers, so guard against accidental writes
+        array.flags.writeable = False
+        arrays[name] = array
+    return YearArrays(**arrays)
+
+
+def calc_income_tax_by_year(taxable_income, year, is_married=False) -> np.ndarray:
+    """
+    Calculate income tax for rows with individual years and marital status.
+
+    Gathers the compiled tax curve of every row from `get_year_arrays` and
+    returns the same values as `calc_income_tax_analytic` row by row.
+
+    Parameters
+    ----------
+    taxable_income : array_like
+        Taxable incomes
+    year : int or array_like
+        Tax year per row or for all rows
+    is_married : bool or array_like, optional
+        Marital status per row or for all rows
+
+    Returns
+    -------
+    numpy.ndarray
+        Income tax amounts
+
+    Examples
+    --------
+    >>> calc_income_tax_by_year([40000, 40000], year=[2018, 2025])
+    """
+    arrays = get_year_arrays()
+    taxable_income = np.asarray(taxable_income, dtype=np.float64)
+    shape = np.broadcast_shapes(
+        taxable_income.shape, np.shape(year), np.shape(is_married)
+    )
+    taxable_income = np.broadcast_to(taxable_income, shape)
+    row = np.broadcast_to(arrays.index(year), shape)
+    married = np.broadcast_to(np.asarray(is_married, dtype=np.intp), shape)
+
+    steps = arrays.curve_steps[married, row]
+    # Same zone as searchsorted(side="right") - 1 on each row's steps
+    zone = np.count_nonzero(steps <= taxable_income[..., None], axis=-1) - 1
+    below = zone < 0
+    zone = np.maximum(zone, 0)[..., None]
+    dx = taxable_income - np.take_along_axis(steps, zone, axis=-1)[..., 0]
+    offsets = arrays.curve_offsets[married, row]
+    half_slopes = arrays.curve_half_slopes[married, row]
+    rates = arrays.tax_rates[row]
+    income_tax = (
+        np.take_along_axis(offsets, zone, axis=-1)[..., 0]
+        + (
+            np.take_along_axis(rates, zone, axis=-1)[..., 0]
+            + np.take_along_axis(half_slopes, zone, axis=-1)[..., 0] * dx
+        )
+        * dx
+    )
+    return np.where(below, 0.0, income_tax)
@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cache_dir(tmp_path_factory):
+    """Keep snapshots and lookup tables written by tests out of the user cache"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        path = tmp_path_factory.mktemp("netto-cache")
+        monkeypatch.setenv("NETTO_CACHE_DIR", str(path))
+        yield path
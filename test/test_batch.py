@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from netto import main
+from netto.batch import (
+    calc_inverse_netto_batch,
+    calc_netto_batch,
+    calc_netto_detailed_batch,
+    group_by_config,
+)
+from netto.config import DEFAULT_CONFIG, TaxConfig
+
+
+@pytest.fixture
+def columns():
+    rng = np.random.default_rng(42)
+    size = 400
+    return {
+        "salary": rng.uniform(0, 150000, size).round(2),
+        "deductibles": rng.choice([0.0, 1500.0], size),
+        "year": rng.choice([2018, 2022, 2025], size),
+        "has_children": rng.random(size) < 0.5,
+        "is_married": rng.random(size) < 0.5,
+        "extra_health_insurance": rng.choice([0.013, 0.025], size),
+        "church_tax": rng.choice([0.0, 0.08, 0.09], size),
+    }
+
+
+def test_calc_netto_batch_matches_scalar(columns):
+    """Test that every row equals calc_netto with its own config"""
+    result = calc_netto_batch(**columns)
+    rows = zip(
+        *(np.asarray(column).tolist() for column in columns.values()), strict=True
+    )
+    expected = [
+        main.calc_netto(
+            salary,
+            deductibles,
+            config=TaxConfig(year, has_children, is_married, extra, church_tax),
+        )
+        for salary, deductibles, year, has_children, is_married, extra, church_tax in rows
+    ]
+    assert result.tolist() == expected
+
+
+def test_calc_inverse_netto_batch_matches_array(columns):
+    """Test that the batch inverse equals the per-config array inverse"""
+    desired = columns.pop("salary") * 0.6
+    result = calc_inverse_netto_batch(desired, **columns)
+    for index, (year, married) in enumerate(
+        zip(columns["year"].tolist(), columns["is_married"].tolist(), strict=True)
+    ):
+        if index % 40:
+            continue
+        config = TaxConfig(
+            year=year,
+            has_children=bool(columns["has_children"][index]),
+            is_married=married,
+            extra_health_insurance=float(columns["extra_health_insurance"][index]),
+            church_tax=float(columns["church_tax"][index]),
+        )
+        expected = main.calc_inverse_netto_array(
+            desired[index], columns["deductibles"][index], config
+        )
+        assert result[index] == expected[0]
+
+
+def test_calc_netto_batch_defaults_and_broadcasting():
+    """Test that missing columns use defaults and scalars apply to all rows"""
+    salaries = [30000, 50000, 70000]
+    assert (
+        calc_netto_batch(salaries).tolist() == main.calc_netto_array(salaries).tolist()
+    )
+    config = TaxConfig(year=2022, is_married=True)
+    assert (
+        calc_netto_batch(salaries, year=2022, is_married=True).tolist()
+        == main.calc_netto_array(salaries, config=config).tolist()
+    )
+
+
+def test_calc_netto_batch_empty():
+    """Test that an empty batch returns an empty array"""
+    assert calc_netto_batch([]).shape == (0,)
+
+
+def test_calc_netto_batch_invalid_config():
+    """Test that invalid config values are rejected"""
+    with pytest.raises(ValueError):
+        calc_netto_batch([50000], year=[2017])
+
+
+def test_group_by_config():
+    """Test that rows are grouped by config in ascending row order"""
+    groups = list(group_by_config(4, year=[2024, 2025, 2024, 2025]))
+    assert [config.year for config, _ in groups] == [2024, 2025]
+    assert [index.tolist() for _, index in groups] == [[0, 2], [1, 3]]
+    assert groups[1][0] is DEFAULT_CONFIG
+
+
+def test_calc_netto_detailed_batch_mixed_directions():
+    """Test per-row inverse flags and configs in one breakdown batch"""
+    result = calc_netto_detailed_batch(
+        [50000, 30000, 70000],
+        deductibles=[0, 1000, 0],
+        inverse=[False, True, False],
+        year=[2025, 2024, 2022],
+    )
+    gross = main.calc_inverse_netto_array([30000], 1000, TaxConfig(year=2024))[0]
+    assert result["gross"].tolist() == [50000, gross, 70000]
+    assert result["net"].tolist() == [
+        main.calc_netto(50000),
+        main.calc_netto(gross, 1000, config=TaxConfig(year=2024)),
+        main.calc_netto(70000, config=TaxConfig(year=2022)),
+    ]
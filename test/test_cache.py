@@ -0,0 +1,109 @@
+import pytest
+
+import netto.cache as cache
+import netto.main as main
+from netto.config import TaxConfig
+
+
+@pytest.fixture(autouse=True)
+def disabled_cache():
+    """Make sure every test starts and ends with caching disabled"""
+    cache.disable_cache()
+    yield
+    cache.disable_cache()
+
+
+def test_cache_disabled_by_default():
+    """Test that nothing is cached unless enabled"""
+    main.calc_netto(50000)
+    assert cache.cache_info() is None
+
+
+def test_calc_netto_cache_hits():
+    """Test that repeated calls are served from the cache"""
+    cache.enable_cache()
+    first = main.calc_netto(50000)
+    second = main.calc_netto(50000.001)
+    info = cache.cache_info()
+    assert first == second
+    assert (info.hits, info.misses, info.size) == (1, 1, 1)
+
+
+def test_calc_netto_cache_keyed_by_config():
+    """Test that equal configs share entries and different ones do not"""
+    cache.enable_cache()
+    main.calc_netto(50000, config=TaxConfig(year=2024))
+    main.calc_netto(50000, config=TaxConfig(year=2024))
+    main.calc_netto(50000, config=TaxConfig(year=2023))
+    info = cache.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_calc_netto_cached_result_matches_uncached():
+    """Test that caching does not change results"""
+    config = TaxConfig(year=2022, is_married=True)
+    expected = main.calc_netto(61234.56, 1000, config=config)
+    cache.enable_cache()
+    assert main.calc_netto(61234.56, 1000, config=config) == expected
+    assert main.calc_netto(61234.56, 1000, config=config) == expected
+
+
+def test_calc_inverse_netto_cache():
+    """Test that inverse results are cached per method"""
+    cache.enable_cache()
+    first = main.calc_inverse_netto(30000, method="analytic")
+    second = main.calc_inverse_netto(30000, method="analytic")
+    main.calc_inverse_netto(30000)
+    info = cache.cache_info()
+    assert first == second
+    assert (info.hits, info.misses, info.size) == (1, 2, 2)
+
+
+def test_verbose_bypasses_cache(capsys):
+    """Test that verbose calls always print"""
+    cache.enable_cache()
+    main.calc_netto(50000, verbose=True)
+    main.calc_netto(50000, verbose=True)
+    assert capsys.readouterr().out.count("Yearly Evaluation") == 2
+    assert cache.cache_info().size == 0
+
+
+def test_result_cache_eviction():
+    """Test that the least recently used entry is evicted"""
+    result_cache = cache.ResultCache(maxsize=2)
+    result_cache.put("a", 1)
+    result_cache.put("b", 2)
+    result_cache.get("a")
+    result_cache.put("c", 3)
+    assert result_cache.get("b") is None
+    assert result_cache.get("a") == 1
+    assert result_cache.info().evictions == 1
+
+
+def test_result_cache_ttl(monkeypatch):
+    """Test that entries expire after the time-to-live"""
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    result_cache = cache.ResultCache(ttl=10)
+    result_cache.put("a", 1)
+    now[0] += 5
+    assert result_cache.get("a") == 1
+    now[0] += 10
+    assert result_cache.get("a") is None
+    assert result_cache.info().expirations == 1
+
+
+def test_clear_cache():
+    """Test that clearing drops entries and statistics"""
+    cache.enable_cache()
+    main.calc_netto(50000)
+    cache.clear_cache()
+    assert cache.cache_info() == cache.CacheInfo(0, 0, 0, 0, 0, 4096)
+
+
+def test_result_cache_invalid_arguments():
+    """Test that invalid sizes and TTLs are rejected"""
+    with pytest.raises(ValueError):
+        cache.ResultCache(maxsize=0)
+    with pytest.raises(ValueError):
+        cache.ResultCache(ttl=0)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+import netto.main as main
+from netto.calculator import Calculator
+from netto.config import TaxConfig
+from netto.taxes_income import get_marginal_tax_rate
+
+CONFIGS = [
+    TaxConfig(year=2022, extra_health_insurance=0.014),
+    TaxConfig(year=2019, is_married=True, has_children=True, church_tax=0.08),
+    TaxConfig(year=2025, church_tax=0.0),
+]
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_calculator_netto_matches_calc_netto(config):
+    """Test that Calculator.netto is identical to calc_netto"""
+    calculator = Calculator(config)
+    for salary in np.arange(0, 300000, 733.37).tolist():
+        for deductibles in (0, 1500):
+            assert calculator.netto(salary, deductibles) == main.calc_netto(
+                salary, deductibles, config=config
+            )
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_calculator_breakdown_matches_calc_netto_detailed(config):
+    """Test that Calculator.breakdown is identical to calc_netto_detailed"""
+    calculator = Calculator(config)
+    for salary in (0, 25000.5, 58000, 90000, 250000):
+        assert calculator.breakdown(salary, 500) == main.calc_netto_detailed(
+            salary, 500, config=config
+        )
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_calculator_inverse(config):
+    """Test that Calculator.inverse matches the analytic inverse"""
+    calculator = Calculator(config)
+    for desired_netto in (0, 12000, 30000.55, 65000, 140000):
+        assert calculator.inverse(desired_netto) == main.calc_inverse_netto(
+            desired_netto, config=config, method="analytic"
+        )
+
+
+@pytest.mark.parametrize("taxable_income", [0, 10347, 20000, 60000, 300000])
+def test_calculator_marginal_rate(taxable_income):
+    """Test that Calculator.marginal_rate matches get_marginal_tax_rate"""
+    config = TaxConfig(year=2022, is_married=True)
+    assert Calculator(config).marginal_rate(taxable_income) == get_marginal_tax_rate(
+        taxable_income, config
+    )
+
+
+def test_calculator_default_config():
+    """Test that Calculator works without a config"""
+    calculator = Calculator()
+    assert calculator.config.year == 2025
+    assert calculator.netto(50000) == main.calc_netto(50000)
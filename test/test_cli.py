@@ -0,0 +1,114 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from netto import main as netto_main
+from netto.cli import main
+from netto.config import TaxConfig
+
+
+def run_stream(lines, *args):
+    result = subprocess.run(
+        [sys.executable, "-m", "netto.cli", "--stream", *args],
+        input="".join(lines),
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [json.loads(line) for line in result.stdout.splitlines()]
+
+
+def test_gross_to_net(capsys):
+    """Test a single gross-to-net calculation"""
+    assert main(["50000", "--year", "2024", "--married"]) == 0
+    expected = netto_main.calc_netto(
+        50000, config=TaxConfig(year=2024, is_married=True)
+    )
+    assert capsys.readouterr().out == f"{expected:.2f}\n"
+
+
+def test_net_to_gross(capsys):
+    """Test a single net-to-gross calculation"""
+    main(["--inverse", "30000", "-d", "1000"])
+    expected = netto_main.calc_inverse_netto_array([30000], 1000)[0]
+    assert capsys.readouterr().out == f"{expected:.2f}\n"
+
+
+def test_json_breakdown(capsys):
+    """Test that --json prints the full breakdown"""
+    main(["60000", "--json", "--church-tax", "0"])
+    result = json.loads(capsys.readouterr().out)
+    expected = netto_main.calc_netto_detailed(60000, config=TaxConfig(church_tax=0.0))
+    assert result == {
+        name: getattr(expected, name) for name in expected.__dataclass_fields__
+    }
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["--year", "2017", "50000"],
+        ["--stream", "50000"],
+        ["nan"],
+        ["--deductibles", "inf", "50000"],
+    ],
+)
+def test_invalid_arguments(argv):
+    """Test that invalid arguments exit with a usage error"""
+    with pytest.raises(SystemExit) as error:
+        main(argv)
+    assert error.value.code == 2
+
+
+def test_stream():
+    """Test mixed directions, per-row configs, ids and errors"""
+    lines = [
+        '{"salary": 50000, "id": "a"}\n',
+        '{"desired_netto": 35000, "year": 2024}\n',
+        "not json\n",
+        '{"salary": 1, "year": 1999}\n',
+        "\n",
+        '{"salary": 60000, "is_married": true, "deductibles": 500}',
+    ]
+    results = run_stream(lines, "--batch-size", "2")
+    assert len(results) == 5
+    assert results[0]["id"] == "a"
+    assert results[0]["net"] == netto_main.calc_netto(50000)
+    assert (
+        results[1]["gross"]
+        == netto_main.calc_inverse_netto_array([35000], config=TaxConfig(year=2024))[0]
+    )
+    assert "error" in results[2]
+    assert "error" in results[3]
+    assert results[4]["net"] == netto_main.calc_netto(
+        60000, 500, config=TaxConfig(is_married=True)
+    )
+
+
+def test_stream_rejects_non_finite_values():
+    """Test that NaN and infinite inputs produce error lines, not invalid JSON"""
+    lines = [
+        '{"salary": NaN}\n',
+        '{"desired_netto": Infinity}\n',
+        '{"salary": "inf"}\n',
+        '{"salary": 50000, "deductibles": -Infinity}\n',
+        '{"salary": 50000, "church_tax": NaN}\n',
+        '{"salary": 50000}\n',
+    ]
+    results = run_stream(lines)
+    assert all("finite" in result["error"] for result in results[:5])
+    assert results[5]["net"] == netto_main.calc_netto(50000)
+
+
+def test_stream_uses_command_line_defaults():
+    """Test that rows without config fields use the command-line options"""
+    results = run_stream(['{"salary": 45000}\n'], "--year", "2022", "--children")
+    expected = netto_main.calc_netto(
+        45000, config=TaxConfig(year=2022, has_children=True)
+    )
+    assert results[0]["net"] == expected
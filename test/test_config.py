@@ -1,6 +1,6 @@
 import pytest
 
-from netto.config import TaxConfig
+from netto.config import DEFAULT_CONFIG, FrozenTaxConfig, TaxConfig, intern_config
 
 
 def test_taxconfig_defaults():
@@ -53,3 +53,48 @@ def test_taxconfig_validation_type_errors():
         TaxConfig(has_children="True")  # String instead of bool
     with pytest.raises(TypeError):
         TaxConfig(is_married=1)  # Int instead of bool
+
+
+def test_frozen_taxconfig_is_hashable_and_immutable():
+    """Test that FrozenTaxConfig can be used as a cache key"""
+    config = FrozenTaxConfig(year=2024, is_married=True)
+    assert hash(config) == hash(FrozenTaxConfig(year=2024, is_married=True))
+    with pytest.raises(AttributeError):
+        config.year = 2025
+
+
+def test_frozen_taxconfig_validation():
+    """Test that FrozenTaxConfig validates like TaxConfig"""
+    with pytest.raises(ValueError):
+        FrozenTaxConfig(year=2017)
+    with pytest.raises(TypeError):
+        FrozenTaxConfig(is_married=1)
+
+
+def test_intern_config_shares_instances():
+    """Test that identical configs map to one interned instance"""
+    first = intern_config(TaxConfig(year=2024, church_tax=0.0))
+    second = TaxConfig(year=2024, church_tax=0.0).freeze()
+    assert first is second
+    assert isinstance(first, FrozenTaxConfig)
+    assert intern_config(TaxConfig(year=2023)) is not first
+
+
+def test_intern_config_is_bounded():
+    """Test that the interned configurations are evicted least recently used"""
+    import netto.config as config_module
+
+    interned = config_module.__dict__["__INTERNED"]
+    kept = intern_config(TaxConfig(year=2024, church_tax=0.0))
+    for i in range(2000):
+        intern_config(TaxConfig(year=2024, extra_health_insurance=i / 100_000))
+        intern_config(TaxConfig(year=2024, church_tax=0.0))
+    assert len(interned) == config_module.__dict__["__INTERNED_SIZE"]
+    assert intern_config(TaxConfig(year=2024, church_tax=0.0)) is kept
+
+
+def test_intern_config_default():
+    """Test that the default config is a shared singleton"""
+    assert intern_config() is DEFAULT_CONFIG
+    assert intern_config(TaxConfig()) is DEFAULT_CONFIG
+    assert DEFAULT_CONFIG == FrozenTaxConfig()
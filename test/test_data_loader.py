@@ -2,6 +2,7 @@ import pytest
 from pydantic import ValidationError
 
 from netto.data_loader import (
+    LazyYearDict,
     PensionFactor,
     SocialSecurity,
     SocialSecurityEntry,
@@ -377,3 +378,35 @@ def test_pension_factor_value_2022():
     factor_2022 = load_pension_factor(2022)
 
     assert factor_2022 == 0.88
+
+
+# Tests for lazy loading
+
+
+def test_lazy_year_dict_loads_on_access():
+    """Test that a year is only loaded when accessed"""
+    curves = LazyYearDict(load_tax_curve, "tax_curves")
+    assert 2022 in curves
+    assert dict.__len__(curves) == 0
+    assert curves[2022] == load_tax_curve(2022)
+    assert dict.__len__(curves) == 1
+
+
+def test_lazy_year_dict_behaves_like_load_all():
+    """Test that the lazy dict equals the eagerly loaded dict"""
+    social_security = LazyYearDict(
+        load_social_security, "social_security", extra={2027: NotImplementedError}
+    )
+    assert len(social_security) == len(load_all_social_security())
+    assert social_security == load_all_social_security()
+    assert list(social_security) == list(load_all_social_security())
+
+
+def test_lazy_year_dict_missing_year():
+    """Test that years without data raise KeyError"""
+    factors = LazyYearDict(load_pension_factor, "pension_factors")
+    assert 2017 not in factors
+    with pytest.raises(KeyError):
+        factors[2017]
+    assert factors.get(2017) is None
+    assert factors.get(2022) == 0.88
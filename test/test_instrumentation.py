@@ -0,0 +1,109 @@
+import pytest
+
+import netto.instrumentation as instrumentation
+import netto.main as main
+from netto.config import TaxConfig
+from netto.social_security import calc_social_security_by_integration
+from netto.taxes_income import calc_income_tax_by_integration
+
+
+@pytest.fixture(autouse=True)
+def disabled_instrumentation():
+    """Make sure every test starts and ends with instrumentation disabled"""
+    instrumentation.instrument(False)
+    yield
+    instrumentation.instrument(False)
+
+
+def test_disabled_by_default():
+    """Test that nothing is recorded unless enabled"""
+    main.calc_netto(50000)
+    assert instrumentation.stats() is None
+
+
+def test_results_unchanged():
+    """Test that instrumented calls return the same values"""
+    expected = main.calc_netto(50000), main.calc_inverse_netto(35000)
+    instrumentation.instrument()
+    assert (main.calc_netto(50000), main.calc_inverse_netto(35000)) == expected
+
+
+def test_stage_times():
+    """Test that every pipeline stage is timed for each evaluation"""
+    instrumentation.instrument()
+    main.calc_netto(50000)
+    main.calc_netto_detailed(60000)
+    stats = instrumentation.stats()
+    assert stats.netto_calls == 2
+    assert tuple(stats.stage_seconds) == instrumentation.STAGES
+    assert all(seconds > 0 for seconds in stats.stage_seconds.values())
+
+
+@pytest.mark.parametrize("method", ["newton", "analytic"])
+def test_inverse_log(method):
+    """Test that each inverse call is logged with its own evaluation count"""
+    instrumentation.instrument()
+    config = TaxConfig(year=2024)
+    main.calc_inverse_netto(20000, config=config, method=method)
+    main.calc_inverse_netto(80000, 500, config=config, method=method)
+    stats = instrumentation.stats()
+    assert stats.inverse_calls == 2
+    assert [record.desired_netto for record in stats.inverse] == [20000, 80000]
+    assert stats.inverse[1].deductibles == 500
+    assert all(record.year == 2024 for record in stats.inverse)
+    assert all(record.method == method for record in stats.inverse)
+    assert stats.netto_calls == sum(record.netto_calls for record in stats.inverse)
+    assert stats.solver_iterations == sum(record.iterations for record in stats.inverse)
+    if method == "newton":
+        # Two starting points, then one evaluation per iteration but the last
+        assert all(
+            record.netto_calls == record.iterations + 1 for record in stats.inverse
+        )
+    else:
+        assert stats.solver_iterations == 0
+
+
+def test_inverse_log_failed_call():
+    """Test that calls that raise are logged too"""
+    instrumentation.instrument()
+    with pytest.raises(RuntimeError):
+        main.calc_inverse_netto(35000.005)
+    assert instrumentation.stats().inverse_calls == 1
+
+
+def test_inverse_log_size():
+    """Test that only the most recent calls are kept"""
+    instrumentation.instrument(log_size=2)
+    for desired in (20000, 30000, 40000):
+        main.calc_inverse_netto(desired, method="analytic")
+    stats = instrumentation.stats()
+    assert stats.inverse_calls == 3
+    assert [record.desired_netto for record in stats.inverse] == [30000, 40000]
+
+
+def test_quad_evaluations():
+    """Test that integrand evaluations inside quad are counted per integrand"""
+    pytest.importorskip("scipy")
+    instrumentation.instrument()
+    calc_income_tax_by_integration(40000)
+    calc_social_security_by_integration(50000)
+    stats = instrumentation.stats()
+    assert stats.quad_calls == 5
+    assert set(stats.quad_evaluations) == {
+        "marginal_tax_rate",
+        "pension_rate",
+        "health_rate",
+        "nursing_rate",
+        "unemployment_rate",
+    }
+    assert all(count > 0 for count in stats.quad_evaluations.values())
+
+
+def test_reset_stats():
+    """Test that resetting zeroes the active recorder"""
+    instrumentation.instrument()
+    main.calc_inverse_netto(35000)
+    instrumentation.reset_stats()
+    stats = instrumentation.stats()
+    assert (stats.netto_calls, stats.inverse_calls, stats.inverse) == (0, 0, ())
+    assert set(stats.stage_seconds.values()) == {0.0}
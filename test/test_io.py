@@ -0,0 +1,186 @@
+import csv
+
+import pytest
+
+from netto import main
+from netto.config import TaxConfig
+from netto.io import RESULT_COLUMNS, process_file
+
+
+@pytest.fixture
+def payroll(tmp_path):
+    path = tmp_path / "payroll.csv"
+    rows = [
+        ("id", "brutto", "freibetrag", "jahr", "verheiratet"),
+        ("a", "50000", "0", "2024", "false"),
+        ("b", "72000.5", "1500", "2025", "true"),
+        ("c", "0", "0", "2022", "0"),
+        ("d", "120000", "200", "2025", "1"),
+        ("e", "31000", "0", "2018", "False"),
+    ]
+    with open(path, "w", newline="") as f:
+        csv.writer(f).writerows(rows)
+    return path
+
+
+COLUMNS = {
+    "salary": "brutto",
+    "deductibles": "freibetrag",
+    "year": "jahr",
+    "is_married": "verheiratet",
+}
+
+
+def read_csv(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+def test_process_file_csv(payroll, tmp_path, chunk_size):
+    """Test that every row gets the scalar breakdown of its own config"""
+    output = tmp_path / "out.csv"
+    config = TaxConfig(church_tax=0.0)
+    rows = process_file(payroll, output, COLUMNS, config, chunk_size=chunk_size)
+    assert rows == 5
+
+    result = read_csv(output)
+    assert [row["id"] for row in result] == ["a", "b", "c", "d", "e"]
+    for row in result:
+        expected = main.calc_netto_detailed(
+            float(row["brutto"]),
+            float(row["freibetrag"]),
+            TaxConfig(
+                year=int(row["jahr"]),
+                is_married=row["verheiratet"].lower() in ("true", "1"),
+                church_tax=0.0,
+            ),
+        )
+        for name in RESULT_COLUMNS:
+            assert float(row[name]) == getattr(expected, name)
+
+
+def test_process_file_inverse(tmp_path):
+    """Test the net-to-gross direction with default column names"""
+    path = tmp_path / "targets.csv"
+    path.write_text("desired_netto\n20000\n35000.5\n")
+    output = tmp_path / "out.csv"
+    process_file(path, output, inverse=True)
+    result = read_csv(output)
+    expected = main.calc_inverse_netto_array([20000, 35000.5])
+    assert [float(row["gross"]) for row in result] == expected.tolist()
+    for row in result:
+        assert abs(float(row["net"]) - float(row["desired_netto"])) < 1
+
+
+def test_process_file_header_only(tmp_path):
+    """Test that a file without rows produces just the header"""
+    path = tmp_path / "empty.csv"
+    path.write_text("salary\n")
+    output = tmp_path / "out.csv"
+    assert process_file(path, output) == 0
+    assert output.read_text().strip() == ",".join(("salary",) + RESULT_COLUMNS)
+
+
+def test_process_file_header_only_parquet(tmp_path):
+    """Test that a file without rows still produces a Parquet file with schema"""
+    pa = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "empty.csv"
+    path.write_text("salary\n")
+    output = tmp_path / "out.parquet"
+    assert process_file(path, output) == 0
+    table = parquet.read_table(output)
+    assert table.num_rows == 0
+    assert table.column_names == ["salary", *RESULT_COLUMNS]
+    assert table.schema.field("salary").type == pa.string()
+    assert table.schema.field("net").type == pa.float64()
+
+    empty_parquet = tmp_path / "empty.parquet"
+    parquet.write_table(pa.table({"salary": pa.array([], pa.float64())}), empty_parquet)
+    assert process_file(empty_parquet, output) == 0
+    assert parquet.read_table(output).schema.field("salary").type == pa.float64()
+
+
+@pytest.mark.parametrize("row", ["50000,2024,extra", "50000", ""])
+def test_process_file_malformed_row(tmp_path, row):
+    """Test that rows with the wrong number of fields name their line"""
+    path = tmp_path / "payroll.csv"
+    path.write_text(f"salary,year\n40000,2024\n{row}\n60000,2025\n")
+    with pytest.raises(ValueError, match="line 3"):
+        process_file(path, tmp_path / "out.csv", {"salary": "salary", "year": "year"})
+
+
+@pytest.mark.parametrize("value", ["ja", "2", "ture", ""])
+def test_process_file_invalid_boolean(tmp_path, value):
+    """Test that unknown boolean tokens and empty cells are rejected"""
+    path = tmp_path / "payroll.csv"
+    path.write_text(f"salary,is_married\n50000,true\n60000,{value}\n")
+    columns = {"salary": "salary", "is_married": "is_married"}
+    with pytest.raises(ValueError, match="is_married"):
+        process_file(path, tmp_path / "out.csv", columns)
+
+
+@pytest.mark.parametrize("values", [["true", None], [True, None]])
+def test_process_file_parquet_null_boolean(tmp_path, values):
+    """Test that missing values in string and typed Parquet columns are rejected"""
+    pa = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "payroll.parquet"
+    parquet.write_table(
+        pa.table({"salary": [50000.0, 60000.0], "is_married": values}), path
+    )
+    columns = {"salary": "salary", "is_married": "is_married"}
+    with pytest.raises(ValueError, match="is_married"):
+        process_file(path, tmp_path / "out.csv", columns)
+
+
+def test_process_file_invalid_columns(payroll, tmp_path):
+    """Test that missing, unknown and colliding columns are rejected"""
+    output = tmp_path / "out.csv"
+    with pytest.raises(KeyError):
+        process_file(payroll, output)
+    with pytest.raises(ValueError):
+        process_file(payroll, output, {"salary": "brutto", "bonus": "id"})
+    with pytest.raises(ValueError):
+        process_file(payroll, output, {"deductibles": "freibetrag"})
+    collision = tmp_path / "collision.csv"
+    collision.write_text("salary,net\n1,2\n")
+    with pytest.raises(ValueError):
+        process_file(collision, output)
+
+
+def test_process_file_parquet_output(payroll, tmp_path):
+    """Test that Parquet output holds the same values as CSV output"""
+    parquet = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "out.parquet"
+    process_file(payroll, output, COLUMNS, chunk_size=2)
+    table = parquet.read_table(output)
+    assert table.column_names == list(read_csv(payroll)[0]) + list(RESULT_COLUMNS)
+
+    csv_output = tmp_path / "out.csv"
+    process_file(payroll, csv_output, COLUMNS)
+    assert table.column("net").to_pylist() == [
+        float(row["net"]) for row in read_csv(csv_output)
+    ]
+
+
+def test_process_file_parquet_input(tmp_path):
+    """Test typed Parquet columns as input"""
+    pa = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "payroll.parquet"
+    salaries = [45000.0, 80000.0, 61000.0]
+    years = [2023, 2024, 2025]
+    married = [False, True, False]
+    parquet.write_table(
+        pa.table({"salary": salaries, "year": years, "is_married": married}), path
+    )
+    output = tmp_path / "out.csv"
+    columns = {"salary": "salary", "year": "year", "is_married": "is_married"}
+    process_file(path, output, columns, chunk_size=2)
+    expected = [
+        main.calc_netto(salary, config=TaxConfig(year=year, is_married=is_married))
+        for salary, year, is_married in zip(salaries, years, married, strict=True)
+    ]
+    assert [float(row["net"]) for row in read_csv(output)] == expected
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from netto import lookup, main
+from netto.config import TaxConfig
+
+CONFIG = TaxConfig(year=2024, is_married=True, has_children=True)
+MAX_SALARY = 20_000
+
+
+@pytest.fixture
+def table(tmp_path):
+    path = lookup.build_table(CONFIG, MAX_SALARY, tmp_path / "table.bin")
+    with lookup.NettoTable(path) as table:
+        yield table
+
+
+def test_table_matches_calculation(table):
+    """Test that every row holds the breakdown in cents"""
+    salaries = np.arange(MAX_SALARY + 1, dtype=np.float64)
+    expected = main.calc_netto_detailed_array(salaries, config=CONFIG)
+    assert table.config == CONFIG.freeze()
+    assert table.max_salary == MAX_SALARY
+    assert (table.column("net") / 100).tolist() == expected["net"].tolist()
+    for name in lookup.COLUMNS:
+        assert np.abs(table.column(name) / 100 - expected[name]).max() <= 0.005 + 1e-9
+
+
+def test_table_columns_are_read_only(table):
+    """Test that lookups cannot write to the shared mapping"""
+    with pytest.raises(ValueError):
+        table.column("net")[0] = 1
+
+
+@pytest.mark.parametrize(
+    "salary, deductibles",
+    [
+        (0, 0),
+        (12345, 0),
+        (MAX_SALARY, 0),
+        (15000.5, 0),
+        (MAX_SALARY + 1, 0),
+        (-1, 0),
+        (15000, 500),
+    ],
+)
+def test_netto_scalar(table, salary, deductibles):
+    """Test table hits and computed fallbacks against calc_netto"""
+    expected = main.calc_netto(salary, deductibles, config=CONFIG)
+    assert table.netto(salary, deductibles) == expected
+
+
+def test_netto_array(table):
+    """Test a mix of hits and fallbacks against calc_netto_array"""
+    salaries = np.array([[0, 5000, 7500.25], [MAX_SALARY, 50000, 19999]])
+    deductibles = np.array([[0, 0, 0], [0, 0, 1000]])
+    result = table.netto_array(salaries, deductibles)
+    expected = main.calc_netto_array(salaries, deductibles, config=CONFIG)
+    assert result.shape == salaries.shape
+    assert result.tolist() == expected.tolist()
+
+
+def test_breakdown(table):
+    """Test the breakdown of a hit and of a fallback"""
+    hit = table.breakdown(18000)
+    expected = main.calc_netto_detailed(18000, config=CONFIG)
+    assert hit.gross == 18000
+    assert hit.net == expected.net
+    assert abs(hit.income_tax - expected.income_tax) <= 0.005 + 1e-9
+    assert table.breakdown(18000.5) == main.calc_netto_detailed(18000.5, config=CONFIG)
+    for name in ("deductible_social_security", "taxable_income"):
+        assert type(getattr(hit, name)) is type(getattr(expected, name))
+        assert getattr(hit, name) == getattr(expected, name)
+
+
+@pytest.mark.parametrize("max_salary", [-1, lookup.MAX_SALARY + 1])
+def test_build_table_rejects_invalid_max_salary(tmp_path, max_salary):
+    """Test that salaries whose cents overflow int32 cannot be tabulated"""
+    with pytest.raises(ValueError, match="max_salary"):
+        lookup.build_table(CONFIG, max_salary, tmp_path / "table.bin")
+
+
+def test_stale_table_rejected(tmp_path):
+    """Test that a table from different tax data or a foreign file is refused"""
+    path = lookup.build_table(CONFIG, 10, tmp_path / "table.bin")
+    content = bytearray(path.read_bytes())
+    content[10] ^= 0xFF  # First byte of the source hash
+    path.write_bytes(bytes(content))
+    with pytest.raises(ValueError):
+        lookup.NettoTable(path)
+    foreign = tmp_path / "foreign.bin"
+    foreign.write_bytes(b"not a table")
+    with pytest.raises(ValueError):
+        lookup.NettoTable(foreign)
+
+
+def test_load_table_builds_and_rebuilds(tmp_path, monkeypatch):
+    """Test that load_table builds missing tables and replaces stale ones"""
+    monkeypatch.setenv("NETTO_CACHE_DIR", str(tmp_path))
+    config = TaxConfig(year=2023)
+    path = lookup.default_path(config, 100)
+    assert path.parent == tmp_path
+    assert not path.exists()
+    table = lookup.load_table(config, 100)
+    assert path.exists()
+    assert table.netto(50) == main.calc_netto(50, config=config)
+    assert lookup.load_table(config, 100) is table
+
+    stale = tmp_path / "stale.bin"
+    stale.write_bytes(b"stale")
+    assert lookup.load_table(config, 100, stale).max_salary == 100
+
+
+def test_main(tmp_path, capsys):
+    """Test building a table from the command line"""
+    path = tmp_path / "cli.bin"
+    lookup.main([str(path), "--year", "2022", "--married", "--max-salary", "50"])
+    assert str(path) in capsys.readouterr().out
+    with lookup.NettoTable(path) as table:
+        assert table.config == TaxConfig(year=2022, is_married=True).freeze()
+        assert table.max_salary == 50
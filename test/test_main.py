@@ -1,10 +1,20 @@
+import subprocess
+import sys
+from collections import OrderedDict
 from io import StringIO
+from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 import netto.main as main
 from netto.config import TaxConfig
+from netto.social_security import (
+    calc_deductible_social_security,
+    calc_social_security,
+)
+from netto.taxes_other import calc_soli
 
 
 @pytest.fixture
@@ -110,3 +120,242 @@ def test_calc_inverse_netto_with_default_none_config():
     assert result > 0
     # Verify the result makes sense (gross should be higher than net)
     assert result > 30000
+
+
+@pytest.mark.parametrize("is_married", [False, True])
+def test_calc_netto_array_matches_calc_netto(is_married):
+    """Test that the vectorized path matches calc_netto to the cent"""
+    config = TaxConfig(year=2022, is_married=is_married, extra_health_insurance=0.014)
+    salaries = np.arange(0, 300000, 123.45)
+    expected = [main.calc_netto(salary, config=config) for salary in salaries.tolist()]
+    assert main.calc_netto_array(salaries, config=config).tolist() == expected
+
+
+def test_calc_netto_array_with_deductibles_array(default_config):
+    """Test that per-salary deductibles are applied elementwise"""
+    salaries = [30000, 60000, 90000]
+    deductibles = [0, 2000, 5000]
+    result = main.calc_netto_array(salaries, deductibles, config=default_config)
+    expected = [
+        main.calc_netto(salary, deductibles=deductible, config=default_config)
+        for salary, deductible in zip(salaries, deductibles, strict=True)
+    ]
+    assert result.tolist() == expected
+
+
+def test_calc_netto_array_with_default_none_config():
+    """Test that calc_netto_array works when config=None"""
+    result = main.calc_netto_array([30000, 60000])
+    assert result.shape == (2,)
+    assert result[0] == main.calc_netto(30000)
+
+
+def test_calc_inverse_netto_array(alternate_config):
+    """Test vectorized inverse netto against known gross salaries"""
+    desired = [20894.58, 36909.71, 52091.39, 68238.23]
+    result = main.calc_inverse_netto_array(desired, config=alternate_config)
+    assert np.abs(result - [30000, 60000, 90000, 120000]).max() <= 1
+
+
+def test_calc_inverse_netto_array_roundtrip(alternate_config):
+    """Test that calc_inverse_netto_array inverts calc_netto_array"""
+    salaries = np.arange(1000, 250000, 997.0)
+    netto = main.calc_netto_array(salaries, config=alternate_config)
+    gross, info = main.calc_inverse_netto_array(
+        netto, config=alternate_config, full_output=True
+    )
+    assert info.converged.all()
+    assert np.abs(gross - salaries).max() <= 1
+
+
+def test_calc_inverse_netto_array_non_positive_targets(default_config):
+    """Test that targets of zero or less give a gross of zero"""
+    gross, info = main.calc_inverse_netto_array(
+        [-100, 0], config=default_config, full_output=True
+    )
+    assert gross.tolist() == [0, 0]
+    assert info.iterations.tolist() == [0, 0]
+
+
+@pytest.mark.parametrize(
+    "desired_netto,expected_gross",
+    [
+        (20894.58, 30000),
+        (36909.71, 60000),
+        (52091.39, 90000),
+        (68238.23, 120000),
+    ],
+)
+def test_calc_inverse_netto_analytic(desired_netto, expected_gross, alternate_config):
+    """Test analytic inverse netto calculation"""
+    result = main.calc_inverse_netto(
+        desired_netto, config=alternate_config, method="analytic"
+    )
+    assert abs(result - expected_gross) <= 1
+
+
+@pytest.mark.parametrize("is_married", [False, True])
+@pytest.mark.parametrize("deductibles", [0, 5000])
+def test_calc_inverse_netto_analytic_is_exact(is_married, deductibles):
+    """Test that the analytic inverse returns the smallest sufficient gross"""
+    config = TaxConfig(year=2024, is_married=is_married)
+    for desired_netto in [1.0, 9999.99, 25000.5, 48000, 75000.25, 150000]:
+        gross = main.calc_inverse_netto(
+            desired_netto, deductibles, config=config, method="analytic"
+        )
+        assert main.calc_netto(gross, deductibles, config=config) >= desired_netto
+        assert main.calc_netto(gross - 1, deductibles, config=config) < desired_netto
+
+
+def test_calc_inverse_netto_invalid_method():
+    """Test that unknown methods are rejected"""
+    with pytest.raises(ValueError):
+        main.calc_inverse_netto(30000, method="secant")
+
+
+@pytest.mark.parametrize("year", [2018, 2022, 2026])
+@pytest.mark.parametrize("is_married", [False, True])
+@pytest.mark.parametrize("deductibles", [0, 5000])
+def test_calc_inverse_netto_grid_matches_analytic(year, is_married, deductibles):
+    """Test that the grid inverse equals the analytic one, also beyond the grid"""
+    config = TaxConfig(year=year, is_married=is_married)
+    targets = [-1, 0, 0.01, 9999.99, 25000.5, 48000, 75000.25, 150000, 400000]
+    expected = [
+        main.calc_inverse_netto(target, deductibles, config=config, method="analytic")
+        for target in targets
+    ]
+    grid = [
+        main.calc_inverse_netto(target, deductibles, config=config, method="grid")
+        for target in targets
+    ]
+    assert grid == expected
+    result = main.calc_inverse_netto_array(
+        targets, deductibles, config=config, method="grid"
+    )
+    assert result.tolist() == expected
+
+
+def test_calc_inverse_netto_array_grid_mixed_deductibles(default_config):
+    """Test per-element deductibles and the input shape with the grid"""
+    targets = np.array([[20000, 35000.5], [90000, 250000]])
+    deductibles = np.array([[0, 1000], [1000, 0]])
+    result = main.calc_inverse_netto_array(
+        targets, deductibles, default_config, method="grid"
+    )
+    assert result.shape == targets.shape
+    expected = [
+        main.calc_inverse_netto(target, ded, default_config, method="analytic")
+        for target, ded in zip(targets.ravel(), deductibles.ravel(), strict=True)
+    ]
+    assert result.ravel().tolist() == expected
+
+
+def test_calc_inverse_netto_grid_builds_no_grids_for_deductibles(
+    default_config, monkeypatch
+):
+    """Test that distinct deductibles fall back instead of building grids"""
+    built = []
+    build = main.__dict__["__build_netto_grid"]
+
+    def counting_build(config, deductibles):
+        built.append(deductibles)
+        return build(config, deductibles)
+
+    monkeypatch.setitem(main.__dict__, "__build_netto_grid", counting_build)
+    monkeypatch.setitem(main.__dict__, "__NETTO_GRIDS", OrderedDict())
+    targets = np.linspace(10000, 80000, 200)
+    deductibles = np.where(np.arange(200) % 4 == 0, 0, np.arange(200) * 25.0)
+    result = main.calc_inverse_netto_array(
+        targets, deductibles, default_config, method="grid"
+    )
+    scalar = [
+        main.calc_inverse_netto(target, ded, default_config, method="grid")
+        for target, ded in zip(targets, deductibles, strict=True)
+    ]
+    assert built == [0.0]
+    expected = [
+        main.calc_inverse_netto(target, ded, default_config, method="analytic")
+        for target, ded in zip(targets, deductibles, strict=True)
+    ]
+    assert result.tolist() == scalar == expected
+
+    # An explicitly built grid is used from then on
+    grid = main.get_netto_grid(default_config, 25.0)
+    assert built == [0.0, 25.0]
+    assert main.calc_inverse_netto(40000, 25.0, default_config, method="grid") == (
+        float(grid.searchsorted(40000))
+    )
+
+
+def test_calc_inverse_netto_array_invalid_method():
+    """Test that unknown methods and grid with full_output are rejected"""
+    with pytest.raises(ValueError):
+        main.calc_inverse_netto_array([30000], method="newton")
+    with pytest.raises(ValueError):
+        main.calc_inverse_netto_array([30000], method="grid", full_output=True)
+
+
+def test_get_netto_grid(alternate_config):
+    """Test that grids are cached, read-only and match calc_netto"""
+    grid = main.get_netto_grid(alternate_config)
+    assert main.get_netto_grid(alternate_config) is grid
+    assert grid.size == main.GRID_MAX_SALARY + 1
+    assert not grid.flags.writeable
+    for salary in (0, 12345, main.GRID_MAX_SALARY):
+        assert grid[salary] == main.calc_netto(salary, config=alternate_config)
+
+
+@pytest.mark.parametrize("salary", [0, 30000, 60000, 90000, 120000])
+def test_calc_netto_detailed(salary, default_config):
+    """Test that the breakdown is consistent with the scalar functions"""
+    result = main.calc_netto_detailed(salary, 1000, config=default_config)
+    assert result.net == main.calc_netto(salary, 1000, config=default_config)
+    assert result.deductible_social_security == (
+        calc_deductible_social_security(salary, default_config)
+    )
+    assert result.social_security == calc_social_security(salary, default_config)
+    assert result.pension + result.health + result.nursing + result.unemployment == (
+        pytest.approx(result.social_security, abs=0.01)
+    )
+    assert result.soli == calc_soli(result.income_tax, default_config)
+
+
+def test_calc_netto_detailed_is_immutable():
+    """Test that NettoResult cannot be modified"""
+    result = main.calc_netto_detailed(50000)
+    with pytest.raises(AttributeError):
+        result.net = 0
+
+
+def test_calc_netto_detailed_array(alternate_config):
+    """Test that every breakdown column matches the scalar breakdown"""
+    salaries = np.array([0, 12000.5, 45000, 70000, 99000, 250000])
+    deductibles = np.array([0, 500, 1000, 0, 2500, 100])
+    result = main.calc_netto_detailed_array(salaries, deductibles, alternate_config)
+    expected = [
+        main.calc_netto_detailed(salary, deductible, config=alternate_config)
+        for salary, deductible in zip(
+            salaries.tolist(), deductibles.tolist(), strict=True
+        )
+    ]
+    assert list(result) == list(main.NettoResult.__dataclass_fields__)
+    for name, column in result.items():
+        assert column.tolist() == [getattr(row, name) for row in expected]
+
+
+def test_import_does_not_load_scipy():
+    """Test that calc_netto and both inverse methods work without scipy"""
+    code = (
+        "import sys; import netto; netto.calc_netto(50000); "
+        "netto.calc_inverse_netto(30000); "
+        "netto.calc_inverse_netto(30000, method='analytic'); "
+        "print('scipy' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from netto import main
+from netto.config import TaxConfig
+from netto.parallel import NettoPool, map_netto
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with NettoPool(workers=2) as pool:
+        yield pool
+
+
+@pytest.fixture
+def salaries():
+    return np.random.default_rng(7).uniform(0, 150000, 5003).round(2)
+
+
+def test_map_netto_matches_array(pool, salaries):
+    """Test that chunked results come back complete and in order"""
+    result = pool.map_netto(salaries, chunk_size=700)
+    assert result.tolist() == main.calc_netto_array(salaries).tolist()
+
+
+def test_map_netto_per_element_deductibles(pool, salaries):
+    """Test per-element deductibles and a custom config"""
+    deductibles = np.where(np.arange(salaries.size) % 2, 2000.0, 0.0)
+    config = TaxConfig(year=2022, is_married=True)
+    result = pool.map_netto(salaries, deductibles, config, chunk_size=1000)
+    expected = main.calc_netto_array(salaries, deductibles, config)
+    assert result.tolist() == expected.tolist()
+
+
+def test_map_netto_inverse(pool, salaries):
+    """Test the net-to-gross direction"""
+    desired = salaries[:600] * 0.6
+    result = pool.map_netto(desired, inverse=True, chunk_size=100)
+    expected = main.calc_inverse_netto_array(desired)
+    assert result.tolist() == expected.tolist()
+
+
+def test_map_netto_pool_is_reusable(pool):
+    """Test consecutive calls with differently sized inputs"""
+    assert pool.map_netto([50000.0], chunk_size=1).tolist() == [main.calc_netto(50000)]
+    assert pool.map_netto([], chunk_size=1).shape == (0,)
+
+
+def test_map_netto_temporary_pool(salaries):
+    """Test the module-level function with and without worker processes"""
+    expected = main.calc_netto_array(salaries).tolist()
+    assert map_netto(salaries, workers=2, chunk_size=2000).tolist() == expected
+    assert map_netto(salaries, workers=1).tolist() == expected
+
+
+def test_map_netto_invalid_chunk_size(pool):
+    """Test that chunk sizes below one are rejected"""
+    with pytest.raises(ValueError):
+        pool.map_netto([1.0], chunk_size=0)
@@ -0,0 +1,36 @@
+import pytest
+
+from netto.config import TaxConfig
+from netto.parameters import get_parameters
+
+
+def test_get_parameters_shared_per_config():
+    """Test that identical configs share one parameter bundle"""
+    parameters = get_parameters(TaxConfig(year=2022))
+    assert get_parameters(TaxConfig(year=2022)) is parameters
+    assert get_parameters(TaxConfig(year=2023)) is not parameters
+
+
+def test_get_parameters_values():
+    """Test that rates include the configured extras"""
+    parameters = get_parameters(
+        TaxConfig(year=2022, extra_health_insurance=0.014, has_children=False)
+    )
+    assert parameters.pension_rate == 0.093
+    assert parameters.pension_limit == 84600
+    assert parameters.health_rate == pytest.approx(0.08)
+    assert parameters.health_deductible_rate == pytest.approx(0.077)
+    assert parameters.nursing_rate == pytest.approx(0.01525 + 0.0035)
+    assert parameters.pension_factor == 0.88
+    assert parameters.tax_curve.year == 2022
+
+
+def test_get_parameters_with_children():
+    """Test that the nursing surcharge is dropped with children"""
+    parameters = get_parameters(TaxConfig(year=2022, has_children=True))
+    assert parameters.nursing_rate == pytest.approx(0.01525)
+
+
+def test_get_parameters_default_none_config():
+    """Test that get_parameters works when config=None"""
+    assert get_parameters().config.year == 2025
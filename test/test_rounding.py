@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from netto.rounding import round_array
+
+
+@pytest.mark.parametrize("ndigits", [0, 1, 2])
+def test_round_array_matches_builtin_round(ndigits):
+    """Test that round_array agrees with round() on many values"""
+    rng = np.random.default_rng(42)
+    values = np.concatenate(
+        [rng.uniform(-1e6, 1e6, 10000), np.arange(-5000, 5000) / 1000]
+    )
+    expected = [round(value, ndigits) for value in values.tolist()]
+    assert round_array(values, ndigits).tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (2.675, 2.67),
+        (0.125, 0.12),
+        (0.375, 0.38),
+        (1.005, 1.0),
+        (-0.001, -0.0),
+    ],
+)
+def test_round_array_ambiguous_halves(value, expected):
+    """Test values where numpy.round differs from the builtin round()"""
+    assert round_array([value], 2)[0] == expected
+
+
+def test_round_array_zero_dimensional():
+    """Test that scalar input with an ambiguous half is rounded like round()"""
+    assert round_array(2.675, 2) == 2.67
+    assert round_array(2.675, 2).ndim == 0
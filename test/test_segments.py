@@ -0,0 +1,70 @@
+import math
+
+import pytest
+
+import netto.main as main
+from netto.config import TaxConfig
+from netto.segments import find_net_segment, get_net_segments
+
+
+@pytest.fixture
+def default_config():
+    """Fixture providing default config for tests"""
+    return TaxConfig(
+        year=2022, extra_health_insurance=0.014, church_tax=0.09, has_children=False
+    )
+
+
+def test_segments_cover_all_salaries(default_config):
+    """Test that segments are contiguous from zero to infinity"""
+    segments = get_net_segments(default_config)
+    assert segments[0].start == 0
+    assert segments[-1].end == math.inf
+    for previous, current in zip(segments[:-1], segments[1:], strict=True):
+        assert previous.end == current.start
+
+
+def test_segments_are_continuous(default_config):
+    """Test that neighbouring segments agree at their common boundary"""
+    segments = get_net_segments(default_config)
+    for previous, current in zip(segments[:-1], segments[1:], strict=True):
+        boundary = current.start
+        assert previous.evaluate(boundary) == pytest.approx(
+            current.evaluate(boundary), abs=1e-6
+        )
+
+
+@pytest.mark.parametrize("is_married", [False, True])
+@pytest.mark.parametrize("salary", [5000, 20000, 45000, 70000, 90000, 150000, 400000])
+def test_segments_match_calc_netto(salary, is_married):
+    """Test that the unrounded segments stay within a few euros of calc_netto"""
+    config = TaxConfig(year=2025, is_married=is_married)
+    (segment,) = [
+        segment
+        for segment in get_net_segments(config)
+        if segment.start <= salary < segment.end
+    ]
+    assert abs(segment.evaluate(salary) - main.calc_netto(salary, config=config)) < 3
+    assert segment.solve(segment.evaluate(salary)) == pytest.approx(salary)
+
+
+def test_find_net_segment(default_config):
+    """Test that the segment found for a net income contains its gross"""
+    segments = get_net_segments(default_config)
+    for segment in segments[1:-1]:
+        salary = (segment.start + segment.end) / 2
+        assert find_net_segment(segments, segment.evaluate(salary)) is segment
+
+
+def test_segment_starts_are_precomputed(default_config):
+    """Test that the net income at each segment start is stored with the segments"""
+    segments = get_net_segments(default_config)
+    assert segments.starts == tuple(
+        segment.evaluate(segment.start) for segment in segments
+    )
+    assert list(segments.starts) == sorted(segments.starts)
+
+
+def test_segments_are_cached(default_config):
+    """Test that segments are built once per configuration"""
+    assert get_net_segments(default_config) is get_net_segments(default_config)
@@ -0,0 +1,247 @@
+import asyncio
+import json
+
+import pytest
+
+from netto import main
+from netto import server as server_module
+from netto.config import TaxConfig
+from netto.server import (
+    _MAX_BODY,
+    LATENCY_BUCKETS_MS,
+    LatencyHistogram,
+    MicroBatcher,
+    NettoServer,
+)
+
+
+async def request(port, method, path, payload=None, connection="close"):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: {connection}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    status, response = await read_response(reader)
+    writer.close()
+    return status, response
+
+
+async def read_response(reader):
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()).strip():
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+def serve(test, **kwargs):
+    async def run():
+        server = NettoServer(port=0, **kwargs)
+        await server.start()
+        try:
+            return await test(server)
+        finally:
+            await server.close()
+
+    return asyncio.run(run())
+
+
+def test_endpoints():
+    """Test that every endpoint matches the library functions"""
+    config = TaxConfig(year=2024, is_married=True)
+
+    async def test(server):
+        netto = await request(
+            server.port,
+            "POST",
+            "/netto",
+            {"salary": 50000, "year": 2024, "is_married": True},
+        )
+        inverse = await request(
+            server.port,
+            "POST",
+            "/inverse",
+            {"desired_netto": 30000, "deductibles": 500},
+        )
+        breakdown = await request(server.port, "POST", "/breakdown", {"salary": 72000})
+        return netto, inverse, breakdown
+
+    netto, inverse, breakdown = serve(test)
+    assert netto == (200, {"net": main.calc_netto(50000, config=config)})
+    expected = main.calc_inverse_netto_array([30000], 500)[0]
+    assert inverse == (200, {"gross": expected})
+    status, result = breakdown
+    assert status == 200
+    assert result["net"] == main.calc_netto(72000)
+    assert result["gross"] == 72000
+
+
+def test_concurrent_requests_are_batched():
+    """Test that a burst of requests is answered by fewer calculations"""
+    salaries = [20000 + 1000 * i for i in range(40)]
+
+    async def test(server):
+        responses = await asyncio.gather(
+            *(
+                request(server.port, "POST", "/netto", {"salary": salary})
+                for salary in salaries
+            )
+        )
+        return responses, server.stats()
+
+    responses, stats = serve(test, window=0.05)
+    assert [net for _, net in responses] == [
+        {"net": main.calc_netto(salary)} for salary in salaries
+    ]
+    assert stats["batches"]["rows"] == len(salaries)
+    assert stats["batches"]["count"] < len(salaries)
+    assert stats["latency"]["/netto"]["count"] == len(salaries)
+
+
+def test_keep_alive_and_stats():
+    """Test several requests on one connection and the stats endpoint"""
+
+    async def test(server):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        responses = []
+        for salary in (40000, 60000):
+            body = json.dumps({"salary": salary}).encode()
+            writer.write(
+                f"POST /netto HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            responses.append(await read_response(reader))
+        writer.write(b"GET /stats HTTP/1.1\r\n\r\n")
+        responses.append(await read_response(reader))
+        writer.close()
+        return responses
+
+    first, second, (status, stats) = serve(test)
+    assert first == (200, {"net": main.calc_netto(40000)})
+    assert second == (200, {"net": main.calc_netto(60000)})
+    assert status == 200
+    assert stats["latency"]["/netto"]["count"] == 2
+    assert stats["latency"]["/inverse"]["count"] == 0
+
+
+@pytest.mark.parametrize(
+    "method, path, payload, status",
+    [
+        ("POST", "/netto", {"desired_netto": 1}, 400),
+        ("POST", "/netto", {"salary": 1, "year": 1990}, 400),
+        ("POST", "/netto", [1, 2], 400),
+        ("POST", "/netto", {"salary": float("nan")}, 400),
+        ("POST", "/inverse", {"desired_netto": float("inf")}, 400),
+        ("POST", "/netto", {"salary": "-inf"}, 400),
+        ("POST", "/netto", {"salary": 1, "deductibles": float("nan")}, 400),
+        ("POST", "/breakdown", {"salary": 1, "church_tax": float("nan")}, 400),
+        ("GET", "/netto", None, 405),
+        ("POST", "/stats", None, 405),
+        ("POST", "/unknown", {"salary": 1}, 404),
+    ],
+)
+def test_errors(method, path, payload, status):
+    """Test that invalid requests get an error status and message"""
+
+    async def test(server):
+        return await request(server.port, method, path, payload)
+
+    code, response = serve(test)
+    assert code == status
+    assert "error" in response
+
+
+def test_body_too_large():
+    """Test that an oversized body gets a 413 response before the connection closes"""
+
+    async def test(server):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        body = b" " * (_MAX_BODY + 1)
+        writer.write(
+            f"POST /netto HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+        response = await read_response(reader)
+        writer.close()
+        return response
+
+    status, response = serve(test)
+    assert status == 413
+    assert "error" in response
+
+
+@pytest.mark.parametrize(
+    "head",
+    [
+        b"garbage\r\n\r\n",
+        b"POST /netto\r\n\r\n",
+        b"POST /netto HTTP/1.1\r\nContent-Length: -1\r\n\r\n",
+        b"POST /netto HTTP/1.1\r\nContent-Length: ten\r\n\r\n",
+        b"POST /netto HTTP/1.1\r\nno colon\r\n\r\n",
+    ],
+)
+def test_malformed_request_head(head):
+    """Test that a broken request line or header is answered with 400"""
+
+    async def test(server):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(head)
+        await writer.drain()
+        response = await read_response(reader)
+        writer.close()
+        return response
+
+    status, response = serve(test)
+    assert status == 400
+    assert "error" in response
+
+
+def test_calculation_failure(monkeypatch):
+    """Test that a failing batch is answered with a 500 JSON error"""
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(server_module, "calc_netto_detailed_batch", fail)
+
+    async def test(server):
+        return await request(server.port, "POST", "/netto", {"salary": 50000})
+
+    status, response = serve(test)
+    assert status == 500
+    assert "boom" in response["error"]
+
+
+def test_full_batch_cancels_window_timer():
+    """Test that a batch flushed by size does not leave its timer running"""
+
+    async def test():
+        batcher = MicroBatcher(window=60, max_batch=2)
+        row = (50000.0, 0.0, False, 2025, False, False, 0.025, 0.09)
+        results = await asyncio.gather(batcher.submit(row), batcher.submit(row))
+        return batcher, results
+
+    batcher, results = asyncio.run(test())
+    assert batcher.batches == 1
+    assert results[0] == results[1]
+    assert batcher._timer is None
+
+
+def test_latency_histogram():
+    """Test bucket assignment and the snapshot layout"""
+    histogram = LatencyHistogram()
+    histogram.observe(0.0001)
+    histogram.observe(0.003)
+    histogram.observe(10.0)
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 3
+    assert len(snapshot["buckets"]) == len(LATENCY_BUCKETS_MS) + 1
+    assert snapshot["buckets"]["le_0.5"] == 1
+    assert snapshot["buckets"]["le_5"] == 1
+    assert snapshot["buckets"]["le_inf"] == 1
@@ -0,0 +1,155 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from netto import data_loader, snapshot
+
+
+@pytest.fixture
+def snapshot_file(tmp_path):
+    return snapshot.write_snapshot(tmp_path / "snapshot.bin")
+
+
+def test_round_trip_matches_validated_data(snapshot_file):
+    """Test that reading a snapshot reproduces the validated JSON data"""
+    data = snapshot.read_snapshot(snapshot_file)
+    assert data == snapshot.load_validated()
+
+
+def test_round_trip_preserves_types(snapshot_file):
+    """Test that None values and list coefficients survive the round trip"""
+    data = snapshot.read_snapshot(snapshot_file)
+    expected = snapshot.load_validated()
+    for year, curve in expected["tax_curve"].items():
+        for index, bracket in curve.items():
+            const = data["tax_curve"][year][index]["const"]
+            assert type(const) is type(bracket["const"])
+    for year, entries in expected["social_security_curve"].items():
+        for insurance, entry in entries.items():
+            extra = data["social_security_curve"][year][insurance]["extra"]
+            assert (extra is None) == (entry["extra"] is None)
+
+
+def test_too_many_coefficients_are_rejected(tmp_path):
+    """Test that brackets with more coefficients than the layout holds raise"""
+    data = snapshot.load_validated()
+    year = min(data["tax_curve"])
+    data["tax_curve"] = {
+        year: {
+            index: dict(bracket, const=[1.0, 2.0, 3.0, 4.0])
+            for index, bracket in data["tax_curve"][year].items()
+        }
+    }
+    with pytest.raises(ValueError, match="at most 3"):
+        snapshot.write_snapshot(tmp_path / "snapshot.bin", data)
+    assert not (tmp_path / "snapshot.bin").exists()
+
+
+def test_stale_hash_is_rejected(snapshot_file):
+    """Test that a snapshot built from other data files is ignored"""
+    assert snapshot.read_snapshot(snapshot_file, expected_hash=b"\0" * 32) is None
+
+
+def test_corrupt_file_is_rejected(snapshot_file):
+    """Test that truncated or foreign files are ignored"""
+    content = snapshot_file.read_bytes()
+    snapshot_file.write_bytes(content[:-1])
+    assert snapshot.read_snapshot(snapshot_file) is None
+    snapshot_file.write_bytes(b"garbage")
+    assert snapshot.read_snapshot(snapshot_file) is None
+
+
+def test_missing_file_is_rejected(tmp_path):
+    """Test that a missing snapshot returns None"""
+    assert snapshot.read_snapshot(tmp_path / "missing.bin") is None
+
+
+def test_source_hash_is_stable():
+    """Test that the source hash only depends on the data files"""
+    assert snapshot.source_hash() == snapshot.source_hash()
+    assert len(snapshot.source_hash()) == 32
+
+
+def test_load_or_build_missing_snapshot(tmp_path, monkeypatch):
+    """Test that a missing snapshot leaves validation to the per-year loaders"""
+    monkeypatch.setenv("NETTO_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("NETTO_SNAPSHOT", raising=False)
+    data = snapshot.load_or_build()
+    assert all(years == {} for years in data.values())
+    assert not (tmp_path / "snapshot.bin").exists()
+
+
+def test_update_snapshot_merges_loaded_years(tmp_path):
+    """Test that years validated by the data loader are added to the snapshot"""
+    path = tmp_path / "snapshot.bin"
+    empty = {key: {} for key in snapshot.load_validated()}
+    curve = data_loader.tax_curve[2022]
+    assert snapshot.update_snapshot(empty, path)
+    data = snapshot.read_snapshot(path)
+    assert data["tax_curve"][2022] == curve
+    assert not snapshot.update_snapshot(data, path)
+
+
+def test_first_run_validates_only_used_years(tmp_path):
+    """Test that a cold start validates one year and writes it at exit"""
+    code = (
+        "import sys; from netto import calc_netto, data_loader; "
+        "from netto.config import TaxConfig; "
+        "calc_netto(50000, config=TaxConfig(year=2024)); "
+        "print(len(dict.keys(data_loader.tax_curve)), 'pydantic' in sys.modules)"
+    )
+    env = {"NETTO_CACHE_DIR": str(tmp_path), "PATH": ""}
+
+    def run():
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+
+    assert run() == ["1", "True"]
+    assert list(snapshot.read_snapshot(tmp_path / "snapshot.bin")["tax_curve"]) == [
+        2024
+    ]
+    assert run() == ["1", "False"]
+
+
+def test_load_or_build_disabled(tmp_path, monkeypatch):
+    """Test that NETTO_SNAPSHOT=0 disables the snapshot"""
+    monkeypatch.setenv("NETTO_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("NETTO_SNAPSHOT", "0")
+    assert snapshot.load_or_build() is None
+    assert not (tmp_path / "snapshot.bin").exists()
+
+
+def test_update_snapshot_read_only(tmp_path):
+    """Test that an unwritable cache directory is skipped silently"""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    data_loader.tax_curve[2022]
+    empty = {key: {} for key in snapshot.load_validated()}
+    assert not snapshot.update_snapshot(empty, blocker / "netto" / "snapshot.bin")
+
+
+def test_import_without_pydantic(tmp_path):
+    """Test that a calculation from a fresh snapshot does not import pydantic"""
+    code = (
+        "import sys; from netto import calc_netto; calc_netto(50000); "
+        "print('pydantic' in sys.modules)"
+    )
+    env = {"NETTO_CACHE_DIR": str(tmp_path), "PATH": ""}
+    snapshot.write_snapshot(tmp_path / "snapshot.bin")
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 import netto.social_security as social_security
@@ -111,6 +112,42 @@ def test_sameness_of_calc_social_security_different_config(salary):
     assert abs(result_direct - result_integration) < 0.02
 
 
+@pytest.mark.parametrize(
+    "salary", [0, 10000, 30000, 58050, 62100, 90000, 96600, 100000, 250000]
+)
+@pytest.mark.parametrize(
+    "config",
+    [
+        TaxConfig(),
+        TaxConfig(year=2022, extra_health_insurance=0.015, has_children=True),
+    ],
+)
+def test_sameness_of_calc_social_security_analytic(salary, config):
+    """Test that the closed form agrees with the numerical integration"""
+    result_analytic = social_security.calc_social_security_analytic(salary, config)
+    result_integration = social_security.calc_social_security_by_integration(
+        salary, config
+    )
+    assert isinstance(result_analytic, float)
+    assert abs(result_analytic - result_integration) < 0.02
+    assert result_analytic == social_security.calc_social_security(salary, config)
+
+
+def test_calc_social_security_analytic_array(default_config):
+    """Test that arrays give the scalar results elementwise"""
+    salaries = np.array([[-100, 0, 25000.5], [61000, 95000, 1e6]])
+    result = social_security.calc_social_security_analytic(salaries, default_config)
+    assert result.shape == salaries.shape
+    assert result.tolist() == [
+        [
+            social_security.calc_social_security_analytic(salary, default_config)
+            for salary in row
+        ]
+        for row in salaries.tolist()
+    ]
+    assert result[0, 0] == 0
+
+
 @pytest.mark.parametrize(
     "salary,expected",
     [
@@ -216,3 +253,97 @@ def test_calc_deductible_social_security_with_default_none_config():
     result = social_security.calc_deductible_social_security(50000)
     assert isinstance(result, int | float)
     assert result >= 0
+
+
+SALARIES = [0, 12345.67, 40000, 58050, 62100, 90600, 96600, 150000]
+
+
+@pytest.mark.parametrize(
+    "scalar,vectorized",
+    [
+        (
+            social_security.calc_insurance_pension,
+            social_security.calc_insurance_pension_array,
+        ),
+        (
+            social_security.calc_insurance_unemployment,
+            social_security.calc_insurance_unemployment_array,
+        ),
+        (
+            social_security.calc_insurance_health,
+            social_security.calc_insurance_health_array,
+        ),
+        (
+            social_security.calc_insurance_health_deductable,
+            social_security.calc_insurance_health_deductable_array,
+        ),
+        (
+            social_security.calc_insurance_nursing,
+            social_security.calc_insurance_nursing_array,
+        ),
+        (
+            social_security.calc_deductible_social_security,
+            social_security.calc_deductible_social_security_array,
+        ),
+        (
+            social_security.calc_social_security,
+            social_security.calc_social_security_array,
+        ),
+    ],
+)
+def test_array_variants_match_scalar(scalar, vectorized):
+    """Test that every array variant matches its scalar function elementwise"""
+    config = TaxConfig(year=2023, has_children=False, extra_health_insurance=0.016)
+    expected = [scalar(salary, config) for salary in SALARIES]
+    assert vectorized(SALARIES, config).tolist() == expected
+
+
+def test_array_variants_per_row_parameters():
+    """Test per-row has_children and extra_health_insurance against configs"""
+    has_children = [True, False, True, False, True, False, True, False]
+    extra_health_insurance = [0.011, 0.013, 0.017, 0.019, 0.021, 0.025, 0.0, 0.03]
+    configs = [
+        TaxConfig(year=2024, has_children=children, extra_health_insurance=extra)
+        for children, extra in zip(has_children, extra_health_insurance, strict=True)
+    ]
+    base = TaxConfig(year=2024)
+
+    health = social_security.calc_insurance_health_array(
+        SALARIES, base, extra_health_insurance=extra_health_insurance
+    )
+    nursing = social_security.calc_insurance_nursing_array(
+        SALARIES, base, has_children=has_children
+    )
+    deductible = social_security.calc_deductible_social_security_array(
+        SALARIES, base, has_children, extra_health_insurance
+    )
+    total = social_security.calc_social_security_array(
+        SALARIES, base, has_children, extra_health_insurance
+    )
+    pairs = list(zip(SALARIES, configs, strict=True))
+    assert health.tolist() == [
+        social_security.calc_insurance_health(salary, config)
+        for salary, config in pairs
+    ]
+    assert nursing.tolist() == [
+        social_security.calc_insurance_nursing(salary, config)
+        for salary, config in pairs
+    ]
+    assert deductible.tolist() == [
+        social_security.calc_deductible_social_security(salary, config)
+        for salary, config in pairs
+    ]
+    assert total.tolist() == [
+        social_security.calc_social_security(salary, config) for salary, config in pairs
+    ]
+
+
+def test_array_variants_broadcast_scalar_override():
+    """Test that a scalar override applies to all rows"""
+    result = social_security.calc_insurance_nursing_array(
+        [30000, 50000], TaxConfig(has_children=False), has_children=True
+    )
+    expected = social_security.calc_insurance_nursing_array(
+        [30000, 50000], TaxConfig(has_children=True)
+    )
+    assert result.tolist() == expected.tolist()
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from netto.solvers import bracketed_root, secant
+
+
+def test_bracketed_root_smooth_function():
+    """Test that smooth roots are found for all elements"""
+    targets = np.array([2.0, 9.0, 30.0])
+    result = bracketed_root(
+        lambda x, index: x**2 - targets[index], [0, 0, 0], [10, 10, 10], xtol=1e-9
+    )
+    assert result.converged.all()
+    assert np.allclose(result.root, np.sqrt(targets))
+
+
+def test_bracketed_root_step_function():
+    """Test that step functions converge to the jump"""
+    targets = np.array([3.5, 7.25])
+    result = bracketed_root(
+        lambda x, index: np.floor(x) - np.floor(targets[index]),
+        [0, 0],
+        [100, 100],
+        xtol=1e-6,
+    )
+    assert result.converged.all()
+    assert np.allclose(result.root, [3, 7])
+
+
+def test_bracketed_root_reports_unconverged():
+    """Test that hitting maxiter is reported per element"""
+    result = bracketed_root(lambda x, index: x - 0.5, [0], [1e6], xtol=1e-12, maxiter=1)
+    assert not result.converged[0]
+    assert result.iterations[0] == 1
+
+
+def test_bracketed_root_invalid_bracket():
+    """Test that brackets without a sign change are rejected"""
+    with pytest.raises(ValueError):
+        bracketed_root(lambda x, index: x + 1, [0], [1])
+
+
+@pytest.mark.parametrize("x0", [0.5, 3.0, -2.0, 100.0])
+def test_secant_matches_scipy_newton(x0):
+    """Test that secant reproduces scipy's derivative-free newton exactly"""
+    optimize = pytest.importorskip("scipy.optimize")
+
+    def func(x):
+        return x**3 - 2 * x - 5
+
+    assert secant(func, x0) == optimize.newton(func, x0)
+
+
+def test_secant_raises_on_flat_steps():
+    """Test that coinciding function values on a step raise like scipy"""
+    with pytest.raises(RuntimeError, match="Tolerance"):
+        secant(lambda x: float(np.floor(x)) - 10.5, 100.0)
+
+
+def test_secant_raises_after_maxiter():
+    """Test that non-convergence raises RuntimeError"""
+    with pytest.raises(RuntimeError, match="Failed to converge"):
+        secant(lambda x: x**2 + 1, 1.0, maxiter=5)
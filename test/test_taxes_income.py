@@ -97,3 +97,59 @@ def test_calc_income_tax_by_integration_with_default_none_config():
     result = taxes_income.calc_income_tax_by_integration(50000)
     assert isinstance(result, float)
     assert result >= 0
+
+
+@pytest.mark.parametrize("is_married", [False, True])
+@pytest.mark.parametrize("year", [2018, 2021, 2022, 2025])
+def test_sameness_of_analytic_and_integration(year, is_married):
+    """Test that the closed-form integral matches integration split at the steps"""
+    integrate = pytest.importorskip("scipy.integrate")
+    config = TaxConfig(year=year, is_married=is_married)
+    curve = taxes_income.get_tax_curve(year, is_married)
+    for taxable_income in range(0, 600_001, 997):
+        points = [step for step in curve.steps if 0 < step < taxable_income]
+        result_integration = integrate.quad(
+            curve.marginal_rate, 0, taxable_income, points=points or None
+        )[0]
+        result_analytic = taxes_income.calc_income_tax_analytic(taxable_income, config)
+        assert abs(result_analytic - result_integration) < 0.01, taxable_income
+
+
+@pytest.mark.parametrize("year", range(2018, 2027))
+def test_calc_income_tax_analytic_is_continuous_at_steps(year):
+    """Test that the closed-form integral has no jumps at bracket steps"""
+    config = TaxConfig(year=year)
+    for bracket in taxes_income.TAX_CURVE_DATA[year].values():
+        step = bracket["step"]
+        below = taxes_income.calc_income_tax_analytic(step - 1e-6, config)
+        above = taxes_income.calc_income_tax_analytic(step + 1e-6, config)
+        assert abs(above - below) < 1e-5
+
+
+def test_calc_income_tax_analytic_with_default_none_config():
+    """Test that calc_income_tax_analytic works when config=None"""
+    result = taxes_income.calc_income_tax_analytic(50000)
+    assert isinstance(result, float)
+    assert result >= 0
+
+
+def test_get_tax_curve_is_cached():
+    """Test that compiled tax curves are built once per year and status"""
+    curve = taxes_income.get_tax_curve(2022, True)
+    assert taxes_income.get_tax_curve(2022, True) is curve
+    assert taxes_income.get_tax_curve(2022, False) is not curve
+
+
+def test_get_tax_curve_married_doubles_steps():
+    """Test that married curves have doubled steps and unchanged rates"""
+    single = taxes_income.get_tax_curve(2022)
+    married = taxes_income.get_tax_curve(2022, is_married=True)
+    assert married.steps == tuple(step * 2 for step in single.steps)
+    assert married.rates == single.rates
+
+
+def test_get_tax_curve_is_immutable():
+    """Test that compiled tax curves cannot be modified"""
+    curve = taxes_income.get_tax_curve(2022)
+    with pytest.raises(AttributeError):
+        curve.rates = (0, 0, 0, 0)
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from netto.config import TaxConfig
+from netto.data_loader import (
+    correction_factor_pensions,
+    social_security_curve,
+    soli_curve,
+    tax_curve,
+)
+from netto.taxes_income import calc_income_tax_analytic, get_tax_curve
+from netto.year_arrays import (
+    FIRST_YEAR,
+    calc_income_tax_by_year,
+    get_year_arrays,
+)
+
+
+@pytest.fixture
+def arrays():
+    return get_year_arrays()
+
+
+@pytest.mark.parametrize("year", range(2018, 2027))
+def test_year_arrays_match_data(arrays, year):
+    """Test that every array row holds the values of its year"""
+    row = year - FIRST_YEAR
+    assert arrays.years[row] == year
+    for bracket in range(4):
+        assert arrays.tax_steps[row, bracket] == tax_curve[year][bracket]["step"]
+        assert arrays.tax_rates[row, bracket] == tax_curve[year][bracket]["rate"]
+        const = tax_curve[year][bracket]["const"] or []
+        assert arrays.tax_consts[row, bracket, : len(const)].tolist() == const
+        assert np.isnan(arrays.tax_consts[row, bracket, len(const) :]).all()
+    for married in (False, True):
+        curve = get_tax_curve(year, married)
+        assert arrays.curve_steps[int(married), row].tolist() == list(curve.steps)
+        assert arrays.curve_offsets[int(married), row].tolist() == list(curve.offsets)
+    social_security = social_security_curve[year]
+    assert arrays.pension_limit[row] == social_security["pension"]["limit"]
+    assert arrays.health_rate[row] == social_security["health"]["rate"]
+    assert arrays.nursing_extra[row] == social_security["nursing"]["extra"]
+    assert arrays.soli_start[row] == soli_curve[year]["start_taxable_income"]
+    assert arrays.pension_factor[row] == correction_factor_pensions[year]
+
+
+def test_year_arrays_are_read_only(arrays):
+    """Test that the shared arrays cannot be modified"""
+    with pytest.raises(ValueError):
+        arrays.pension_limit[0] = 0
+
+
+def test_index(arrays):
+    """Test conversion of years to row indices"""
+    assert arrays.index([2018, 2026]).tolist() == [0, 8]
+    with pytest.raises(ValueError):
+        arrays.index([2017])
+    with pytest.raises(ValueError):
+        arrays.index(2027)
+
+
+def test_calc_income_tax_by_year_matches_analytic():
+    """Test row-wise gathering against the per-config closed form"""
+    rng = np.random.default_rng(0)
+    taxable_income = rng.uniform(0, 400000, 2000).round()
+    years = rng.integers(2018, 2027, 2000)
+    married = rng.random(2000) < 0.5
+    result = calc_income_tax_by_year(taxable_income, years, married)
+    expected = [
+        calc_income_tax_analytic(income, TaxConfig(year=year, is_married=is_married))
+        for income, year, is_married in zip(
+            taxable_income.tolist(), years.tolist(), married.tolist(), strict=True
+        )
+    ]
+    assert result.tolist() == expected
+
+
+def test_calc_income_tax_by_year_broadcasts():
+    """Test that scalar year and marital status apply to all rows"""
+    result = calc_income_tax_by_year([0, 20000, 80000], 2024, True)
+    config = TaxConfig(year=2024, is_married=True)
+    assert result.tolist() == [
+        calc_income_tax_analytic(income, config) for income in (0, 20000, 80000)
+    ]